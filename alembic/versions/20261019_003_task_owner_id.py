@@ -0,0 +1,55 @@
+"""Denormalize the task list owner onto tasks
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tasks updated per statement, so the backfill never holds long row locks
+BACKFILL_CHUNK = 5000
+
+
+def _backfill_owner_ids(connection) -> None:
+    bounds = connection.execute(sa.text('SELECT MIN(id), MAX(id) FROM tasks')).one()
+    if bounds[0] is None:
+        return
+    backfill = sa.text(
+        'UPDATE tasks SET owner_id = '
+        '(SELECT task_lists.owner_id FROM task_lists '
+        'WHERE task_lists.id = tasks.task_list_id) '
+        'WHERE id BETWEEN :start AND :end AND owner_id IS NULL'
+    )
+    for start in range(bounds[0], bounds[1] + 1, BACKFILL_CHUNK):
+        connection.execute(backfill, {'start': start, 'end': start + BACKFILL_CHUNK - 1})
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('owner_id', sa.Integer(), nullable=True))
+    # Each chunk commits on its own instead of one transaction over all tasks
+    with op.get_context().autocommit_block():
+        _backfill_owner_ids(op.get_bind())
+    op.alter_column('tasks', 'owner_id', existing_type=sa.Integer(), nullable=False)
+    op.create_foreign_key('fk_tasks_owner_id_users', 'tasks', 'users', ['owner_id'], ['id'])
+    op.create_index('ix_tasks_owner_status_due', 'tasks', ['owner_id', 'status', 'due_date'], unique=False)
+    op.create_index('ix_tasks_owner_list', 'tasks', ['owner_id', 'task_list_id'], unique=False)
+    op.create_index('ix_tasks_owner_created', 'tasks', ['owner_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_owner_created', table_name='tasks')
+    op.drop_index('ix_tasks_owner_list', table_name='tasks')
+    op.drop_index('ix_tasks_owner_status_due', table_name='tasks')
+    op.drop_constraint('fk_tasks_owner_id_users', 'tasks', type_='foreignkey')
+    op.drop_column('tasks', 'owner_id')
@@ -0,0 +1,42 @@
+"""Add the priority rank column and one index per task listing sort
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRIORITY_RANK_SQL = (
+    "CASE priority WHEN 'LOW' THEN 1 WHEN 'MEDIUM' THEN 2 "
+    "WHEN 'HIGH' THEN 3 WHEN 'CRITICAL' THEN 4 END"
+)
+
+
+def upgrade() -> None:
+    # Sort columns are NOT NULL so ORDER BY needs no IS NULL term and the
+    # indexes below serve it without a filesort
+    op.add_column('tasks', sa.Column('priority_rank', sa.SmallInteger(), sa.Computed(PRIORITY_RANK_SQL, persisted=True), nullable=False))
+    op.execute("UPDATE tasks SET updated_at = created_at WHERE updated_at IS NULL")
+    op.alter_column('tasks', 'updated_at', existing_type=sa.DateTime(), nullable=False)
+    op.create_index('ix_tasks_owner_updated', 'tasks', ['owner_id', 'updated_at', 'id'], unique=False)
+    op.create_index('ix_tasks_owner_due', 'tasks', ['owner_id', 'due_date', 'id'], unique=False)
+    op.create_index('ix_tasks_owner_priority_rank', 'tasks', ['owner_id', 'priority_rank', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_owner_priority_rank', table_name='tasks')
+    op.drop_index('ix_tasks_owner_due', table_name='tasks')
+    op.drop_index('ix_tasks_owner_updated', table_name='tasks')
+    op.alter_column('tasks', 'updated_at', existing_type=sa.DateTime(), nullable=True)
+    op.drop_column('tasks', 'priority_rank')
@@ -0,0 +1,49 @@
+"""Add the append-only task event log and its daily rollups
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('task_events',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('task_list_id', sa.Integer(), nullable=True),
+        sa.Column('owner_id', sa.Integer(), nullable=False),
+        sa.Column('event_type', sa.String(length=32), nullable=False),
+        sa.Column('from_value', sa.String(length=64), nullable=True),
+        sa.Column('to_value', sa.String(length=64), nullable=True),
+        sa.Column('occurred_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_task_events_task', 'task_events', ['task_id', 'occurred_at', 'id'], unique=False)
+    op.create_index('ix_task_events_owner', 'task_events', ['owner_id', 'occurred_at', 'id'], unique=False)
+    op.create_table('task_event_rollups',
+        sa.Column('owner_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('event_type', sa.String(length=32), nullable=False),
+        sa.Column('to_value', sa.String(length=64), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('owner_id', 'day', 'event_type', 'to_value')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('task_event_rollups')
+    op.drop_index('ix_task_events_owner', table_name='task_events')
+    op.drop_index('ix_task_events_task', table_name='task_events')
+    op.drop_table('task_events')
@@ -0,0 +1,93 @@
+"""
+Compare MessagePack and JSON for lists of TaskResponseDTO.
+
+Times encoding and decoding of the same payload with the stdlib-compatible
+FastAPI JSON path, orjson and msgpack, and reports the payload size.
+
+    python -m benchmarks.msgpack_vs_json --tasks 20000 --rounds 10
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from src.application.dto import TaskResponseDTO
+from src.domain.entities import TaskPriority, TaskStatus
+from src.presentation.negotiation import _plain, packb, unpackb
+
+
+def build_tasks(task_count: int):
+    now = datetime.utcnow()
+    statuses = list(TaskStatus)
+    priorities = list(TaskPriority)
+    return [
+        TaskResponseDTO(
+            id=index,
+            title=f"Task {index}",
+            description="Lorem ipsum dolor sit amet " * 4,
+            status=statuses[index % len(statuses)],
+            priority=priorities[index % len(priorities)],
+            task_list_id=index % 50,
+            assigned_to=index % 7 or None,
+            created_at=now,
+            updated_at=now,
+            due_date=now + timedelta(days=index % 30 - 15),
+            is_overdue=index % 3 == 0,
+            assignee_name="Assignee" if index % 7 else None,
+        )
+        for index in range(task_count)
+    ]
+
+
+def _time(function, rounds: int) -> float:
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+
+def run(items, rounds: int) -> dict:
+    encoders = {
+        "json (jsonable_encoder)": (
+            lambda: json.dumps(jsonable_encoder(items)).encode(),
+            json.loads,
+        ),
+        "orjson": (lambda: orjson.dumps(_plain(items)), orjson.loads),
+        "msgpack": (lambda: packb(_plain(items)), unpackb),
+    }
+    results = {}
+    for label, (encode, decode) in encoders.items():
+        payload = encode()
+        results[label] = {
+            "encode_ms": _time(encode, rounds),
+            "decode_ms": _time(lambda: decode(payload), rounds),
+            "bytes": len(payload),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    items = build_tasks(args.tasks)
+    print(f"{args.tasks} TaskResponseDTO, median of {args.rounds} rounds")
+    for label, result in run(items, args.rounds).items():
+        print(
+            f"{label:>24}: encode {result['encode_ms']:8.1f} ms  "
+            f"decode {result['decode_ms']:8.1f} ms  "
+            f"{result['bytes'] / 1_000_000:6.2f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
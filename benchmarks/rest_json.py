@@ -0,0 +1,117 @@
+"""
+Benchmark GET /api/tasks with and without the fast JSON path.
+
+Seeds an in-memory SQLite database, then times the same request through
+the DTO + response_model path and through FAST_JSON_RESPONSES.
+
+    python -m benchmarks.rest_json --tasks 5000 --requests 30
+"""
+
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.application.auth_service import get_current_user
+from src.domain.entities import TaskPriority, TaskStatus
+from src.infrastructure.database import Base, TaskListModel, TaskModel, UserModel
+from src.presentation.routers import tasks
+
+
+def build_client(task_count: int) -> TestClient:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    db = Session()
+    owner = UserModel(email="bench@example.com", full_name="Bench", hashed_password="x")
+    db.add(owner)
+    db.flush()
+    task_list = TaskListModel(name="Bench", owner_id=owner.id)
+    db.add(task_list)
+    db.flush()
+    now = datetime.utcnow()
+    statuses = list(TaskStatus)
+    priorities = list(TaskPriority)
+    db.add_all(
+        TaskModel(
+            title=f"Task {index}",
+            description="Lorem ipsum dolor sit amet " * 8,
+            status=statuses[index % len(statuses)],
+            priority=priorities[index % len(priorities)],
+            task_list_id=task_list.id,
+            assigned_to=owner.id if index % 2 else None,
+            due_date=now + timedelta(days=index % 30 - 15),
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(task_count)
+    )
+    db.commit()
+    owner_id = owner.id
+    db.close()
+
+    def get_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app = FastAPI()
+    app.include_router(tasks.router)
+    app.dependency_overrides[tasks.get_db] = get_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=owner_id)
+    return TestClient(app)
+
+
+def run(client: TestClient, fast: bool, requests: int) -> dict:
+    tasks.FAST_JSON_RESPONSES = fast
+    client.get("/api/tasks/")  # warm up
+    durations = []
+    total_bytes = 0
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get("/api/tasks/")
+        durations.append(time.perf_counter() - start)
+        total_bytes += len(response.content)
+    durations.sort()
+    p99_index = min(len(durations) - 1, int(len(durations) * 0.99))
+    return {
+        "p50_ms": statistics.median(durations) * 1000,
+        "p99_ms": durations[p99_index] * 1000,
+        "mb_per_s": total_bytes / sum(durations) / 1_000_000,
+        "bytes": total_bytes // requests,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=30)
+    args = parser.parse_args()
+
+    client = build_client(args.tasks)
+    print(f"GET /api/tasks with {args.tasks} tasks, {args.requests} requests each")
+    for label, fast in (("dto + response_model", False), ("fast json", True)):
+        result = run(client, fast, args.requests)
+        print(
+            f"{label:>22}: p50 {result['p50_ms']:8.1f} ms  "
+            f"p99 {result['p99_ms']:8.1f} ms  "
+            f"{result['mb_per_s']:6.2f} MB/s  ({result['bytes']} bytes)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+from contextvars import ContextVar
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
@@ -9,10 +12,15 @@ from src.infrastructure.auth import (
     verify_password,
 )
 from src.infrastructure.database import SessionLocal, UserModel
+from src.infrastructure.entity_cache import load_user
 
 # Bearer token scheme
 security = HTTPBearer()
 
+# Set while POST /api/batch runs its sub-requests, which carry the same
+# token: they reuse the user it already authenticated
+batch_user: ContextVar[Optional[UserModel]] = ContextVar("batch_user", default=None)
+
 
 # Registro de usuario
 def register_user(db: Session, user_in):
@@ -56,6 +64,10 @@ def login_for_access_token(db: Session, email: str, password: str):
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     from src.infrastructure.auth import decode_access_token
 
+    user = batch_user.get()
+    if user is not None:
+        return user
+
     # Create database session
     db = SessionLocal()
     try:
@@ -75,7 +87,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         if user_id is None:
             raise credentials_exception
 
-        user = db.query(UserModel).filter(UserModel.id == int(user_id)).first()
+        user = load_user(db, int(user_id))
         if user is None:
             raise credentials_exception
 
@@ -0,0 +1,236 @@
+"""Change feed for delta sync of an owner's task lists and tasks."""
+
+import base64
+import json
+import os
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.orm import Session
+
+from src.domain.entities import TaskStatus
+from src.domain.exceptions import ValidationError
+from src.infrastructure.database import (
+    DeletedRecordModel,
+    TaskListModel,
+    TaskModel,
+    UserModel,
+)
+from src.infrastructure.tombstones import TASK, TASK_LIST, tombstone_horizon
+
+CHANGE_FEED_SETTLE_SECONDS = float(os.getenv("CHANGE_FEED_SETTLE_SECONDS", "2"))
+CHANGE_FEED_PAGE_SIZE = int(os.getenv("CHANGE_FEED_PAGE_SIZE", "500"))
+
+# Order of the streams among changes with the same timestamp
+TASK_LIST_KIND, TASK_KIND, DELETED_KIND = 0, 1, 2
+
+
+class FeedPosition(NamedTuple):
+    timestamp: datetime
+    kind: int
+    id: int
+
+
+class FeedCursor(NamedTuple):
+    position: FeedPosition
+    # Deletions older than this have reached the client or can't concern it
+    synced_at: datetime
+
+
+class ChangeFeedPage(NamedTuple):
+    tasks: List[Tuple[TaskModel, Optional[str]]]
+    # (task list, total tasks, completed tasks)
+    task_lists: List[Tuple[TaskListModel, int, int]]
+    deleted: List[DeletedRecordModel]
+    # None until the owner has a change; always pass back the latest one
+    cursor: Optional[str]
+    has_more: bool
+    # The cursor predates the tombstone retention: this is a full sync
+    resync: bool = False
+
+
+def encode_cursor(position: FeedPosition, synced_at: Optional[datetime] = None) -> str:
+    raw = json.dumps(
+        [
+            position.timestamp.isoformat(),
+            position.kind,
+            position.id,
+            (synced_at or position.timestamp).isoformat(),
+        ],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[FeedCursor]:
+    if not cursor:
+        return None
+    try:
+        timestamp, kind, id, *synced_at = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+        if kind not in (TASK_LIST_KIND, TASK_KIND, DELETED_KIND):
+            raise ValueError("unknown change kind")
+        if len(synced_at) > 1:
+            raise ValueError("unexpected cursor fields")
+        # Cursors issued before the sync time was recorded only know their position
+        position = FeedPosition(datetime.fromisoformat(timestamp), kind, int(id))
+        return FeedCursor(
+            position,
+            datetime.fromisoformat(synced_at[0]) if synced_at else position.timestamp,
+        )
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid cursor", "since")
+
+
+def clamp_feed_size(limit: Optional[int]) -> int:
+    if limit is None:
+        return CHANGE_FEED_PAGE_SIZE
+    if limit < 1:
+        raise ValidationError("limit must be a positive integer", "limit")
+    return min(limit, CHANGE_FEED_PAGE_SIZE)
+
+
+def _after(timestamp, id, kind: int, position: Optional[FeedPosition]):
+    """Rows of one stream positioned strictly after `position`"""
+    if position is None:
+        return timestamp.isnot(None)
+    if kind > position.kind:
+        return timestamp >= position.timestamp
+    if kind < position.kind:
+        return timestamp > position.timestamp
+    return or_(
+        timestamp > position.timestamp,
+        and_(timestamp == position.timestamp, id > position.id),
+    )
+
+
+def _stream(query, timestamp, id, kind, position, until, limit):
+    # limit + 1 rows per stream are enough to fill a merged page and tell
+    # whether another one follows
+    return (
+        query.filter(_after(timestamp, id, kind, position), timestamp <= until)
+        .order_by(timestamp, id)
+        .limit(limit + 1)
+        .all()
+    )
+
+
+def _task_list_stats(db: Session, task_lists: List[TaskListModel]) -> dict:
+    if not task_lists:
+        return {}
+    rows = (
+        db.query(
+            TaskModel.task_list_id,
+            func.count(TaskModel.id),
+            func.sum(case((TaskModel.status == TaskStatus.COMPLETED, 1), else_=0)),
+        )
+        .filter(TaskModel.task_list_id.in_([task_list.id for task_list in task_lists]))
+        .group_by(TaskModel.task_list_id)
+        .all()
+    )
+    return {
+        task_list_id: (total, completed or 0) for task_list_id, total, completed in rows
+    }
+
+
+def read_changes(
+    db: Session,
+    owner_id: int,
+    since: Optional[str] = None,
+    limit: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> ChangeFeedPage:
+    """The owner's changes after the `since` cursor, oldest first"""
+    cursor = decode_cursor(since)
+    limit = clamp_feed_size(limit)
+    now = now or datetime.utcnow()
+    # updated_at is set before commit, so a transaction still in flight could
+    # commit a timestamp behind a cursor already handed out; hold recent
+    # changes back until they settle
+    until = now - timedelta(seconds=CHANGE_FEED_SETTLE_SECONDS)
+    # Tombstones older than the retention are gone, so a client that last
+    # read the whole feed before then may have missed deletions
+    resync = cursor is not None and cursor.synced_at < tombstone_horizon(now)
+    position = None if cursor is None or resync else cursor.position
+
+    task_lists = _stream(
+        db.query(TaskListModel).filter(TaskListModel.owner_id == owner_id),
+        TaskListModel.updated_at,
+        TaskListModel.id,
+        TASK_LIST_KIND,
+        position,
+        until,
+        limit,
+    )
+    tasks = _stream(
+        db.query(TaskModel, UserModel.full_name)
+        .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
+        .filter(TaskModel.owner_id == owner_id),
+        TaskModel.updated_at,
+        TaskModel.id,
+        TASK_KIND,
+        position,
+        until,
+        limit,
+    )
+    deleted = _stream(
+        db.query(DeletedRecordModel).filter(DeletedRecordModel.owner_id == owner_id),
+        DeletedRecordModel.deleted_at,
+        DeletedRecordModel.id,
+        DELETED_KIND,
+        position,
+        until,
+        limit,
+    )
+
+    changes = sorted(
+        [
+            (FeedPosition(row.updated_at, TASK_LIST_KIND, row.id), row)
+            for row in task_lists
+        ]
+        + [
+            (FeedPosition(row[0].updated_at, TASK_KIND, row[0].id), row)
+            for row in tasks
+        ]
+        + [
+            (FeedPosition(row.deleted_at, DELETED_KIND, row.id), row) for row in deleted
+        ],
+        key=lambda change: change[0],
+    )
+    page = changes[:limit]
+    has_more = len(changes) > limit
+    if page:
+        position = page[-1][0]
+    # Every deletion up to `until` has been returned once the feed is drained;
+    # until then the pages keep the time their sync started from
+    if has_more and cursor is not None and not resync:
+        synced_at = cursor.synced_at
+    else:
+        synced_at = until
+    kinds = {TASK_LIST_KIND: [], TASK_KIND: [], DELETED_KIND: []}
+    for change_position, row in page:
+        kinds[change_position.kind].append(row)
+
+    # An entity that came back (moved or transferred back) is current; its
+    # older tombstone in the same page is dropped
+    present = {(TASK_LIST, task_list.id) for task_list in kinds[TASK_LIST_KIND]}
+    present.update((TASK, task.id) for task, _ in kinds[TASK_KIND])
+    stats = _task_list_stats(db, kinds[TASK_LIST_KIND])
+
+    return ChangeFeedPage(
+        tasks=[(task, assignee_name) for task, assignee_name in kinds[TASK_KIND]],
+        task_lists=[
+            (task_list, *stats.get(task_list.id, (0, 0)))
+            for task_list in kinds[TASK_LIST_KIND]
+        ],
+        deleted=[
+            record
+            for record in kinds[DELETED_KIND]
+            if (record.entity, record.entity_id) not in present
+        ],
+        cursor=encode_cursor(position, synced_at) if position else None,
+        has_more=has_more,
+        resync=resync,
+    )
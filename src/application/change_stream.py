@@ -0,0 +1,110 @@
+"""Per-owner broadcast of change events for Server-Sent Events clients."""
+
+import os
+import threading
+import uuid
+from collections import deque
+from typing import List, NamedTuple, Optional
+
+import orjson
+
+from src.application.events import ChangeEvent, add_change_listener, owner_channel
+from src.infrastructure.pubsub import PubSub, Subscription
+
+SSE_MAX_CONNECTIONS = int(os.getenv("SSE_MAX_CONNECTIONS", "20000"))
+SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", "50"))
+SSE_REPLAY_BUFFER = int(os.getenv("SSE_REPLAY_BUFFER", "1000"))
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+
+class StreamEvent(NamedTuple):
+    id: str
+    seq: int
+    owner_id: int
+    name: str
+    data: bytes
+
+
+def format_event(event: StreamEvent) -> bytes:
+    return b"id: %s\nevent: %s\ndata: %s\n\n" % (
+        event.id.encode(),
+        event.name.encode(),
+        event.data,
+    )
+
+
+RESET_FRAME = b'event: reset\ndata: {"resync":"/api/changes"}\n\n'
+HEARTBEAT_FRAME = b": ping\n\n"
+
+
+class ChangeStream:
+    def __init__(
+        self,
+        max_connections: int = SSE_MAX_CONNECTIONS,
+        queue_size: int = SSE_QUEUE_SIZE,
+        buffer_size: int = SSE_REPLAY_BUFFER,
+    ):
+        self.epoch = uuid.uuid4().hex[:12]
+        self.broker = PubSub(max_subscribers=max_connections, max_queue_size=queue_size)
+        self._recent: deque = deque(maxlen=buffer_size)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    @property
+    def connection_count(self) -> int:
+        return self.broker.subscriber_count
+
+    def publish(self, change: ChangeEvent) -> StreamEvent:
+        data = orjson.dumps(
+            {
+                "entity": change.entity,
+                "action": change.action,
+                "id": change.entity_id,
+                "task_list_id": change.task_list_id,
+                "data": change.data,
+            }
+        )
+        with self._lock:
+            self._seq += 1
+            event = StreamEvent(
+                id=f"{self.epoch}-{self._seq}",
+                seq=self._seq,
+                owner_id=change.owner_id,
+                name=f"{change.entity.value}.{change.action.value}",
+                data=data,
+            )
+            self._recent.append(event)
+        self.broker.publish(owner_channel(change.owner_id), event)
+        return event
+
+    def subscribe(self, owner_id: int) -> Subscription:
+        """Raises SubscriberLimitError when the worker is at its cap"""
+        return self.broker.subscribe(owner_channel(owner_id))
+
+    def replay(self, owner_id: int, last_event_id: str) -> Optional[List[StreamEvent]]:
+        """The owner's events after `last_event_id`, or None if some are lost"""
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        seq = int(seq)
+        with self._lock:
+            recent = list(self._recent)
+            latest = self._seq
+        if seq > latest:
+            return None
+        # Events are contiguous, so the one right after `seq` must be buffered
+        if seq < latest and (not recent or recent[0].seq > seq + 1):
+            return None
+        return [
+            event for event in recent if event.seq > seq and event.owner_id == owner_id
+        ]
+
+
+change_stream = ChangeStream()
+
+
+def broadcast_change(change: ChangeEvent) -> None:
+    change_stream.publish(change)
+
+
+add_change_listener(broadcast_change)
@@ -0,0 +1,17 @@
+"""Per-owner change versions used to validate cached REST collections."""
+
+import os
+import time
+from typing import Tuple
+
+from sqlalchemy.orm import Session
+
+from src.infrastructure.versioning import owner_scope, read_versions
+
+# Seconds a cached collection may keep showing an outdated is_overdue flag
+OVERDUE_WINDOW = int(os.getenv("REST_OVERDUE_WINDOW", "60"))
+
+
+def owner_change_version(db: Session, owner_id: int) -> Tuple[int, int]:
+    scope = owner_scope(owner_id)
+    return read_versions(db, [scope])[scope], int(time.time() // OVERDUE_WINDOW)
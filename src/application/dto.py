@@ -1,9 +1,9 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, List, Literal, Optional
 
 from pydantic import BaseModel, EmailStr, Field
 
-from src.domain.entities import TaskPriority, TaskStatus
+from src.domain.entities import TaskEventType, TaskPriority, TaskStatus
 
 
 class UserCreateDTO(BaseModel):
@@ -108,3 +108,57 @@ class CompletionStatsDTO(BaseModel):
     in_progress_tasks: int
     cancelled_tasks: int
     completion_percentage: float
+
+
+class TaskEventDTO(BaseModel):
+    id: int
+    task_id: int
+    task_list_id: Optional[int] = None
+    event_type: TaskEventType
+    from_value: Optional[str] = None
+    to_value: Optional[str] = None
+    occurred_at: datetime
+
+
+class TaskEventPageDTO(BaseModel):
+    events: List[TaskEventDTO]
+    cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class DeletedRecordDTO(BaseModel):
+    entity: str
+    id: int
+    task_list_id: Optional[int] = None
+    deleted_at: datetime
+
+
+class ChangeFeedDTO(BaseModel):
+    task_lists: List[TaskListResponseDTO]
+    tasks: List[TaskResponseDTO]
+    deleted: List[DeletedRecordDTO]
+    cursor: Optional[str] = None
+    has_more: bool = False
+    resync: bool = False
+
+
+class BatchSubRequestDTO(BaseModel):
+    # Echoed back so clients can match responses
+    id: Optional[str] = None
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str = Field(..., pattern=r"^/api/")
+    body: Optional[Any] = None
+
+
+class BatchRequestDTO(BaseModel):
+    requests: List[BatchSubRequestDTO] = Field(..., min_length=1)
+
+
+class BatchSubResponseDTO(BaseModel):
+    id: Optional[str] = None
+    status: int
+    body: Any = None
+
+
+class BatchResponseDTO(BaseModel):
+    responses: List[BatchSubResponseDTO]
@@ -0,0 +1,137 @@
+"""Change events published by every task and task list mutation."""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+from src.infrastructure.database import TaskListModel, TaskModel
+from src.infrastructure.pubsub import pubsub
+
+
+class ChangeAction(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+class ChangeEntity(str, Enum):
+    TASK = "task"
+    TASK_LIST = "task_list"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    entity: ChangeEntity
+    action: ChangeAction
+    entity_id: int
+    task_list_id: int
+    owner_id: int
+    # Column snapshot taken after commit; None for deletions
+    data: Optional[Dict[str, Any]] = field(default=None, compare=False)
+
+
+ChangeListener = Callable[[ChangeEvent], None]
+
+_listeners: List[ChangeListener] = []
+
+
+def add_change_listener(listener: ChangeListener) -> None:
+    """Call `listener` synchronously for every published change"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_change_listener(listener: ChangeListener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def task_list_channel(task_list_id: int) -> str:
+    return f"task_list:{task_list_id}"
+
+
+def owner_channel(owner_id: int) -> str:
+    return f"owner:{owner_id}"
+
+
+def _task_snapshot(task: TaskModel, assignee_name: Optional[str]) -> Dict[str, Any]:
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status,
+        "priority": task.priority,
+        "task_list_id": task.task_list_id,
+        "assigned_to": task.assigned_to,
+        "assignee_name": assignee_name,
+        "due_date": task.due_date,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+    }
+
+
+def publish_change(event: ChangeEvent) -> None:
+    """Fan an event out to listeners and to list and owner subscribers"""
+    for listener in list(_listeners):
+        try:
+            listener(event)
+        except Exception as e:
+            print(f"⚠️ Change listener {listener!r} failed: {e}")
+    pubsub.publish(task_list_channel(event.task_list_id), event)
+    pubsub.publish(owner_channel(event.owner_id), event)
+
+
+def publish_task_change(
+    action: ChangeAction,
+    task: TaskModel,
+    owner_id: int,
+    assignee_name: Optional[str] = None,
+) -> None:
+    """Publish a task creation or update; call after the transaction commits"""
+    publish_change(
+        ChangeEvent(
+            entity=ChangeEntity.TASK,
+            action=action,
+            entity_id=task.id,
+            task_list_id=task.task_list_id,
+            owner_id=owner_id,
+            data=_task_snapshot(task, assignee_name),
+        )
+    )
+
+
+def publish_task_deleted(task_id: int, task_list_id: int, owner_id: int) -> None:
+    publish_change(
+        ChangeEvent(
+            entity=ChangeEntity.TASK,
+            action=ChangeAction.DELETED,
+            entity_id=task_id,
+            task_list_id=task_list_id,
+            owner_id=owner_id,
+        )
+    )
+
+
+def publish_task_list_change(action: ChangeAction, task_list: TaskListModel) -> None:
+    """Publish a task list creation or update; call after the transaction commits"""
+    publish_change(
+        ChangeEvent(
+            entity=ChangeEntity.TASK_LIST,
+            action=action,
+            entity_id=task_list.id,
+            task_list_id=task_list.id,
+            owner_id=task_list.owner_id,
+        )
+    )
+
+
+def publish_task_list_deleted(task_list_id: int, owner_id: int) -> None:
+    publish_change(
+        ChangeEvent(
+            entity=ChangeEntity.TASK_LIST,
+            action=ChangeAction.DELETED,
+            entity_id=task_list_id,
+            task_list_id=task_list_id,
+            owner_id=owner_id,
+        )
+    )
@@ -0,0 +1,35 @@
+"""Fetch several tasks or task lists by id in one round trip."""
+
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+from src.domain.exceptions import ValidationError
+
+MULTI_GET_MAX_IDS = int(os.getenv("MULTI_GET_MAX_IDS", "100"))
+
+T = TypeVar("T")
+
+
+def parse_ids(value: str) -> List[int]:
+    """Ids from a comma separated `ids=` value, in the order given"""
+    try:
+        return [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise ValidationError("ids must be comma separated integers", "ids")
+
+
+def unique_ids(ids: Sequence[int]) -> List[int]:
+    """Distinct ids to look up; raises ValidationError if none or too many"""
+    if not ids:
+        raise ValidationError("At least one id is required", "ids")
+    if len(ids) > MULTI_GET_MAX_IDS:
+        raise ValidationError(f"At most {MULTI_GET_MAX_IDS} ids per request", "ids")
+    return list(dict.fromkeys(ids))
+
+
+def in_request_order(
+    ids: Sequence[int], items: Iterable[T], key: Callable[[T], int]
+) -> List[Optional[T]]:
+    """One entry per requested id, None where nothing was found"""
+    found: Dict[int, T] = {key(item): item for item in items}
+    return [found.get(id) for id in ids]
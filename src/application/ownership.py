@@ -0,0 +1,147 @@
+"""In-memory map of task list ownership used by task mutations."""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.application.events import (
+    ChangeAction,
+    ChangeEntity,
+    ChangeEvent,
+    add_change_listener,
+)
+from src.infrastructure.database import TaskListModel, TaskModel
+from src.infrastructure.versioning import (
+    CHANGE_VERSIONS_ENABLED,
+    read_versions,
+    task_list_scope,
+)
+
+OWNERSHIP_CACHE_ENABLED = (
+    os.getenv("OWNERSHIP_CACHE_ENABLED", "false").lower() == "true"
+)
+OWNERSHIP_CACHE_TTL = float(os.getenv("OWNERSHIP_CACHE_TTL", "300"))
+
+
+class OwnershipCache:
+    def __init__(self, ttl: float = OWNERSHIP_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._owner_by_list: Dict[int, int] = {}
+        # owner_id -> (list ids, monotonic time they were loaded)
+        self._lists_by_owner: Dict[int, Tuple[Set[int], float]] = {}
+        # task_list_id -> (owner_id, change version it was confirmed at)
+        self._confirmed: Dict[int, Tuple[int, int]] = {}
+
+    def _fresh(self, owner_id: int) -> Optional[Set[int]]:
+        entry = self._lists_by_owner.get(owner_id)
+        if entry is None or time.monotonic() - entry[1] > self.ttl:
+            return None
+        return entry[0]
+
+    def _load(self, db: Session, owner_id: int) -> Set[int]:
+        rows = (
+            db.query(TaskListModel.id).filter(TaskListModel.owner_id == owner_id).all()
+        )
+        list_ids = {row[0] for row in rows}
+        with self._lock:
+            previous = self._lists_by_owner.get(owner_id, (set(), 0.0))[0]
+            for task_list_id in previous - list_ids:
+                if self._owner_by_list.get(task_list_id) == owner_id:
+                    del self._owner_by_list[task_list_id]
+            for task_list_id in list_ids:
+                self._owner_by_list[task_list_id] = owner_id
+            self._lists_by_owner[owner_id] = (list_ids, time.monotonic())
+        return list_ids
+
+    def list_ids(self, db: Session, owner_id: int) -> Set[int]:
+        """Ids of the lists `owner_id` owns"""
+        with self._lock:
+            list_ids = self._fresh(owner_id)
+        return set(list_ids) if list_ids is not None else self._load(db, owner_id)
+
+    def owns(self, db: Session, owner_id: int, task_list_id: int) -> bool:
+        scope = task_list_scope(task_list_id)
+        # Read first: a transfer or deletion committed after it bumps past it
+        version = read_versions(db, [scope])[scope]
+        with self._lock:
+            if self._confirmed.get(task_list_id) == (owner_id, version):
+                return True
+        # Unknown, changed, or created by another worker: ask the database
+        row = (
+            db.query(TaskListModel.owner_id)
+            .filter(TaskListModel.id == task_list_id)
+            .first()
+        )
+        if row is None or row[0] != owner_id:
+            return False
+        with self._lock:
+            self._confirmed[task_list_id] = (owner_id, version)
+        return True
+
+    def owner_of(self, task_list_id: int) -> Optional[int]:
+        with self._lock:
+            return self._owner_by_list.get(task_list_id)
+
+    def record(self, task_list_id: int, owner_id: int) -> None:
+        """Remember a list's owner (creation or transfer)"""
+        with self._lock:
+            self._discard(task_list_id)
+            self._owner_by_list[task_list_id] = owner_id
+            if owner_id in self._lists_by_owner:
+                self._lists_by_owner[owner_id][0].add(task_list_id)
+
+    def invalidate_list(self, task_list_id: int) -> None:
+        with self._lock:
+            self._discard(task_list_id)
+
+    def _discard(self, task_list_id: int) -> None:
+        self._confirmed.pop(task_list_id, None)
+        owner_id = self._owner_by_list.pop(task_list_id, None)
+        if owner_id in self._lists_by_owner:
+            self._lists_by_owner[owner_id][0].discard(task_list_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._owner_by_list.clear()
+            self._lists_by_owner.clear()
+            self._confirmed.clear()
+
+
+ownership_cache = OwnershipCache()
+
+
+def apply_change(event: ChangeEvent) -> None:
+    """Keep the cache in line with task list writes made in this process"""
+    if event.entity != ChangeEntity.TASK_LIST:
+        return
+    if event.action == ChangeAction.DELETED:
+        ownership_cache.invalidate_list(event.task_list_id)
+    else:
+        ownership_cache.record(event.task_list_id, event.owner_id)
+
+
+add_change_listener(apply_change)
+
+
+def owns_task_list(db: Session, owner_id: int, task_list_id: int) -> bool:
+    if OWNERSHIP_CACHE_ENABLED and CHANGE_VERSIONS_ENABLED:
+        return ownership_cache.owns(db, owner_id, task_list_id)
+    task_list = (
+        db.query(TaskListModel)
+        .filter(TaskListModel.id == task_list_id, TaskListModel.owner_id == owner_id)
+        .first()
+    )
+    return task_list is not None
+
+
+def find_owned_task(db: Session, task_id: int, owner_id: int) -> Optional[TaskModel]:
+    """The task if `owner_id` owns its list: a primary-key read, no join"""
+    return (
+        db.query(TaskModel)
+        .filter(TaskModel.id == task_id, TaskModel.owner_id == owner_id)
+        .first()
+    )
@@ -0,0 +1,110 @@
+"""Keyset (cursor) pagination helpers shared by REST and GraphQL listings."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, and_, or_
+
+from src.domain.exceptions import ValidationError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+class KeysetOrder:
+    """
+    Ordering over one or more columns; the last column must be unique (the id).
+
+    NULLs sort as the smallest values, as MySQL orders them natively: first
+    ascending, last descending. ORDER BY stays a plain column list, so an
+    (owner_id, column, id) index serves it in either direction.
+    """
+
+    def __init__(self, name: str, columns: Sequence, descending: bool = False):
+        self.name = name
+        self.columns = list(columns)
+        self.descending = descending
+
+    def _is_nullable(self, column) -> bool:
+        return bool(getattr(column.property.columns[0], "nullable", False))
+
+    def order_by(self) -> List:
+        return [column.desc() if self.descending else column for column in self.columns]
+
+    def values(self, row: Any) -> Tuple:
+        return tuple(getattr(row, column.key) for column in self.columns)
+
+    def _equal(self, column, value):
+        return column.is_(None) if value is None else column == value
+
+    def _greater(self, column, value):
+        if value is None:
+            # Every value follows NULL ascending; nothing does descending
+            return None if self.descending else column.isnot(None)
+        if not self.descending:
+            return column > value
+        if self._is_nullable(column):
+            return or_(column < value, column.is_(None))
+        return column < value
+
+    def after(self, values: Sequence):
+        """WHERE clause selecting the rows strictly after `values`"""
+        clauses = []
+        for index, (column, value) in enumerate(zip(self.columns, values)):
+            greater = self._greater(column, value)
+            if greater is None:
+                continue
+            prefix = [
+                self._equal(prefix_column, prefix_value)
+                for prefix_column, prefix_value in zip(
+                    self.columns[:index], values[:index]
+                )
+            ]
+            clauses.append(and_(*prefix, greater))
+        return or_(*clauses)
+
+    def encode_cursor(self, values: Sequence) -> str:
+        payload = [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in values
+        ]
+        raw = json.dumps({"k": self.name, "v": payload}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> Tuple:
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if data["k"] != self.name or len(data["v"]) != len(self.columns):
+                raise ValueError("cursor does not match ordering")
+            return tuple(
+                datetime.fromisoformat(value)
+                if value is not None
+                and isinstance(column.property.columns[0].type, DateTime)
+                else value
+                for column, value in zip(self.columns, data["v"])
+            )
+        except (ValueError, KeyError, TypeError):
+            raise ValidationError("Invalid cursor", "after")
+
+
+def clamp_page_size(first: Optional[int]) -> int:
+    if first is None:
+        return DEFAULT_PAGE_SIZE
+    if first < 1:
+        raise ValidationError("first must be a positive integer", "first")
+    return min(first, MAX_PAGE_SIZE)
+
+
+def paginate(query, order: KeysetOrder, first: Optional[int], after: Optional[str]):
+    """
+    Fetch one page from an ORM query.
+
+    Returns (rows, has_next_page); one extra row is read to detect the next page.
+    """
+    limit = clamp_page_size(first)
+    if after:
+        query = query.filter(order.after(order.decode_cursor(after)))
+    rows = query.order_by(*order.order_by()).limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
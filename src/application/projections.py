@@ -0,0 +1,63 @@
+from typing import Iterable, List, Optional, Sequence
+
+from sqlalchemy.orm import load_only
+
+from src.infrastructure.database import TaskModel
+
+# Columns each public task field needs; derived fields list their inputs
+TASK_FIELD_COLUMNS = {
+    "id": (TaskModel.id,),
+    "title": (TaskModel.title,),
+    "description": (TaskModel.description,),
+    "status": (TaskModel.status,),
+    "priority": (TaskModel.priority,),
+    "task_list_id": (TaskModel.task_list_id,),
+    "assigned_to": (TaskModel.assigned_to,),
+    "created_at": (TaskModel.created_at,),
+    "updated_at": (TaskModel.updated_at,),
+    "due_date": (TaskModel.due_date,),
+    "is_overdue": (TaskModel.due_date, TaskModel.status),
+    "assignee_name": (TaskModel.assigned_to,),
+}
+
+
+class TaskProjection:
+    """Subset of task fields a client asked for; None means every field"""
+
+    def __init__(
+        self, fields: Optional[Iterable[str]] = None, extra_columns: Sequence = ()
+    ):
+        if fields is None:
+            self.fields = None
+        else:
+            self.fields = {field for field in fields if field in TASK_FIELD_COLUMNS}
+        # Loaded but not exposed, e.g. the sort key a cursor is built from
+        self.extra_columns = list(extra_columns)
+
+    @property
+    def is_full(self) -> bool:
+        return self.fields is None
+
+    def includes(self, field: str) -> bool:
+        return self.fields is None or field in self.fields
+
+    @property
+    def needs_assignee_join(self) -> bool:
+        return self.includes("assignee_name")
+
+    def columns(self) -> List:
+        if self.fields is None:
+            return []
+        columns = {"id": TaskModel.id}
+        for field in self.fields:
+            for column in TASK_FIELD_COLUMNS[field]:
+                columns[column.key] = column
+        for column in self.extra_columns:
+            columns[column.key] = column
+        return [columns[key] for key in sorted(columns)]
+
+    def load_options(self) -> List:
+        """ORM options restricting the SELECT to the projected columns"""
+        if self.fields is None:
+            return []
+        return [load_only(*self.columns())]
@@ -0,0 +1,81 @@
+"""Plain dict mappings for REST responses on the fast JSON path."""
+
+from typing import Any, Dict, Optional
+
+from src.application.projections import TASK_FIELD_COLUMNS, TaskProjection
+from src.infrastructure.database import DeletedRecordModel, TaskListModel, TaskModel
+
+
+def _enum_value(value):
+    return getattr(value, "value", value)
+
+
+def task_to_dict(
+    task: TaskModel, assignee_name: Optional[str], is_overdue: bool
+) -> Dict[str, Any]:
+    """Same content as TaskResponseDTO"""
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "status": _enum_value(task.status),
+        "priority": _enum_value(task.priority),
+        "task_list_id": task.task_list_id,
+        "assigned_to": task.assigned_to,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+        "due_date": task.due_date,
+        "is_overdue": is_overdue,
+        "assignee_name": assignee_name,
+    }
+
+
+def task_projection_to_dict(
+    task: TaskModel,
+    projection: TaskProjection,
+    assignee_name: Optional[str],
+    is_overdue: bool,
+) -> Dict[str, Any]:
+    """
+    Only the projected fields (id is always present), in DTO order.
+
+    Columns outside the projection are never read, so deferred columns are
+    not lazy-loaded.
+    """
+    data: Dict[str, Any] = {}
+    for field in TASK_FIELD_COLUMNS:
+        if field != "id" and not projection.includes(field):
+            continue
+        if field == "assignee_name":
+            data[field] = assignee_name
+        elif field == "is_overdue":
+            data[field] = is_overdue
+        else:
+            data[field] = _enum_value(getattr(task, field))
+    return data
+
+
+def task_list_to_dict(
+    task_list: TaskListModel, completion_percentage: float, task_count: int
+) -> Dict[str, Any]:
+    """Same content as TaskListResponseDTO"""
+    return {
+        "id": task_list.id,
+        "name": task_list.name,
+        "description": task_list.description,
+        "owner_id": task_list.owner_id,
+        "created_at": task_list.created_at,
+        "updated_at": task_list.updated_at,
+        "completion_percentage": completion_percentage,
+        "task_count": task_count,
+    }
+
+
+def deleted_record_to_dict(record: DeletedRecordModel) -> Dict[str, Any]:
+    """Same content as DeletedRecordDTO"""
+    return {
+        "entity": record.entity,
+        "id": record.entity_id,
+        "task_list_id": record.task_list_id,
+        "deleted_at": record.deleted_at,
+    }
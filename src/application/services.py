@@ -12,8 +12,11 @@ from src.domain.exceptions import (
     UnauthorizedError,
 )
 from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.infrastructure.user_directory import lookup_user
 
 from .dto import CompletionStatsDTO, TaskCreateDTO, TaskFilterDTO, TaskListCreateDTO
+from .events import ChangeAction, publish_task_change
+from .ownership import owns_task_list
 
 
 class TaskListService:
@@ -109,11 +112,7 @@ class TaskService:
 
         # Verify assignee exists if provided
         if task_dto.assigned_to:
-            assignee = (
-                self.db.query(UserModel)
-                .filter(UserModel.id == task_dto.assigned_to)
-                .first()
-            )
+            assignee = lookup_user(self.db, task_dto.assigned_to)
             if not assignee:
                 raise EntityNotFoundError("User", str(task_dto.assigned_to))
             if not assignee.is_active:
@@ -124,6 +123,7 @@ class TaskService:
             description=task_dto.description,
             priority=task_dto.priority,
             task_list_id=task_dto.task_list_id,
+            owner_id=task_list.owner_id,
             assigned_to=task_dto.assigned_to,
             due_date=task_dto.due_date,
             created_at=datetime.utcnow(),
@@ -132,6 +132,7 @@ class TaskService:
         self.db.add(task)
         self.db.commit()
         self.db.refresh(task)
+        publish_task_change(ChangeAction.CREATED, task, task_list.owner_id)
         return task
 
     def update_task_status(
@@ -166,6 +167,7 @@ class TaskService:
 
         self.db.commit()
         self.db.refresh(task)
+        publish_task_change(ChangeAction.UPDATED, task, task_list.owner_id)
         return task
 
     def assign_task(self, task_id: int, assignee_id: int, user_id: int) -> TaskModel:
@@ -174,16 +176,11 @@ class TaskService:
             raise EntityNotFoundError("Task", str(task_id))
 
         # Check ownership
-        task_list = (
-            self.db.query(TaskListModel)
-            .filter(TaskListModel.id == task.task_list_id)
-            .first()
-        )
-        if task_list.owner_id != user_id:
+        if not owns_task_list(self.db, user_id, task.task_list_id):
             raise TaskListOwnershipError()
 
         # Verify assignee exists and is active
-        assignee = self.db.query(UserModel).filter(UserModel.id == assignee_id).first()
+        assignee = lookup_user(self.db, assignee_id)
         if not assignee:
             raise EntityNotFoundError("User", str(assignee_id))
         if not assignee.is_active:
@@ -198,6 +195,7 @@ class TaskService:
 
         self.db.commit()
         self.db.refresh(task)
+        publish_task_change(ChangeAction.UPDATED, task, user_id)
         return task
 
     def get_filtered_tasks(
@@ -205,12 +203,9 @@ class TaskService:
     ) -> List[TaskModel]:
         query = self.db.query(TaskModel)
 
-        # Join with task list for ownership check
-        query = query.join(TaskListModel)
-
         # Filter by user access (owns task list or is assigned to task)
         query = query.filter(
-            (TaskListModel.owner_id == user_id) | (TaskModel.assigned_to == user_id)
+            (TaskModel.owner_id == user_id) | (TaskModel.assigned_to == user_id)
         )
 
         # Apply filters
@@ -227,22 +222,16 @@ class TaskService:
             query = query.filter(TaskModel.assigned_to == filter_dto.assigned_to)
 
         if filter_dto.overdue_only:
-            query = query.filter(
-                TaskModel.due_date < datetime.utcnow(),
-                TaskModel.status != TaskStatus.COMPLETED,
-            )
+            query = query.filter(TaskModel.is_overdue)
 
         return query.all()
 
     def get_overdue_tasks(self, user_id: int) -> List[TaskModel]:
         return (
             self.db.query(TaskModel)
-            .join(TaskListModel)
             .filter(
-                (TaskListModel.owner_id == user_id)
-                | (TaskModel.assigned_to == user_id),
-                TaskModel.due_date < datetime.utcnow(),
-                TaskModel.status != TaskStatus.COMPLETED,
+                (TaskModel.owner_id == user_id) | (TaskModel.assigned_to == user_id),
+                TaskModel.is_overdue,
             )
             .all()
         )
@@ -0,0 +1,30 @@
+"""Server-side sort orders for task listings, shared by REST and GraphQL."""
+
+from typing import Dict, Tuple
+
+from src.application.pagination import KeysetOrder
+from src.infrastructure.database import TaskModel
+
+# Each sort is backed by an (owner_id, column, id) index on tasks
+TASK_SORT_COLUMNS = {
+    "created_at": TaskModel.created_at,
+    "updated_at": TaskModel.updated_at,
+    "due_date": TaskModel.due_date,
+    # Severity (low < medium < high < critical), not the enum name
+    "priority": TaskModel.priority_rank,
+}
+
+_ORDERS: Dict[Tuple[str, bool], KeysetOrder] = {
+    (sort, descending): KeysetOrder(
+        f"{sort}_desc" if descending else sort,
+        (column, TaskModel.id),
+        descending=descending,
+    )
+    for sort, column in TASK_SORT_COLUMNS.items()
+    for descending in (False, True)
+}
+
+
+def task_order(sort: str, descending: bool = False) -> KeysetOrder:
+    """Keyset ordering for `sort`; the id breaks ties so cursors are stable"""
+    return _ORDERS[(sort, descending)]
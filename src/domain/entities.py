@@ -13,6 +13,19 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Statuses a task can still be overdue in (every status but completed)
+OPEN_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED)
+
+
+def task_is_overdue(
+    due_date: Optional[datetime], status: TaskStatus, now: Optional[datetime] = None
+) -> bool:
+    """Past its due date and not completed; tasks without a due date never are"""
+    if not due_date or status == TaskStatus.COMPLETED:
+        return False
+    return (now or datetime.utcnow()) > due_date
+
+
 class TaskPriority(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -20,6 +33,14 @@ class TaskPriority(str, Enum):
     CRITICAL = "critical"
 
 
+class TaskEventType(str, Enum):
+    CREATED = "created"
+    STATUS_CHANGED = "status_changed"
+    ASSIGNED = "assigned"
+    MOVED = "moved"
+    DELETED = "deleted"
+
+
 class User(BaseModel):
     id: Optional[int] = None
     email: str = Field(..., description="User email address")
@@ -73,9 +94,7 @@ class Task(BaseModel):
     assignee: Optional[User] = None
 
     def is_overdue(self) -> bool:
-        if not self.due_date:
-            return False
-        return datetime.utcnow() > self.due_date and self.status != TaskStatus.COMPLETED
+        return task_is_overdue(self.due_date, self.status)
 
     def can_be_assigned_to(self, user_id: int) -> bool:
         return user_id > 0
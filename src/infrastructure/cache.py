@@ -0,0 +1,218 @@
+"""Two-tier cache (in-process LRU plus optional Redis) with tag invalidation."""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.infrastructure.versioning import DatabaseVersionStore
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - the shared tier is optional
+    redis = None
+
+
+class LRUCache:
+    """Thread-safe LRU with a per-entry time to live"""
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Entries dropped to stay within max_entries (expiry is not counted)
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache:
+    """
+    Shared tier on any server speaking the Redis protocol.
+
+    Values are stored as JSON. Connection problems are treated as misses so
+    the shared tier can never take requests down.
+    """
+
+    def __init__(self, client, prefix: str = "task_challenge:", ttl: float = 60.0):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCache":
+        if redis is None:
+            raise RuntimeError("The redis package is required for CACHE_REDIS_URL")
+        return cls(redis.Redis.from_url(url, socket_timeout=0.25), **kwargs)
+
+    def _errors(self):
+        return (redis.RedisError, OSError) if redis is not None else (OSError,)
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self.client.get(self.prefix + key)
+        except self._errors():
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        try:
+            self.client.set(
+                self.prefix + key,
+                json.dumps(value, default=str),
+                px=int((self.ttl if ttl is None else ttl) * 1000),
+            )
+        except self._errors():
+            pass
+
+    def get_counters(self, names: Iterable[str]) -> Optional[Dict[str, int]]:
+        names = list(names)
+        if not names:
+            return {}
+        try:
+            values = self.client.mget([self.prefix + name for name in names])
+        except self._errors():
+            return None
+        return {name: int(value or 0) for name, value in zip(names, values)}
+
+    def incr(self, names: Iterable[str]) -> bool:
+        try:
+            pipeline = self.client.pipeline()
+            for name in names:
+                pipeline.incr(self.prefix + name)
+            pipeline.execute()
+            return True
+        except self._errors():
+            return False
+
+
+class TaggedCache:
+    """
+    Cache whose entries are invalidated by bumping tag versions.
+
+    An entry remembers the version of each of its tags when it was computed;
+    bumping any of those tags makes it stale. With a shared tier the versions
+    live there too, so a write in one worker invalidates every worker. A
+    `versions` source (e.g. the change_versions table, bumped by the writing
+    transaction itself) takes precedence over both.
+    """
+
+    def __init__(
+        self,
+        local: LRUCache,
+        shared: Optional[RedisCache] = None,
+        versions=None,
+    ):
+        self.local = local
+        self.shared = shared
+        self.versions = versions
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def shares_versions(self) -> bool:
+        """Whether every worker sees the same tag versions"""
+        return self.versions is not None or self.shared is not None
+
+    def tag_versions(self, tags: Iterable[str]) -> Optional[Dict[str, int]]:
+        """Current versions of `tags`; None when they can't be read"""
+        tags = sorted(set(tags))
+        if self.versions is not None:
+            return self.versions.read(tags)
+        if self.shared is not None:
+            counters = self.shared.get_counters(f"tag:{tag}" for tag in tags)
+            if counters is None:
+                return None
+            return {tag: counters[f"tag:{tag}"] for tag in tags}
+        with self._lock:
+            return {tag: self._versions.get(tag, 0) for tag in tags}
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.local.get(key)
+        if entry is None and self.shared is not None:
+            entry = self.shared.get(key)
+            if entry is not None:
+                self.local.set(key, entry)
+        if entry is None:
+            return None
+        if self.tag_versions(entry["tags"]) != entry["tags"]:
+            self.local.delete(key)
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: Any, versions: Dict[str, int]) -> None:
+        """Store `value` with the tag versions read before it was computed"""
+        entry = {"value": value, "tags": versions}
+        self.local.set(key, entry)
+        if self.shared is not None:
+            self.shared.set(key, entry)
+
+    def invalidate(self, *tags: str) -> None:
+        if self.versions is not None:
+            # Already bumped by the transaction that made the change
+            return
+        if self.shared is not None:
+            if self.shared.incr(f"tag:{tag}" for tag in tags):
+                return
+            # Shared tier unreachable: at least drop what this worker holds
+            self.local.clear()
+            return
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+
+def _build_response_cache() -> TaggedCache:
+    versions = None
+    if os.getenv("CACHE_VERSIONS", "local").lower() == "database":
+        versions = DatabaseVersionStore()
+    local = LRUCache(
+        max_entries=int(os.getenv("RESPONSE_CACHE_SIZE", "1000")),
+        ttl=float(os.getenv("RESPONSE_CACHE_TTL", "60")),
+    )
+    redis_url = os.getenv("CACHE_REDIS_URL")
+    shared = None
+    if redis_url:
+        if redis is None:
+            print(
+                "⚠️ CACHE_REDIS_URL is set but redis is not installed; using LRU only"
+            )
+        else:
+            shared = RedisCache.from_url(redis_url, ttl=local.ttl)
+    return TaggedCache(local, shared, versions)
+
+
+response_cache = _build_response_cache()
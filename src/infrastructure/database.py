@@ -4,21 +4,32 @@ from typing import AsyncGenerator
 
 from dotenv import load_dotenv
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
+    Computed,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
+    SmallInteger,
     String,
     Text,
+    and_,
     create_engine,
+    event,
+    inspect,
+    select,
+    update,
 )
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Session, column_property, relationship, sessionmaker
 
-from src.domain.entities import TaskPriority, TaskStatus
+from src.domain.entities import OPEN_STATUSES, TaskPriority, TaskStatus, task_is_overdue
 
 try:
     load_dotenv()
@@ -46,11 +57,19 @@ class UserModel(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     owned_task_lists = relationship("TaskListModel", back_populates="owner")
-    assigned_tasks = relationship("TaskModel", back_populates="assignee")
+    assigned_tasks = relationship(
+        "TaskModel", back_populates="assignee", foreign_keys="TaskModel.assigned_to"
+    )
 
 
 class TaskListModel(Base):
     __tablename__ = "task_lists"
+    __table_args__ = (
+        # taskListsConnection keyset: the owner's lists in creation order
+        Index("ix_task_lists_owner_created", "owner_id", "created_at", "id"),
+        # Change feed: the owner's lists in update order
+        Index("ix_task_lists_owner_updated", "owner_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
@@ -65,22 +84,179 @@ class TaskListModel(Base):
     )
 
 
+# Severity rank of the stored priority name; sorting the enum itself would be
+# alphabetical (CRITICAL, HIGH, LOW, MEDIUM)
+PRIORITY_RANK_SQL = "CASE priority {} END".format(
+    " ".join(
+        f"WHEN '{priority.name}' THEN {rank}"
+        for rank, priority in enumerate(TaskPriority, start=1)
+    )
+)
+
+
+def _task_list_owner(context) -> int:
+    """
+    Fallback for tasks.owner_id: the owner of the task's list.
+
+    Costs a SELECT per row, so the create paths, which have already checked
+    the list's owner, set owner_id themselves.
+    """
+    task_list_id = context.get_current_parameters()["task_list_id"]
+    return context.connection.execute(
+        select(TaskListModel.owner_id).where(TaskListModel.id == task_list_id)
+    ).scalar()
+
+
 class TaskModel(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Task reads filter on the owner directly instead of joining task_lists
+        Index("ix_tasks_owner_status_due", "owner_id", "status", "due_date"),
+        Index("ix_tasks_owner_list", "owner_id", "task_list_id"),
+        Index("ix_tasks_owner_created", "owner_id", "created_at", "id"),
+        # One per server-side sort (see src/application/task_ordering.py)
+        Index("ix_tasks_owner_updated", "owner_id", "updated_at", "id"),
+        Index("ix_tasks_owner_due", "owner_id", "due_date", "id"),
+        Index("ix_tasks_owner_priority_rank", "owner_id", "priority_rank", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(Enum(TaskStatus), default=TaskStatus.PENDING, nullable=False)
+    # active_history: the previous value is loaded before an assignment, so
+    # the task event log always knows what changed from
+    status = column_property(
+        Column(Enum(TaskStatus), default=TaskStatus.PENDING, nullable=False),
+        active_history=True,
+    )
     priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False)
-    task_list_id = Column(Integer, ForeignKey("task_lists.id"), nullable=False)
-    assigned_to = Column(Integer, ForeignKey("users.id"), nullable=True)
+    # NOT NULL, like updated_at: sorts on nullable columns need an IS NULL
+    # term that the (owner_id, column, id) index can't serve
+    priority_rank = Column(
+        SmallInteger, Computed(PRIORITY_RANK_SQL, persisted=True), nullable=False
+    )
+    task_list_id = column_property(
+        Column(Integer, ForeignKey("task_lists.id"), nullable=False),
+        active_history=True,
+    )
+    # Denormalized from task_lists.owner_id; kept in sync on insert, moves and
+    # list transfers (see _sync_task_owners)
+    owner_id = Column(
+        Integer, ForeignKey("users.id"), nullable=False, default=_task_list_owner
+    )
+    assigned_to = column_property(
+        Column(Integer, ForeignKey("users.id"), nullable=True), active_history=True
+    )
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
     due_date = Column(DateTime, nullable=True)
 
     task_list = relationship("TaskListModel", back_populates="tasks")
-    assignee = relationship("UserModel", back_populates="assigned_tasks")
+    assignee = relationship(
+        "UserModel", back_populates="assigned_tasks", foreign_keys=[assigned_to]
+    )
+
+    @hybrid_property
+    def is_overdue(self) -> bool:
+        return task_is_overdue(self.due_date, self.status)
+
+    @is_overdue.expression
+    def is_overdue(cls):
+        # Open statuses are listed rather than negated so that, with the owner,
+        # the (owner_id, status, due_date) index answers it with range scans
+        return and_(
+            cls.due_date.isnot(None),
+            cls.status.in_(OPEN_STATUSES),
+            cls.due_date < datetime.utcnow(),
+        )
+
+
+@event.listens_for(Session, "before_flush")
+def _sync_task_owners(session: Session, flush_context, instances) -> None:
+    """Carry owner changes of lists (transfers) and of tasks (moves) to tasks"""
+    for instance in session.dirty:
+        if isinstance(instance, TaskListModel):
+            # The old value may not be loaded, so any assignment counts
+            if inspect(instance).attrs.owner_id.history.added:
+                session.execute(
+                    update(TaskModel).where(TaskModel.task_list_id == instance.id)
+                    # Bumped so the new owner's change feed picks the tasks up
+                    .values(owner_id=instance.owner_id, updated_at=datetime.utcnow())
+                )
+        elif isinstance(instance, TaskModel):
+            if inspect(instance).attrs.task_list_id.history.added:
+                instance.owner_id = session.execute(
+                    select(TaskListModel.owner_id).where(
+                        TaskListModel.id == instance.task_list_id
+                    )
+                ).scalar()
+
+
+class DeletedRecordModel(Base):
+    """
+    Tombstone of a task or task list that left an owner's data (deleted,
+    moved or transferred), read by the change feed
+    """
+
+    __tablename__ = "deleted_records"
+    __table_args__ = (
+        Index("ix_deleted_records_owner_deleted", "owner_id", "deleted_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity = Column(String(16), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    task_list_id = Column(Integer, nullable=True)
+    owner_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class TaskEventModel(Base):
+    """Append-only history of task changes (see src/infrastructure/task_events.py)"""
+
+    __tablename__ = "task_events"
+    __table_args__ = (
+        Index("ix_task_events_task", "task_id", "occurred_at", "id"),
+        Index("ix_task_events_owner", "owner_id", "occurred_at", "id"),
+    )
+
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    # No foreign keys: the history outlives deleted tasks and lists
+    task_id = Column(Integer, nullable=False)
+    task_list_id = Column(Integer, nullable=True)
+    owner_id = Column(Integer, nullable=False)
+    event_type = Column(String(32), nullable=False)
+    from_value = Column(String(64), nullable=True)
+    to_value = Column(String(64), nullable=True)
+    occurred_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class TaskEventRollupModel(Base):
+    """Daily event counts kept by compaction once events age out"""
+
+    __tablename__ = "task_event_rollups"
+
+    owner_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    event_type = Column(String(32), primary_key=True)
+    # "" when the event has no value (e.g. deletions)
+    to_value = Column(String(64), primary_key=True)
+    count = Column(Integer, default=0, nullable=False)
+
+
+class ChangeVersionModel(Base):
+    """Version counter per scope ("owner:1", "task_list:5"), bumped on writes"""
+
+    __tablename__ = "change_versions"
+
+    scope = Column(String(64), primary_key=True)
+    version = Column(BigInteger, default=0, nullable=False)
 
 
 class DatabaseManager:
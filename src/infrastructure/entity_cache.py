@@ -0,0 +1,303 @@
+"""Read-through entity cache around the SQLAlchemy repositories."""
+
+import os
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from src.domain.entities import Task, TaskList, User
+from src.infrastructure.cache import LRUCache
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.infrastructure.metrics import metrics
+from src.infrastructure.repositories import (
+    SQLAlchemyTaskListRepository,
+    SQLAlchemyTaskRepository,
+    SQLAlchemyUserRepository,
+)
+from src.infrastructure.versioning import (
+    CHANGE_VERSIONS_ENABLED,
+    read_versions,
+    user_scope,
+)
+
+ENTITY_CACHE_ENABLED = os.getenv("ENTITY_CACHE_ENABLED", "false").lower() == "true"
+ENTITY_CACHE_SIZE = int(os.getenv("ENTITY_CACHE_SIZE", "10000"))
+# Seconds per entity type, e.g. "user=300,task_list=60,task=30"
+ENTITY_CACHE_TTLS = os.getenv("ENTITY_CACHE_TTLS", "user=300,task_list=60,task=30")
+ENTITY_CACHE_NEGATIVE_TTL = float(os.getenv("ENTITY_CACHE_NEGATIVE_TTL", "5"))
+
+entity_cache_lookups = metrics.counter(
+    "entity_cache_lookups_total",
+    "Entity cache lookups by entity and result (hit, negative_hit, miss)",
+)
+entity_cache_evictions = metrics.counter(
+    "entity_cache_evictions_total", "Entities evicted to stay within the size bound"
+)
+
+_MISSING = object()
+
+
+def _parse_ttls(value: str) -> Dict[str, float]:
+    ttls = {}
+    for part in value.split(","):
+        name, _, seconds = part.partition("=")
+        if name.strip() and seconds.strip():
+            ttls[name.strip()] = float(seconds)
+    return ttls
+
+
+class EntityCache:
+    def __init__(
+        self,
+        max_entries: int = ENTITY_CACHE_SIZE,
+        ttls: Optional[Dict[str, float]] = None,
+        negative_ttl: float = ENTITY_CACHE_NEGATIVE_TTL,
+        default_ttl: float = 60.0,
+    ):
+        self.entries = LRUCache(max_entries=max_entries, ttl=default_ttl)
+        self.ttls = ttls if ttls is not None else _parse_ttls(ENTITY_CACHE_TTLS)
+        self.negative_ttl = negative_ttl
+        self.counts = {"hit": 0, "negative_hit": 0, "miss": 0}
+        self._reported_evictions = 0
+
+    @staticmethod
+    def _key(entity: str, key: Any) -> str:
+        return f"{entity}:{key}"
+
+    def lookup(self, entity: str, key: Any) -> Any:
+        """The cached entity, None for a cached miss, or _MISSING"""
+        value = self.entries.get(self._key(entity, key))
+        if value is None:
+            result = "miss"
+        elif value is _MISSING:
+            result, value = "negative_hit", None
+        else:
+            result, value = "hit", value.model_copy(deep=True)
+        self.counts[result] += 1
+        entity_cache_lookups.inc(labels={"entity": entity, "result": result})
+        return _MISSING if result == "miss" else value
+
+    def store(self, entity: str, key: Any, value: Any) -> None:
+        if value is None:
+            self.entries.set(self._key(entity, key), _MISSING, self.negative_ttl)
+        else:
+            # Callers may mutate what they get back; keep a private copy
+            self.entries.set(
+                self._key(entity, key),
+                value.model_copy(deep=True),
+                self.ttls.get(entity),
+            )
+        self._report_evictions()
+
+    def invalidate(self, entity: str, key: Any) -> None:
+        self.entries.delete(self._key(entity, key))
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def _report_evictions(self) -> None:
+        evictions = self.entries.evictions
+        if evictions > self._reported_evictions:
+            entity_cache_evictions.inc(evictions - self._reported_evictions)
+            self._reported_evictions = evictions
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = sum(self.counts.values())
+        hits = self.counts["hit"] + self.counts["negative_hit"]
+        return {
+            **self.counts,
+            "evictions": self.entries.evictions,
+            "size": len(self.entries),
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+
+entity_cache = EntityCache()
+
+
+class _CachedRepository:
+    """Delegates everything not cached to the wrapped repository"""
+
+    def __init__(self, repository, cache: EntityCache = entity_cache):
+        self.repository = repository
+        self.cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    async def _read_through(self, entity: str, key: Any, load):
+        cached = self.cache.lookup(entity, key)
+        if cached is not _MISSING:
+            return cached
+        value = await load()
+        self.cache.store(entity, key, value)
+        return value
+
+
+class CachedUserRepository(_CachedRepository):
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        return await self._read_through(
+            "user", user_id, lambda: self.repository.get_by_id(user_id)
+        )
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self._read_through(
+            "user_email", email, lambda: self.repository.get_by_email(email)
+        )
+
+    def _forget(self, user: Optional[User]) -> None:
+        if user is not None:
+            self.cache.invalidate("user", user.id)
+            self.cache.invalidate("user_email", user.email)
+
+    async def create(self, user: User) -> User:
+        created = await self.repository.create(user)
+        # Drops a cached "no such email" left by an earlier lookup
+        self._forget(created)
+        return created
+
+    async def update(self, user: User) -> User:
+        # The email may change, so the entry under the old one goes too
+        self._forget(await self.get_by_id(user.id))
+        updated = await self.repository.update(user)
+        self._forget(updated)
+        return updated
+
+    async def delete(self, user_id: int) -> bool:
+        self._forget(await self.get_by_id(user_id))
+        deleted = await self.repository.delete(user_id)
+        self.cache.invalidate("user", user_id)
+        return deleted
+
+
+class CachedTaskListRepository(_CachedRepository):
+    async def get_by_id(self, task_list_id: int) -> Optional[TaskList]:
+        return await self._read_through(
+            "task_list", task_list_id, lambda: self.repository.get_by_id(task_list_id)
+        )
+
+    async def create(self, task_list: TaskList) -> TaskList:
+        created = await self.repository.create(task_list)
+        self.cache.invalidate("task_list", created.id)
+        return created
+
+    async def update(self, task_list: TaskList) -> TaskList:
+        updated = await self.repository.update(task_list)
+        self.cache.invalidate("task_list", task_list.id)
+        return updated
+
+    async def delete(self, task_list_id: int) -> bool:
+        # Tasks are deleted by cascade; their cached copies go with the list.
+        # A fresh read: the cached copy may miss tasks added since
+        task_list = await self.repository.get_by_id(task_list_id)
+        deleted = await self.repository.delete(task_list_id)
+        self.cache.invalidate("task_list", task_list_id)
+        for task in task_list.tasks if task_list else []:
+            self.cache.invalidate("task", task.id)
+        return deleted
+
+
+class CachedTaskRepository(_CachedRepository):
+    """Task writes also invalidate the owning list, which embeds its tasks"""
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        return await self._read_through(
+            "task", task_id, lambda: self.repository.get_by_id(task_id)
+        )
+
+    def _forget(self, task: Optional[Task]) -> None:
+        if task is not None:
+            self.cache.invalidate("task", task.id)
+            self.cache.invalidate("task_list", task.task_list_id)
+
+    async def create(self, task: Task) -> Task:
+        created = await self.repository.create(task)
+        self._forget(created)
+        return created
+
+    async def update(self, task: Task) -> Task:
+        updated = await self.repository.update(task)
+        self._forget(updated)
+        return updated
+
+    async def delete(self, task_id: int) -> bool:
+        task = await self.get_by_id(task_id)
+        deleted = await self.repository.delete(task_id)
+        self.cache.invalidate("task", task_id)
+        self._forget(task)
+        return deleted
+
+
+def user_repository(session) -> SQLAlchemyUserRepository:
+    repository = SQLAlchemyUserRepository(session)
+    return CachedUserRepository(repository) if ENTITY_CACHE_ENABLED else repository
+
+
+def task_list_repository(session) -> SQLAlchemyTaskListRepository:
+    repository = SQLAlchemyTaskListRepository(session)
+    return CachedTaskListRepository(repository) if ENTITY_CACHE_ENABLED else repository
+
+
+def task_repository(session) -> SQLAlchemyTaskRepository:
+    repository = SQLAlchemyTaskRepository(session)
+    return CachedTaskRepository(repository) if ENTITY_CACHE_ENABLED else repository
+
+
+def load_user(db: Session, user_id: int):
+    """The user a request authenticates as, read through the cache when enabled
+
+    Entries are keyed by the user's change version, read first, so a user
+    deleted or deactivated by any worker stops authenticating at once.
+    """
+    if not (ENTITY_CACHE_ENABLED and CHANGE_VERSIONS_ENABLED):
+        return db.query(UserModel).filter(UserModel.id == user_id).first()
+    scope = user_scope(user_id)
+    key = f"{user_id}@{read_versions(db, [scope])[scope]}"
+    cached = entity_cache.lookup("user", key)
+    if cached is not _MISSING:
+        return cached
+    model = db.query(UserModel).filter(UserModel.id == user_id).first()
+    user = User.model_validate(model) if model is not None else None
+    entity_cache.store("user", key, user)
+    return user
+
+
+def _cache_keys(instance) -> Set[Tuple[str, Any]]:
+    state = inspect(instance)
+    if isinstance(instance, UserModel):
+        emails = set(state.attrs.email.history.deleted or ())
+        emails.add(state.dict.get("email"))
+        return {("user", state.dict.get("id"))} | {
+            ("user_email", email) for email in emails
+        }
+    if isinstance(instance, TaskListModel):
+        return {("task_list", state.dict.get("id"))}
+    if isinstance(instance, TaskModel):
+        # The owning list embeds its tasks
+        return {
+            ("task", state.dict.get("id")),
+            ("task_list", state.dict.get("task_list_id")),
+        }
+    return set()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_entities(session: Session, flush_context) -> None:
+    """Writes made on sync sessions (routers, resolvers) evict on commit too"""
+    if not ENTITY_CACHE_ENABLED:
+        return
+    changed = session.info.setdefault("changed_cache_entities", set())
+    for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+        changed.update(_cache_keys(instance))
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_changed_entities(session: Session) -> None:
+    for entity, key in session.info.pop("changed_cache_entities", ()):
+        entity_cache.invalidate(entity, key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_entities(session: Session) -> None:
+    session.info.pop("changed_cache_entities", None)
@@ -0,0 +1,124 @@
+"""In-process publish/subscribe broker for change notifications."""
+
+import asyncio
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set
+
+
+class SubscriberLimitError(Exception):
+    """Raised when the broker already serves the maximum number of subscribers"""
+
+
+class Subscription:
+    """
+    A single subscriber's bounded queue.
+
+    When a consumer falls behind the oldest pending message is dropped, so a slow
+    connection never grows memory or blocks publishers.
+    """
+
+    def __init__(self, broker: "PubSub", channel: str, max_queue_size: int):
+        self.broker = broker
+        self.channel = channel
+        self.dropped = 0
+        self.closed = False
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+
+    def offer(self, message: Any) -> None:
+        """Enqueue a message; must run on the subscriber's event loop"""
+        if self.closed:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(message)
+
+    def deliver(self, message: Any) -> None:
+        """Enqueue a message from any thread"""
+        self._loop.call_soon_threadsafe(self.offer, message)
+
+    async def get(self) -> Any:
+        return await self._queue.get()
+
+    def drain(self) -> list:
+        """Return every message already queued without waiting"""
+        messages = []
+        while not self._queue.empty():
+            messages.append(self._queue.get_nowait())
+        return messages
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.broker.unsubscribe(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        if self.closed:
+            raise StopAsyncIteration
+        return await self.get()
+
+
+class PubSub:
+    """Channel based broker safe to publish to from worker threads"""
+
+    def __init__(self, max_subscribers: int = 1000, max_queue_size: int = 100):
+        self.max_subscribers = max_subscribers
+        self.max_queue_size = max_queue_size
+        self._channels: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._count
+
+    def subscribe(
+        self, channel: str, max_queue_size: Optional[int] = None
+    ) -> Subscription:
+        with self._lock:
+            if self._count >= self.max_subscribers:
+                raise SubscriberLimitError(
+                    f"Subscriber limit of {self.max_subscribers} reached"
+                )
+            subscription = Subscription(
+                self, channel, max_queue_size or self.max_queue_size
+            )
+            self._channels[channel].add(subscription)
+            self._count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._channels.get(subscription.channel)
+            if subscribers and subscription in subscribers:
+                subscribers.remove(subscription)
+                self._count -= 1
+                if not subscribers:
+                    del self._channels[subscription.channel]
+
+    def publish(self, channel: str, message: Any) -> int:
+        """Deliver a message to every subscriber of a channel"""
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+
+        delivered = 0
+        for subscription in subscribers:
+            try:
+                subscription.deliver(message)
+                delivered += 1
+            except RuntimeError:
+                # The subscriber's event loop is gone
+                subscription.close()
+        return delivered
+
+
+pubsub = PubSub(
+    max_subscribers=int(os.getenv("PUBSUB_MAX_SUBSCRIBERS", "1000")),
+    max_queue_size=int(os.getenv("PUBSUB_QUEUE_SIZE", "100")),
+)
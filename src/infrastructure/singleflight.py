@@ -0,0 +1,74 @@
+"""Request coalescing: concurrent identical reads share one computation."""
+
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from src.infrastructure.metrics import metrics
+
+T = TypeVar("T")
+
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+# Seconds a follower waits for the leader before running the read itself
+SINGLE_FLIGHT_TIMEOUT = float(os.getenv("SINGLE_FLIGHT_TIMEOUT", "5"))
+
+coalesced_requests = metrics.counter(
+    "singleflight_requests_total",
+    "Coalesced reads by role: leader ran the read, follower shared its result, "
+    "timeout gave up waiting and ran its own",
+)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self, timeout: float = SINGLE_FLIGHT_TIMEOUT, enabled: bool = True):
+        self.timeout = timeout
+        self.enabled = enabled
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, group: str, key: Hashable, function: Callable[[], T]) -> T:
+        """Run `function` once for all concurrent callers with the same key"""
+        if not self.enabled:
+            return function()
+
+        full_key = (group, key)
+        with self._lock:
+            call = self._calls.get(full_key)
+            leader = call is None
+            if leader:
+                call = self._calls[full_key] = _Call()
+
+        if leader:
+            coalesced_requests.inc(labels={"group": group, "role": "leader"})
+            try:
+                call.result = function()
+                return call.result
+            except BaseException as exc:
+                call.error = exc
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[full_key]
+                call.done.set()
+
+        if not call.done.wait(self.timeout):
+            coalesced_requests.inc(labels={"group": group, "role": "timeout"})
+            return function()
+        coalesced_requests.inc(labels={"group": group, "role": "follower"})
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+read_coalescer = SingleFlight(enabled=SINGLE_FLIGHT_ENABLED)
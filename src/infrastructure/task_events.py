@@ -0,0 +1,320 @@
+"""Append-only task event log with batched writes and daily compaction."""
+
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, event, insert, inspect, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.domain.entities import TaskEventType
+from src.infrastructure.database import (
+    SessionLocal,
+    TaskEventModel,
+    TaskEventRollupModel,
+    TaskModel,
+)
+from src.infrastructure.metrics import metrics
+
+TASK_EVENTS_ENABLED = os.getenv("TASK_EVENTS_ENABLED", "true").lower() == "true"
+TASK_EVENTS_ASYNC = os.getenv("TASK_EVENTS_ASYNC", "false").lower() == "true"
+TASK_EVENTS_BATCH_SIZE = int(os.getenv("TASK_EVENTS_BATCH_SIZE", "500"))
+TASK_EVENTS_FLUSH_INTERVAL = float(os.getenv("TASK_EVENTS_FLUSH_INTERVAL", "1"))
+TASK_EVENTS_RETENTION_DAYS = int(os.getenv("TASK_EVENTS_RETENTION_DAYS", "90"))
+TASK_EVENTS_COMPACTION_CHUNK = int(os.getenv("TASK_EVENTS_COMPACTION_CHUNK", "5000"))
+
+events_written = metrics.counter(
+    "task_events_written_total", "Task events appended to the event log"
+)
+
+# Tracked attribute -> event recorded when it changes
+_TRACKED = {
+    "status": TaskEventType.STATUS_CHANGED,
+    "assigned_to": TaskEventType.ASSIGNED,
+    "task_list_id": TaskEventType.MOVED,
+}
+
+
+def _text(value) -> Optional[str]:
+    if value is None:
+        return None
+    return str(getattr(value, "value", value))
+
+
+def _event(instance, event_type, from_value, to_value, occurred_at) -> Dict:
+    values = inspect(instance).dict
+    return {
+        "task_id": values.get("id"),
+        "task_list_id": values.get("task_list_id"),
+        "owner_id": values.get("owner_id"),
+        "event_type": event_type.value,
+        "from_value": _text(from_value),
+        "to_value": _text(to_value),
+        "occurred_at": occurred_at,
+    }
+
+
+def task_events(session: Session) -> List[Dict]:
+    """Events for the tasks being flushed"""
+    occurred_at = datetime.utcnow()
+    rows = []
+    for instance in session.new:
+        if isinstance(instance, TaskModel):
+            status = inspect(instance).dict.get("status")
+            rows.append(
+                _event(instance, TaskEventType.CREATED, None, status, occurred_at)
+            )
+    for instance in session.dirty:
+        if not isinstance(instance, TaskModel):
+            continue
+        attrs = inspect(instance).attrs
+        for attribute, event_type in _TRACKED.items():
+            history = attrs[attribute].history
+            if not history.added:
+                continue
+            # The old value is only known when it was loaded
+            previous = history.deleted[0] if history.deleted else None
+            if previous is None or previous != history.added[0]:
+                rows.append(
+                    _event(
+                        instance, event_type, previous, history.added[0], occurred_at
+                    )
+                )
+    for instance in session.deleted:
+        if isinstance(instance, TaskModel):
+            rows.append(
+                _event(instance, TaskEventType.DELETED, None, None, occurred_at)
+            )
+    return [row for row in rows if row["owner_id"] is not None]
+
+
+def write_events(session: Session, rows: List[Dict]) -> None:
+    if rows:
+        session.connection().execute(insert(TaskEventModel), rows)
+        events_written.inc(len(rows))
+
+
+_STOP = object()
+
+
+class TaskEventWriter:
+    """
+    Inserts committed events from a background thread, batching whatever
+    arrives within `flush_interval` seconds up to `batch_size` rows
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        batch_size: int = TASK_EVENTS_BATCH_SIZE,
+        flush_interval: float = TASK_EVENTS_FLUSH_INTERVAL,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, rows: List[Dict]) -> None:
+        for row in rows:
+            self._queue.put(row)
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="task-event-writer", daemon=True
+                )
+                self._thread.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write what is queued and stop the thread"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def _next_batch(self) -> List:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and batch[-1] is not _STOP:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            stopping = batch[-1] is _STOP
+            self._write([row for row in batch if row is not _STOP])
+            if stopping:
+                return
+
+    def _write(self, rows: List[Dict]) -> None:
+        if not rows:
+            return
+        try:
+            with self.session_factory() as session:
+                write_events(session, rows)
+                session.commit()
+        except SQLAlchemyError as e:
+            print(f"⚠️ Could not write {len(rows)} task events: {e}")
+
+
+task_event_writer = TaskEventWriter()
+
+
+@event.listens_for(Session, "after_flush")
+def _record_task_events(session: Session, flush_context) -> None:
+    if not TASK_EVENTS_ENABLED:
+        return
+    rows = task_events(session)
+    if TASK_EVENTS_ASYNC:
+        session.info.setdefault("pending_task_events", []).extend(rows)
+    else:
+        write_events(session, rows)
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_task_events(session: Session) -> None:
+    rows = session.info.pop("pending_task_events", None)
+    if rows:
+        task_event_writer.submit(rows)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_task_events(session: Session) -> None:
+    session.info.pop("pending_task_events", None)
+
+
+def events_for_task(
+    db: Session, task_id: int, owner_id: int, limit: int = 100
+) -> List[TaskEventModel]:
+    """A task's events recorded while `owner_id` owned it, oldest first"""
+    return (
+        db.query(TaskEventModel)
+        .filter(TaskEventModel.task_id == task_id, TaskEventModel.owner_id == owner_id)
+        .order_by(TaskEventModel.occurred_at, TaskEventModel.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def events_for_owner(
+    db: Session,
+    owner_id: int,
+    since: Optional[datetime] = None,
+    limit: int = 100,
+    after: Optional[Tuple[datetime, int]] = None,
+) -> List[TaskEventModel]:
+    """Events on the owner's tasks after `since`, oldest first
+
+    `after` is the (occurred_at, id) of the last event already read; events
+    of one flush share a timestamp, so pages can't resume from a time alone.
+    """
+    query = db.query(TaskEventModel).filter(TaskEventModel.owner_id == owner_id)
+    if since is not None:
+        query = query.filter(TaskEventModel.occurred_at > since)
+    if after is not None:
+        occurred_at, event_id = after
+        query = query.filter(
+            or_(
+                TaskEventModel.occurred_at > occurred_at,
+                and_(
+                    TaskEventModel.occurred_at == occurred_at,
+                    TaskEventModel.id > event_id,
+                ),
+            )
+        )
+    return (
+        query.order_by(TaskEventModel.occurred_at, TaskEventModel.id).limit(limit).all()
+    )
+
+
+def _roll_up(session: Session, counts: Counter) -> None:
+    for (owner_id, day, event_type, to_value), count in counts.items():
+        key = (
+            TaskEventRollupModel.owner_id == owner_id,
+            TaskEventRollupModel.day == day,
+            TaskEventRollupModel.event_type == event_type,
+            TaskEventRollupModel.to_value == to_value,
+        )
+        updated = session.execute(
+            update(TaskEventRollupModel)
+            .where(*key)
+            .values(count=TaskEventRollupModel.count + count)
+        )
+        if not updated.rowcount:
+            session.add(
+                TaskEventRollupModel(
+                    owner_id=owner_id,
+                    day=day,
+                    event_type=event_type,
+                    to_value=to_value,
+                    count=count,
+                )
+            )
+
+
+def compact_task_events(
+    session_factory=SessionLocal,
+    retention_days: int = TASK_EVENTS_RETENTION_DAYS,
+    chunk_size: int = TASK_EVENTS_COMPACTION_CHUNK,
+    now: Optional[datetime] = None,
+) -> int:
+    """Roll events older than the retention into daily counts; returns how many"""
+    cutoff = (now or datetime.utcnow()) - timedelta(days=retention_days)
+    compacted = 0
+    while True:
+        with session_factory() as session:
+            # Events are appended in time order; walking the clustered index
+            # by id reaches the ones past the retention first
+            rows = session.execute(
+                select(
+                    TaskEventModel.id,
+                    TaskEventModel.owner_id,
+                    TaskEventModel.occurred_at,
+                    TaskEventModel.event_type,
+                    TaskEventModel.to_value,
+                )
+                .order_by(TaskEventModel.id)
+                .limit(chunk_size)
+            ).all()
+            expired = [row for row in rows if row.occurred_at < cutoff]
+            if not expired:
+                return compacted
+            _roll_up(
+                session,
+                Counter(
+                    (
+                        row.owner_id,
+                        row.occurred_at.date(),
+                        row.event_type,
+                        row.to_value or "",
+                    )
+                    for row in expired
+                ),
+            )
+            session.execute(
+                delete(TaskEventModel).where(
+                    TaskEventModel.id.in_([row.id for row in expired])
+                )
+            )
+            session.commit()
+        compacted += len(expired)
+        if len(expired) < len(rows) or len(rows) < chunk_size:
+            return compacted
+
+
+if __name__ == "__main__":
+    print(f"✅ Compacted {compact_task_events()} task events")
@@ -0,0 +1,103 @@
+"""Deletion tombstones for the change feed, with chunked pruning."""
+
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, event, insert, inspect, select
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import (
+    DeletedRecordModel,
+    SessionLocal,
+    TaskListModel,
+    TaskModel,
+)
+
+TOMBSTONE_RETENTION_DAYS = int(os.getenv("TOMBSTONE_RETENTION_DAYS", "30"))
+TOMBSTONE_PRUNE_CHUNK = int(os.getenv("TOMBSTONE_PRUNE_CHUNK", "5000"))
+
+TASK = "task"
+TASK_LIST = "task_list"
+
+_ENTITIES = {TaskModel: TASK, TaskListModel: TASK_LIST}
+
+
+def _tombstone(instance, owner_id: int, deleted_at: datetime) -> Dict:
+    values = inspect(instance).dict
+    entity = _ENTITIES[type(instance)]
+    return {
+        "entity": entity,
+        "entity_id": values.get("id"),
+        "task_list_id": values.get("id" if entity == TASK_LIST else "task_list_id"),
+        "owner_id": owner_id,
+        "deleted_at": deleted_at,
+    }
+
+
+def tombstones(session: Session) -> List[Dict]:
+    """Rows to record for the objects being flushed"""
+    deleted_at = datetime.utcnow()
+    rows = []
+    for instance in session.deleted:
+        if type(instance) in _ENTITIES:
+            owner_id = inspect(instance).dict.get("owner_id")
+            if owner_id is not None:
+                rows.append(_tombstone(instance, owner_id, deleted_at))
+    for instance in session.dirty:
+        if type(instance) in _ENTITIES:
+            # Moves and transfers, for the previous owner when the old value
+            # was loaded; the tasks of a transferred list only get the list's
+            history = inspect(instance).attrs.owner_id.history
+            for owner_id in history.deleted:
+                if owner_id is not None and owner_id not in history.added:
+                    rows.append(_tombstone(instance, owner_id, deleted_at))
+    return rows
+
+
+@event.listens_for(Session, "after_flush")
+def _record_tombstones(session: Session, flush_context) -> None:
+    rows = tombstones(session)
+    if rows:
+        session.connection().execute(insert(DeletedRecordModel), rows)
+
+
+def tombstone_horizon(
+    now: Optional[datetime] = None, retention_days: int = TOMBSTONE_RETENTION_DAYS
+) -> datetime:
+    """Tombstones older than this may already be pruned"""
+    return (now or datetime.utcnow()) - timedelta(days=retention_days)
+
+
+def prune_tombstones(
+    session_factory=SessionLocal,
+    retention_days: int = TOMBSTONE_RETENTION_DAYS,
+    chunk_size: int = TOMBSTONE_PRUNE_CHUNK,
+    now: Optional[datetime] = None,
+) -> int:
+    """Delete tombstones older than the retention; returns how many"""
+    cutoff = tombstone_horizon(now, retention_days)
+    pruned = 0
+    while True:
+        with session_factory() as session:
+            # Ids grow with time, so the oldest tombstones come first in the
+            # primary key and no extra index is needed
+            rows = session.execute(
+                select(DeletedRecordModel.id, DeletedRecordModel.deleted_at)
+                .order_by(DeletedRecordModel.id)
+                .limit(chunk_size)
+            ).all()
+            expired = [row.id for row in rows if row.deleted_at < cutoff]
+            if not expired:
+                return pruned
+            session.execute(
+                delete(DeletedRecordModel).where(DeletedRecordModel.id.in_(expired))
+            )
+            session.commit()
+        pruned += len(expired)
+        if len(expired) < len(rows) or len(rows) < chunk_size:
+            return pruned
+
+
+if __name__ == "__main__":
+    print(f"✅ Pruned {prune_tombstones()} deletion tombstones")
@@ -0,0 +1,159 @@
+"""Process-wide directory of the user fields task reads and assignments need."""
+
+import os
+from itertools import islice
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.infrastructure.cache import LRUCache
+from src.infrastructure.database import SessionLocal, UserModel
+from src.infrastructure.metrics import metrics
+from src.infrastructure.versioning import (
+    CHANGE_VERSIONS_ENABLED,
+    read_versions,
+    user_scope,
+)
+
+USER_DIRECTORY_ENABLED = os.getenv("USER_DIRECTORY_ENABLED", "false").lower() == "true"
+USER_DIRECTORY_SIZE = int(os.getenv("USER_DIRECTORY_SIZE", "50000"))
+USER_DIRECTORY_TTL = float(os.getenv("USER_DIRECTORY_TTL", "300"))
+# Users loaded at startup (most recently created first); 0 disables warmup
+USER_DIRECTORY_WARMUP = int(os.getenv("USER_DIRECTORY_WARMUP", "10000"))
+
+user_directory_lookups = metrics.counter(
+    "user_directory_lookups_total", "User directory lookups by result (hit, miss)"
+)
+
+
+class UserEntry(NamedTuple):
+    id: int
+    full_name: Optional[str]
+    email: str
+    is_active: bool
+
+
+_COLUMNS = (UserModel.id, UserModel.full_name, UserModel.email, UserModel.is_active)
+
+
+class UserDirectory:
+    def __init__(self, max_entries: int = USER_DIRECTORY_SIZE, ttl=USER_DIRECTORY_TTL):
+        self.entries = LRUCache(max_entries=max_entries, ttl=ttl)
+
+    def _store(self, rows, versions: Dict[str, int]) -> Dict[int, UserEntry]:
+        loaded = {}
+        for row in rows:
+            entry = UserEntry(*row)
+            # Kept with the change version read before the row, if any
+            self.entries.set(str(entry.id), (entry, versions.get(user_scope(entry.id))))
+            loaded[entry.id] = entry
+        return loaded
+
+    def get_many(
+        self, db: Session, user_ids: Iterable[int], verify: bool = False
+    ) -> Dict[int, UserEntry]:
+        """
+        Entries for the ids that exist; misses are loaded in one query.
+
+        With `verify`, entries whose user changed since they were loaded (in
+        any worker) count as misses.
+        """
+        user_ids = {user_id for user_id in user_ids if user_id is not None}
+        versions = (
+            read_versions(db, [user_scope(user_id) for user_id in user_ids])
+            if verify and user_ids
+            else {}
+        )
+        found: Dict[int, UserEntry] = {}
+        missing = set()
+        for user_id in user_ids:
+            cached = self.entries.get(str(user_id))
+            if cached is None or (
+                verify and cached[1] != versions[user_scope(user_id)]
+            ):
+                missing.add(user_id)
+            else:
+                found[user_id] = cached[0]
+        if found:
+            user_directory_lookups.inc(len(found), labels={"result": "hit"})
+        if missing:
+            user_directory_lookups.inc(len(missing), labels={"result": "miss"})
+            rows = db.query(*_COLUMNS).filter(UserModel.id.in_(missing)).all()
+            found.update(self._store(rows, versions))
+        return found
+
+    def get(
+        self, db: Session, user_id: Optional[int], verify: bool = False
+    ) -> Optional[UserEntry]:
+        if user_id is None:
+            return None
+        return self.get_many(db, [user_id], verify).get(user_id)
+
+    def warm(self, db: Session, limit: int = USER_DIRECTORY_WARMUP) -> int:
+        """Bulk-load up to `limit` users; returns how many were loaded"""
+        rows = db.query(*_COLUMNS).order_by(UserModel.id.desc()).limit(limit).all()
+        return len(self._store(rows, {}))
+
+    def invalidate(self, *user_ids: int) -> None:
+        for user_id in user_ids:
+            self.entries.delete(str(user_id))
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+user_directory = UserDirectory()
+
+
+def warm_user_directory(session_factory=SessionLocal) -> None:
+    if not USER_DIRECTORY_ENABLED or USER_DIRECTORY_WARMUP <= 0:
+        return
+    try:
+        with session_factory() as session:
+            loaded = user_directory.warm(session)
+        print(f"✅ User directory warmed with {loaded} users")
+    except SQLAlchemyError as e:
+        print(f"⚠️ Could not warm the user directory: {e}")
+
+
+def lookup_user(db: Session, user_id: int):
+    """The user's name, email and active flag, from the directory when enabled"""
+    if USER_DIRECTORY_ENABLED and CHANGE_VERSIONS_ENABLED:
+        # Decides whether a user may be assigned: never trust a stale entry
+        return user_directory.get(db, user_id, verify=True)
+    return db.query(UserModel).filter(UserModel.id == user_id).first()
+
+
+def with_assignee_names(
+    db: Session, tasks: Iterable, chunk_size: int = 500
+) -> Iterator[Tuple[object, Optional[str]]]:
+    """(task, assignee_name) pairs, resolving names a chunk of tasks at a time"""
+    tasks = iter(tasks)
+    while True:
+        chunk = list(islice(tasks, chunk_size))
+        if not chunk:
+            return
+        users = user_directory.get_many(db, (task.assigned_to for task in chunk))
+        for task in chunk:
+            entry = users.get(task.assigned_to)
+            yield task, entry.full_name if entry else None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    changed = session.info.setdefault("changed_user_ids", set())
+    for instance in list(session.dirty) + list(session.deleted):
+        if isinstance(instance, UserModel):
+            changed.add(inspect(instance).dict.get("id"))
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_changed_users(session: Session) -> None:
+    user_directory.invalidate(*session.info.pop("changed_user_ids", ()))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop("changed_user_ids", None)
@@ -0,0 +1,140 @@
+"""Per-owner, per-list and per-user change versions stored in MySQL."""
+
+import os
+from itertools import chain
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import (
+    ChangeVersionModel,
+    SessionLocal,
+    TaskListModel,
+    TaskModel,
+    UserModel,
+)
+
+CHANGE_VERSIONS_ENABLED = os.getenv("CHANGE_VERSIONS_ENABLED", "true").lower() == "true"
+
+
+def owner_scope(owner_id: int) -> str:
+    return f"owner:{owner_id}"
+
+
+def task_list_scope(task_list_id: int) -> str:
+    return f"task_list:{task_list_id}"
+
+
+def user_scope(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def _loaded(instance, attribute: str):
+    """Current value without triggering a load (deleted rows can't be refreshed)"""
+    return inspect(instance).dict.get(attribute)
+
+
+def _previous(instance, attribute: str) -> list:
+    """Values an attribute had before this flush (e.g. a task's old list)"""
+    return list(inspect(instance).attrs[attribute].history.deleted)
+
+
+def changed_scopes(session: Session) -> Set[str]:
+    """Scopes touched by the objects being flushed"""
+    scopes: Set[str] = set()
+    owners_by_list: Dict[int, int] = {}
+    list_ids: Set[int] = set()
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, TaskModel):
+            list_ids.add(_loaded(instance, "task_list_id"))
+            list_ids.update(_previous(instance, "task_list_id"))
+        elif isinstance(instance, TaskListModel):
+            list_id = _loaded(instance, "id")
+            list_ids.add(list_id)
+            owners_by_list[list_id] = _loaded(instance, "owner_id")
+            for owner_id in _previous(instance, "owner_id"):
+                scopes.add(owner_scope(owner_id))
+        elif isinstance(instance, UserModel):
+            scopes.add(user_scope(_loaded(instance, "id")))
+
+    list_ids.discard(None)
+    missing = {list_id for list_id in list_ids if owners_by_list.get(list_id) is None}
+    if missing:
+        rows = session.connection().execute(
+            select(TaskListModel.id, TaskListModel.owner_id).where(
+                TaskListModel.id.in_(missing)
+            )
+        )
+        owners_by_list.update(rows.all())
+    for task_list_id in list_ids:
+        scopes.add(task_list_scope(task_list_id))
+        if owners_by_list.get(task_list_id) is not None:
+            scopes.add(owner_scope(owners_by_list[task_list_id]))
+    return scopes
+
+
+def _increment_statement(dialect: str, scopes: Iterable[str]):
+    # Sorted so concurrent writers lock rows in the same order
+    rows = [{"scope": scope, "version": 1} for scope in sorted(scopes)]
+    if dialect == "mysql":
+        statement = mysql_insert(ChangeVersionModel).values(rows)
+        return statement.on_duplicate_key_update(version=ChangeVersionModel.version + 1)
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite_insert if dialect == "sqlite" else postgresql_insert
+        return (
+            insert(ChangeVersionModel)
+            .values(rows)
+            .on_conflict_do_update(
+                index_elements=["scope"],
+                set_={"version": ChangeVersionModel.version + 1},
+            )
+        )
+    raise NotImplementedError(f"Change versions are not supported on {dialect}")
+
+
+def bump_versions(session: Session, scopes: Iterable[str]) -> None:
+    scopes = set(scopes)
+    if not scopes:
+        return
+    connection = session.connection()
+    connection.execute(_increment_statement(connection.dialect.name, scopes))
+
+
+def read_versions(session: Session, scopes: Iterable[str]) -> Dict[str, int]:
+    """Current versions of `scopes` in one indexed read; unknown scopes are 0"""
+    scopes = sorted(set(scopes))
+    versions = dict.fromkeys(scopes, 0)
+    if scopes:
+        rows = session.execute(
+            select(ChangeVersionModel.scope, ChangeVersionModel.version).where(
+                ChangeVersionModel.scope.in_(scopes)
+            )
+        )
+        versions.update(rows.all())
+    return versions
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_after_flush(session: Session, flush_context) -> None:
+    if CHANGE_VERSIONS_ENABLED:
+        bump_versions(session, changed_scopes(session))
+
+
+class DatabaseVersionStore:
+    """Version source for TaggedCache backed by the change_versions table"""
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+
+    def read(self, scopes: Iterable[str]) -> Optional[Dict[str, int]]:
+        try:
+            with self.session_factory() as session:
+                return read_versions(session, scopes)
+        except SQLAlchemyError as e:
+            print(f"⚠️ Could not read change versions: {e}")
+            return None
@@ -0,0 +1,318 @@
+"""ASGI response compression (gzip, brotli, zstd) with per-route metrics."""
+
+import os
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from src.infrastructure.metrics import metrics
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstd is optional
+    zstandard = None
+
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+ZSTD_LEVEL = int(os.getenv("ZSTD_LEVEL", "3"))
+# Server preference when the client accepts several encodings equally
+COMPRESSION_ENCODINGS = [
+    encoding.strip()
+    for encoding in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",")
+    if encoding.strip()
+]
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/graphql-response+json",
+    "application/javascript",
+    "application/xml",
+)
+# Long-lived streams would each hold a compressor's buffers for their whole life
+INCOMPRESSIBLE_TYPES = ("text/event-stream",)
+
+compressed_bytes = metrics.counter(
+    "http_compression_bytes_total",
+    "Response bytes before (stage=original) and after (stage=compressed) compression",
+)
+compression_cpu = metrics.counter(
+    "http_compression_cpu_seconds_total", "CPU time spent compressing responses"
+)
+compression_ratio = metrics.histogram(
+    "http_compression_ratio",
+    "Original size divided by compressed size per response",
+    buckets=(1, 1.5, 2, 3, 4, 6, 8, 12, 16, 25),
+)
+
+
+class _Compressor:
+    """Incremental compressor; flush() emits everything fed so far"""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        elif encoding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            raise ValueError(f"Unsupported encoding {encoding}")
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        if self.encoding == "gzip":
+            return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        if self.encoding == "br":
+            return self._compressor.flush()
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def available_encodings() -> List[str]:
+    encodings = ["gzip"]
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    return encodings
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    return accepted
+
+
+def _is_compressible(content_type: str) -> bool:
+    content_type = content_type.lower()
+    if content_type.startswith(INCOMPRESSIBLE_TYPES):
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
+
+
+class CompressionMiddleware:
+    """
+    Compresses HTTP responses the client accepts an encoding for.
+
+    Bodies below `minimum_size` are sent untouched. Streaming responses are
+    compressed chunk by chunk and flushed after each one, so clients keep
+    receiving data as it is produced.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = COMPRESSION_MINIMUM_SIZE,
+        encodings: Optional[List[str]] = None,
+        levels: Optional[Dict[str, int]] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        supported = available_encodings()
+        self.encodings = [
+            encoding
+            for encoding in (encodings or COMPRESSION_ENCODINGS)
+            if encoding in supported
+        ]
+        self.levels = {"gzip": GZIP_LEVEL, "br": BROTLI_QUALITY, "zstd": ZSTD_LEVEL}
+        self.levels.update(levels or {})
+
+    def choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted = parse_accept_encoding(accept_encoding)
+        best, best_quality = None, 0.0
+        for encoding in self.encodings:
+            quality = accepted.get(encoding, accepted.get("*", 0.0))
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        encoding = self.choose_encoding(
+            headers.get(b"accept-encoding", b"").decode("latin-1")
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, scope, send, encoding):
+        self.middleware = middleware
+        self.scope = scope
+        self._send = send
+        self.encoding = encoding
+        self.start_message = None
+        # None until the first body chunk decides; then "identity" or "compress"
+        self.mode: Optional[str] = None
+        self.pending: List[bytes] = []
+        self.compressor: Optional[_Compressor] = None
+        self.original_size = 0
+        self.compressed_size = 0
+        self.cpu_seconds = 0.0
+
+    def _route(self) -> str:
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or "unmatched"
+
+    def _eligible(self) -> bool:
+        message = self.start_message
+        if message["status"] < 200 or message["status"] in (204, 304):
+            return False
+        if self.scope.get("method") == "HEAD":
+            return False
+        headers = dict(message.get("headers") or [])
+        if b"content-encoding" in headers:
+            return False
+        return _is_compressible(headers.get(b"content-type", b"").decode("latin-1"))
+
+    def _compressed_headers(
+        self, content_length: Optional[int]
+    ) -> List[Tuple[bytes, bytes]]:
+        headers = [
+            (name, value)
+            for name, value in self.start_message.get("headers") or []
+            if name.lower() not in (b"content-length", b"content-encoding")
+        ]
+        headers.append((b"content-encoding", self.encoding.encode()))
+        # The compressed bytes differ from the identity ones a strong ETag names
+        headers = [
+            (
+                name,
+                b"W/" + value
+                if name.lower() == b"etag" and not value.startswith(b"W/")
+                else value,
+            )
+            for name, value in headers
+        ]
+        vary = [value for name, value in headers if name.lower() == b"vary"]
+        if not vary:
+            headers.append((b"vary", b"Accept-Encoding"))
+        elif b"accept-encoding" not in vary[0].lower():
+            headers = [
+                (
+                    name,
+                    value + b", Accept-Encoding" if name.lower() == b"vary" else value,
+                )
+                for name, value in headers
+            ]
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode()))
+        return headers
+
+    def _compress(self, data: bytes, final: bool) -> bytes:
+        start = time.thread_time()
+        output = self.compressor.compress(data)
+        output += self.compressor.finish() if final else self.compressor.flush()
+        self.cpu_seconds += time.thread_time() - start
+        self.original_size += len(data)
+        self.compressed_size += len(output)
+        return output
+
+    def _record(self) -> None:
+        labels = {"route": self._route(), "encoding": self.encoding}
+        compression_cpu.inc(self.cpu_seconds, labels)
+        compressed_bytes.inc(self.original_size, {**labels, "stage": "original"})
+        compressed_bytes.inc(self.compressed_size, {**labels, "stage": "compressed"})
+        if self.compressed_size:
+            compression_ratio.observe(self.original_size / self.compressed_size, labels)
+
+    async def _send_identity(self, body: bytes, more_body: bool) -> None:
+        await self._send(self.start_message)
+        await self._send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
+
+    async def _start_compressed(self, body: bytes, more_body: bool) -> None:
+        self.compressor = _Compressor(
+            self.encoding, self.middleware.levels[self.encoding]
+        )
+        output = self._compress(body, final=not more_body)
+        self.start_message["headers"] = self._compressed_headers(
+            None if more_body else len(output)
+        )
+        await self._send(self.start_message)
+        await self._send(
+            {"type": "http.response.body", "body": output, "more_body": more_body}
+        )
+        if not more_body:
+            self._record()
+
+    async def send(self, message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            return
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.mode == "identity":
+            await self._send(message)
+            return
+        if self.mode == "compress":
+            output = self._compress(body, final=not more_body)
+            await self._send(
+                {"type": "http.response.body", "body": output, "more_body": more_body}
+            )
+            if not more_body:
+                self._record()
+            return
+
+        if not self._eligible():
+            self.mode = "identity"
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        # Buffer small leading chunks until the threshold or the end is reached
+        self.pending.append(body)
+        buffered = b"".join(self.pending)
+        if len(buffered) < self.middleware.minimum_size:
+            if more_body:
+                return
+            self.mode = "identity"
+            await self._send_identity(buffered, more_body=False)
+            return
+
+        self.mode = "compress"
+        self.pending = []
+        await self._start_compressed(buffered, more_body)
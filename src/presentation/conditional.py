@@ -0,0 +1,50 @@
+"""Conditional GET: strong ETags, If-None-Match and Cache-Control."""
+
+import hashlib
+import os
+from typing import Any, Optional
+
+from fastapi import HTTPException, Request
+
+from src.presentation.negotiation import wants_msgpack
+
+# Clients may keep responses but must revalidate them with If-None-Match
+CACHE_CONTROL = os.getenv("REST_CACHE_CONTROL", "private, no-cache")
+
+
+def make_etag(*parts: Any) -> str:
+    return '"' + hashlib.sha256(repr(parts).encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses the weak comparison, so W/ prefixes are ignored"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+class ConditionalGet:
+    """
+    Per-request ETag check, injected with Depends().
+
+    `check` answers 304 before the body is built when the client's copy is
+    current; otherwise the headers are left on request.state for the route
+    to add to whatever response the endpoint returns.
+    """
+
+    def __init__(self, request: Request):
+        self.request = request
+
+    def check(self, *parts: Any) -> str:
+        # Same URL, different bytes: each negotiated media type gets its own tag
+        variant = "msgpack" if wants_msgpack(self.request) else "json"
+        etag = make_etag(variant, *parts)
+        # A shared cache must not answer a msgpack request with a JSON copy
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept"}
+        if etag_matches(self.request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+        self.request.state.response_headers = headers
+        return etag
@@ -0,0 +1,205 @@
+"""GraphQL router accepting an array of operations in a single POST."""
+
+import asyncio
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from graphql import (
+    FieldNode,
+    GraphQLSyntaxError,
+    OperationDefinitionNode,
+    OperationType,
+    parse,
+)
+from graphql.language import DocumentNode, Visitor, visit
+from starlette.requests import Request
+from starlette.responses import Response
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.http.exceptions import HTTPException
+from strawberry.types import ExecutionResult
+from strawberry.types.graphql import OperationType as StrawberryOperationType
+from strawberry.unset import UNSET
+
+MAX_BATCH_SIZE = int(os.getenv("GRAPHQL_MAX_BATCH_SIZE", "10"))
+MAX_BATCH_COST = int(os.getenv("GRAPHQL_MAX_BATCH_COST", "500"))
+
+
+class _FieldCounter(Visitor):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def enter_field(self, node: FieldNode, *_):
+        self.count += 1
+
+
+def operation_cost(document: DocumentNode) -> int:
+    """Cost of a document: one point per selected field, fragments included"""
+    counter = _FieldCounter()
+    visit(document, counter)
+    return counter.count
+
+
+def _operation_type(
+    document: DocumentNode, operation_name: Optional[str]
+) -> Optional[OperationType]:
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    for operation in operations:
+        if operation_name is None or (
+            operation.name and operation.name.value == operation_name
+        ):
+            return operation.operation
+    return None
+
+
+def _parse_document(query: Optional[str]) -> Optional[DocumentNode]:
+    if not query:
+        raise HTTPException(400, "No GraphQL query found in the request")
+    try:
+        return parse(query)
+    except GraphQLSyntaxError:
+        # Reported by execution like any other syntax error
+        return None
+
+
+def _parse_batch_item(item: Any) -> GraphQLRequestData:
+    if not isinstance(item, dict):
+        raise HTTPException(400, "Each batched operation must be a JSON object")
+    variables = item.get("variables")
+    if variables is not None and not isinstance(variables, dict):
+        raise HTTPException(400, "Variables must be a JSON object")
+    return GraphQLRequestData(
+        query=item.get("query"),
+        variables=variables,
+        operation_name=item.get("operationName"),
+    )
+
+
+class BatchGraphQLRouter(GraphQLRouter):
+    """
+    GraphQLRouter that also accepts a JSON array of operations.
+
+    Operations of a batch share one context (and so the authenticated user).
+    Read-only batches execute concurrently in worker threads because the
+    resolvers use blocking database sessions; batches containing a mutation
+    run in order so later operations observe earlier writes.
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_batch_cost: int = MAX_BATCH_COST,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.max_batch_size = max_batch_size
+        self.max_batch_cost = max_batch_cost
+
+    async def run(
+        self,
+        request: Request,
+        context: Optional[Any] = UNSET,
+        root_value: Optional[Any] = UNSET,
+    ) -> Response:
+        if request.method == "POST" and "json" in (
+            request.headers.get("content-type") or ""
+        ):
+            body = await request.body()
+            if body.lstrip().startswith(b"["):
+                return await self._run_batch(request, body, context, root_value)
+        return await super().run(request, context=context, root_value=root_value)
+
+    def _check_batch(self, batch: Any) -> List[GraphQLRequestData]:
+        if not isinstance(batch, list) or not batch:
+            raise HTTPException(400, "A batch must be a non-empty JSON array")
+        if len(batch) > self.max_batch_size:
+            raise HTTPException(
+                400, f"Batch exceeds the limit of {self.max_batch_size} operations"
+            )
+        return [_parse_batch_item(item) for item in batch]
+
+    async def _run_batch(
+        self, request: Request, body: bytes, context: Any, root_value: Any
+    ) -> Response:
+        try:
+            operations = self._check_batch(json.loads(body))
+        except json.JSONDecodeError as e:
+            raise HTTPException(400, "Unable to parse request body as JSON") from e
+
+        documents = [_parse_document(operation.query) for operation in operations]
+        cost = sum(operation_cost(document) for document in documents if document)
+        if cost > self.max_batch_cost:
+            raise HTTPException(
+                400, f"Batch cost {cost} exceeds the limit of {self.max_batch_cost}"
+            )
+
+        sub_response = await self.get_sub_response(request)
+        if context is UNSET:
+            context = await self.get_context(request, response=sub_response)
+        if root_value is UNSET:
+            root_value = await self.get_root_value(request)
+
+        results = await self._execute_batch(operations, documents, context, root_value)
+
+        response_data: List[Dict[str, Any]] = []
+        for result in results:
+            data = await self.process_result(request=request, result=result)
+            if result.errors:
+                self._handle_errors(result.errors, data)
+            response_data.append(data)
+
+        return self.create_response(response_data, sub_response)
+
+    async def _execute_batch(
+        self,
+        operations: List[GraphQLRequestData],
+        documents: List[Optional[DocumentNode]],
+        context: Any,
+        root_value: Any,
+    ) -> List[ExecutionResult]:
+        """Run read-only batches concurrently and mixed ones in order"""
+        has_mutation = any(
+            document
+            and _operation_type(document, operation.operation_name)
+            == OperationType.MUTATION
+            for operation, document in zip(operations, documents)
+        )
+        if has_mutation:
+            results = []
+            for operation in operations:
+                results.append(
+                    await self.schema.execute(
+                        operation.query,
+                        variable_values=operation.variables,
+                        context_value=context,
+                        root_value=root_value,
+                        operation_name=operation.operation_name,
+                        allowed_operation_types={
+                            StrawberryOperationType.QUERY,
+                            StrawberryOperationType.MUTATION,
+                        },
+                    )
+                )
+            return results
+
+        return await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self.schema.execute_sync,
+                    operation.query,
+                    variable_values=operation.variables,
+                    context_value=context,
+                    root_value=root_value,
+                    operation_name=operation.operation_name,
+                    allowed_operation_types={StrawberryOperationType.QUERY},
+                )
+                for operation in operations
+            )
+        )
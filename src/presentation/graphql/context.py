@@ -4,6 +4,7 @@ from strawberry.types import Info
 
 from src.infrastructure.auth import decode_access_token
 from src.infrastructure.database import SessionLocal, UserModel
+from src.infrastructure.entity_cache import load_user
 
 
 def get_db():
@@ -34,16 +35,36 @@ def get_current_user_from_context(info: Info) -> Optional[UserModel]:
         return None
 
 
+def _get_request_token(context) -> str:
+    token = context["request"].headers.get("authorization", "")
+    if not token:
+        # WebSocket clients send credentials in the connection_init payload
+        params = context.get("connection_params") or {}
+        token = params.get("Authorization") or params.get("authorization") or ""
+    return token.replace("Bearer ", "")
+
+
 def require_auth(info):
-    headers = info.context["request"].headers
-    token = headers.get("authorization", "").replace("Bearer ", "")
+    return get_context_user(info.context)
+
+
+def get_context_user(context):
+    """Authenticated user of a request context, looked up once per context"""
+    # Operations batched into one request share the context, so the user is
+    # looked up once per request
+    if isinstance(context, dict) and context.get("user") is not None:
+        return context["user"]
+
+    token = _get_request_token(context)
 
     payload = decode_access_token(token)
     user_id = payload.get("sub")
 
     db = SessionLocal()
     try:
-        user = db.query(UserModel).filter(UserModel.id == user_id).first()
+        user = load_user(db, user_id)
+        if isinstance(context, dict):
+            context["user"] = user
         return user
     finally:
         db.close()
@@ -0,0 +1,50 @@
+from typing import Optional
+
+import strawberry
+from strawberry.types import Info
+
+from src.application.change_feed import read_changes
+from src.application.projections import TaskProjection
+
+from ..context import get_db, require_auth
+from ..types import ChangeFeed, DeletedRecord
+from .task_list_resolvers import _to_task_list_type
+from .task_resolvers import _to_task_type
+
+
+@strawberry.type
+class ChangeQuery:
+    @strawberry.field
+    def changes(
+        self, info: Info, since: Optional[str] = None, limit: Optional[int] = None
+    ) -> ChangeFeed:
+        """Task lists, tasks and deletions since the cursor, for delta sync"""
+        user = require_auth(info)
+        db = get_db()
+        try:
+            page = read_changes(db, user.id, since, limit)
+            projection = TaskProjection()
+            return ChangeFeed(
+                task_lists=[
+                    _to_task_list_type(task_list, total, completed)
+                    for task_list, total, completed in page.task_lists
+                ],
+                tasks=[
+                    _to_task_type(task, assignee_name, projection)
+                    for task, assignee_name in page.tasks
+                ],
+                deleted=[
+                    DeletedRecord(
+                        entity=record.entity,
+                        id=record.entity_id,
+                        task_list_id=record.task_list_id,
+                        deleted_at=record.deleted_at,
+                    )
+                    for record in page.deleted
+                ],
+                cursor=page.cursor,
+                has_more=page.has_more,
+                resync=page.resync,
+            )
+        finally:
+            db.close()
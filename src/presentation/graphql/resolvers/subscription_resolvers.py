@@ -0,0 +1,130 @@
+import asyncio
+from types import SimpleNamespace
+from typing import AsyncGenerator, Optional
+
+import strawberry
+from strawberry.types import Info
+
+from src.application.events import (
+    ChangeAction,
+    ChangeEntity,
+    ChangeEvent,
+    owner_channel,
+    task_list_channel,
+)
+from src.infrastructure.database import TaskListModel
+from src.infrastructure.pubsub import SubscriberLimitError, pubsub
+
+from ..context import get_db, require_auth
+from ..types import ChangeAction as GraphQLChangeAction
+from ..types import CompletionStats, Task, TaskChange, TaskPriority, TaskStatus
+from .task_resolvers import _is_task_overdue, get_completion_stats
+
+
+def _owns_task_list(task_list_id: int, owner_id: int) -> bool:
+    db = get_db()
+    try:
+        task_list = (
+            db.query(TaskListModel.id)
+            .filter(
+                TaskListModel.id == task_list_id, TaskListModel.owner_id == owner_id
+            )
+            .first()
+        )
+        return task_list is not None
+    finally:
+        db.close()
+
+
+def _load_completion_stats(
+    task_list_id: int, owner_id: int
+) -> Optional[CompletionStats]:
+    db = get_db()
+    try:
+        return get_completion_stats(db, task_list_id, owner_id)
+    finally:
+        db.close()
+
+
+def _subscribe(channel: str):
+    try:
+        return pubsub.subscribe(channel)
+    except SubscriberLimitError:
+        raise Exception("Too many active subscriptions, try again later")
+
+
+def _to_task_change(event: ChangeEvent) -> TaskChange:
+    task = None
+    if event.data:
+        data = event.data
+        task = Task(
+            id=data["id"],
+            title=data["title"],
+            description=data["description"],
+            status=TaskStatus(data["status"]),
+            priority=TaskPriority(data["priority"]),
+            task_list_id=data["task_list_id"],
+            assigned_to=data["assigned_to"],
+            assignee_name=data["assignee_name"],
+            due_date=data["due_date"],
+            is_overdue=_is_task_overdue(SimpleNamespace(**data)),
+            created_at=data["created_at"],
+            updated_at=data["updated_at"],
+        )
+    return TaskChange(
+        action=GraphQLChangeAction(event.action.value),
+        task_id=event.entity_id,
+        task_list_id=event.task_list_id,
+        task=task,
+    )
+
+
+@strawberry.type
+class TaskSubscription:
+    @strawberry.subscription
+    async def task_changed(
+        self, task_list_id: int, info: Info
+    ) -> AsyncGenerator[TaskChange, None]:
+        """Push task changes of a task list - user must own it"""
+        user = await asyncio.to_thread(require_auth, info)
+        if not await asyncio.to_thread(_owns_task_list, task_list_id, user.id):
+            raise Exception("Task list not found")
+
+        subscription = _subscribe(task_list_channel(task_list_id))
+        try:
+            async for event in subscription:
+                if event.entity == ChangeEntity.TASK_LIST:
+                    if event.action == ChangeAction.DELETED:
+                        return
+                    continue
+                yield _to_task_change(event)
+        finally:
+            subscription.close()
+
+    @strawberry.subscription
+    async def task_list_stats_changed(
+        self, info: Info, task_list_id: Optional[int] = None
+    ) -> AsyncGenerator[CompletionStats, None]:
+        """Push fresh completion stats whenever a task list of the user changes"""
+        user = await asyncio.to_thread(require_auth, info)
+        subscription = _subscribe(owner_channel(user.id))
+        try:
+            async for event in subscription:
+                # Coalesce bursts so each affected list is recomputed once
+                events = [event, *subscription.drain()]
+                changed_list_ids = dict.fromkeys(
+                    pending.task_list_id
+                    for pending in events
+                    if pending.entity == ChangeEntity.TASK
+                    or pending.action != ChangeAction.DELETED
+                )
+                for changed_list_id in changed_list_ids:
+                    if task_list_id is not None and changed_list_id != task_list_id:
+                        continue
+                    stats = await asyncio.to_thread(
+                        _load_completion_stats, changed_list_id, user.id
+                    )
+                    if stats:
+                        yield stats
+        finally:
+            subscription.close()
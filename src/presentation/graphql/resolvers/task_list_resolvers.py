@@ -4,11 +4,74 @@ import strawberry
 from sqlalchemy import case, func
 from strawberry.types import Info
 
+from src.application.events import (
+    ChangeAction,
+    publish_task_list_change,
+    publish_task_list_deleted,
+)
+from src.application.multi_get import in_request_order, unique_ids
+from src.application.pagination import KeysetOrder, paginate
 from src.domain.entities import TaskStatus
 from src.infrastructure.database import TaskListModel, TaskModel
 
 from ..context import get_db, require_auth
-from ..types import TaskList, TaskListCreateInput, TaskListUpdateInput
+from ..selection import get_selected_fields
+from ..types import (
+    PageInfo,
+    TaskList,
+    TaskListConnection,
+    TaskListCreateInput,
+    TaskListEdge,
+    TaskListUpdateInput,
+)
+
+_STATS_FIELDS = {"completion_percentage", "task_count"}
+
+_TASK_LIST_ORDER = KeysetOrder(
+    "created_at", (TaskListModel.created_at, TaskListModel.id)
+)
+
+
+def _task_list_query(db, with_stats: bool):
+    """Task list query, outer-joining tasks only when stats are needed"""
+    if not with_stats:
+        return db.query(TaskListModel)
+
+    # Reuse REST logic for completion stats
+    return db.query(
+        TaskListModel,
+        func.count(TaskModel.id).label("total_tasks"),
+        func.sum(case((TaskModel.status == TaskStatus.COMPLETED, 1), else_=0)).label(
+            "completed_tasks"
+        ),
+    ).outerjoin(TaskModel, TaskListModel.id == TaskModel.task_list_id)
+
+
+def _with_stats(results, with_stats: bool):
+    """Normalize query rows to (task_list, total_tasks, completed_tasks)"""
+    if with_stats:
+        return results
+    return [(task_list, 0, 0) for task_list in results]
+
+
+def _to_task_list_type(
+    task_list: TaskListModel, total_tasks: Optional[int], completed_tasks: Optional[int]
+) -> TaskList:
+    completion_percentage = 0.0
+    if total_tasks and total_tasks > 0:
+        completed_tasks = completed_tasks or 0
+        completion_percentage = (completed_tasks / total_tasks) * 100
+
+    return TaskList(
+        id=task_list.id,
+        name=task_list.name,
+        description=task_list.description,
+        owner_id=task_list.owner_id,
+        completion_percentage=round(completion_percentage, 1),
+        task_count=total_tasks or 0,
+        created_at=task_list.created_at,
+        updated_at=task_list.updated_at,
+    )
 
 
 @strawberry.type
@@ -17,45 +80,91 @@ class TaskListQuery:
     def task_lists(self, info: Info) -> List[TaskList]:
         """Get all task lists for authenticated user with completion stats"""
         user = require_auth(info)
+        selected = get_selected_fields(info)
+        # Skip the tasks aggregate when no stats field was requested
+        with_stats = selected is None or bool(selected & _STATS_FIELDS)
         db = get_db()
         try:
-            # Reuse REST logic for completion stats
-            query = (
-                db.query(
-                    TaskListModel,
-                    func.count(TaskModel.id).label("total_tasks"),
-                    func.sum(
-                        case((TaskModel.status == TaskStatus.COMPLETED, 1), else_=0)
-                    ).label("completed_tasks"),
-                )
-                .outerjoin(TaskModel, TaskListModel.id == TaskModel.task_list_id)
-                .filter(TaskListModel.owner_id == user.id)
-                .group_by(TaskListModel.id)
+            query = _task_list_query(db, with_stats).filter(
+                TaskListModel.owner_id == user.id
+            )
+            if with_stats:
+                query = query.group_by(TaskListModel.id)
+
+            return [
+                _to_task_list_type(*row) for row in _with_stats(query.all(), with_stats)
+            ]
+        finally:
+            db.close()
+
+    @strawberry.field
+    def task_lists_connection(
+        self, info: Info, first: Optional[int] = None, after: Optional[str] = None
+    ) -> TaskListConnection:
+        """Page through the user's task lists ordered by creation"""
+        user = require_auth(info)
+        node_fields = get_selected_fields(info, "edges", "node")
+        with_stats = node_fields is None or bool(node_fields & _STATS_FIELDS)
+        selected = get_selected_fields(info)
+        db = get_db()
+        try:
+            query = _task_list_query(db, with_stats).filter(
+                TaskListModel.owner_id == user.id
             )
+            if with_stats:
+                query = query.group_by(TaskListModel.id)
+            rows, has_next_page = paginate(query, _TASK_LIST_ORDER, first, after)
+
+            edges = [
+                TaskListEdge(
+                    cursor=_TASK_LIST_ORDER.encode_cursor(
+                        _TASK_LIST_ORDER.values(row[0])
+                    ),
+                    node=_to_task_list_type(*row),
+                )
+                for row in _with_stats(rows, with_stats)
+            ]
 
-            results = query.all()
-
-            task_lists = []
-            for task_list, total_tasks, completed_tasks in results:
-                completion_percentage = 0.0
-                if total_tasks and total_tasks > 0:
-                    completed_tasks = completed_tasks or 0
-                    completion_percentage = (completed_tasks / total_tasks) * 100
-
-                task_lists.append(
-                    TaskList(
-                        id=task_list.id,
-                        name=task_list.name,
-                        description=task_list.description,
-                        owner_id=task_list.owner_id,
-                        completion_percentage=round(completion_percentage, 1),
-                        task_count=total_tasks or 0,
-                        created_at=task_list.created_at,
-                        updated_at=task_list.updated_at,
-                    )
+            total_count = None
+            if selected is None or "total_count" in selected:
+                total_count = (
+                    db.query(func.count(TaskListModel.id))
+                    .filter(TaskListModel.owner_id == user.id)
+                    .scalar()
                 )
 
-            return task_lists
+            return TaskListConnection(
+                edges=edges,
+                page_info=PageInfo(
+                    has_next_page=has_next_page,
+                    has_previous_page=after is not None,
+                    start_cursor=edges[0].cursor if edges else None,
+                    end_cursor=edges[-1].cursor if edges else None,
+                ),
+                total_count=total_count,
+            )
+        finally:
+            db.close()
+
+    @strawberry.field
+    def task_lists_by_ids(self, ids: List[int], info: Info) -> List[Optional[TaskList]]:
+        """The user's task lists for `ids` in that order, null where not found"""
+        user = require_auth(info)
+        lookup = unique_ids(ids)
+        selected = get_selected_fields(info)
+        with_stats = selected is None or bool(selected & _STATS_FIELDS)
+        db = get_db()
+        try:
+            query = _task_list_query(db, with_stats).filter(
+                TaskListModel.id.in_(lookup), TaskListModel.owner_id == user.id
+            )
+            if with_stats:
+                query = query.group_by(TaskListModel.id)
+
+            task_lists = [
+                _to_task_list_type(*row) for row in _with_stats(query.all(), with_stats)
+            ]
+            return in_request_order(ids, task_lists, lambda task_list: task_list.id)
         finally:
             db.close()
 
@@ -118,6 +227,7 @@ class TaskListMutation:
             db.add(task_list)
             db.commit()
             db.refresh(task_list)
+            publish_task_list_change(ChangeAction.CREATED, task_list)
 
             return TaskList(
                 id=task_list.id,
@@ -174,6 +284,7 @@ class TaskListMutation:
             updated_task_list, total_tasks, completed_tasks = (
                 result if result else (task_list, 0, 0)
             )
+            publish_task_list_change(ChangeAction.UPDATED, updated_task_list)
 
             completion_percentage = 0.0
             if total_tasks and total_tasks > 0:
@@ -209,6 +320,7 @@ class TaskListMutation:
 
             db.delete(task_list)
             db.commit()
+            publish_task_list_deleted(id, user.id)
             return True
         finally:
             db.close()
@@ -1,20 +1,40 @@
-from datetime import datetime
 from typing import List, Optional
 
 import strawberry
 from sqlalchemy import case, func
 from strawberry.types import Info
 
+from src.application.events import (
+    ChangeAction,
+    publish_task_change,
+    publish_task_deleted,
+)
+from src.application.multi_get import in_request_order, unique_ids
+from src.application.ownership import find_owned_task, owns_task_list
+from src.application.pagination import paginate
+from src.application.projections import TaskProjection
 from src.application.services import NotificationService
+from src.application.task_ordering import task_order
 from src.domain.entities import TaskPriority as DomainTaskPriority
 from src.domain.entities import TaskStatus as DomainTaskStatus
+from src.domain.entities import task_is_overdue
 from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.infrastructure.user_directory import (
+    USER_DIRECTORY_ENABLED,
+    with_assignee_names,
+)
 
 from ..context import get_db, require_auth
+from ..selection import get_selected_fields
 from ..types import (
     CompletionStats,
+    PageInfo,
+    SortDirection,
     Task,
+    TaskConnection,
+    TaskConnectionOrder,
     TaskCreateInput,
+    TaskEdge,
     TaskFilterInput,
     TaskPriority,
     TaskStatus,
@@ -24,90 +44,254 @@ from ..types import (
 
 def _is_task_overdue(task: TaskModel) -> bool:
     """Reuse REST logic for overdue calculation"""
-    if not task.due_date:
-        return False
-    if task.status == DomainTaskStatus.COMPLETED:
-        return False
-    return datetime.utcnow() > task.due_date
+    return task_is_overdue(task.due_date, task.status)
+
+
+def _task_query(db, projection: TaskProjection):
+    """Task query joining users only if needed; callers filter on owner_id
+
+    With the user directory enabled names come from it instead of a join.
+    """
+    if projection.needs_assignee_join and not USER_DIRECTORY_ENABLED:
+        query = db.query(
+            TaskModel, UserModel.full_name.label("assignee_name")
+        ).outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
+    else:
+        query = db.query(TaskModel)
+
+    options = projection.load_options()
+    if options:
+        query = query.options(*options)
+    return query
+
+
+def _apply_task_filter(query, filter: Optional[TaskFilterInput]):
+    if filter:
+        if filter.task_list_id:
+            query = query.filter(TaskModel.task_list_id == filter.task_list_id)
+        if filter.status:
+            query = query.filter(TaskModel.status == filter.status.value)
+        if filter.priority:
+            query = query.filter(TaskModel.priority == filter.priority.value)
+        if filter.overdue is not None:
+            overdue = TaskModel.is_overdue
+            query = query.filter(overdue if filter.overdue else ~overdue)
+    return query
+
+
+def _with_assignee_names(db, results, projection: TaskProjection):
+    """Normalize query rows to (task, assignee_name) pairs"""
+    if not projection.needs_assignee_join:
+        return [(task, None) for task in results]
+    if USER_DIRECTORY_ENABLED:
+        return list(with_assignee_names(db, results))
+    return results
+
+
+def _task_with_assignee_name(db, task_id: int):
+    """Task reloaded after a write with its assignee name, or (None, None)"""
+    if USER_DIRECTORY_ENABLED:
+        task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+        if not task:
+            return None, None
+        [(task, assignee_name)] = with_assignee_names(db, [task])
+        return task, assignee_name
+    result = (
+        db.query(TaskModel, UserModel.full_name.label("assignee_name"))
+        .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
+        .filter(TaskModel.id == task_id)
+        .first()
+    )
+    return result if result else (None, None)
+
+
+def _to_task_type(
+    task: TaskModel, assignee_name: Optional[str], projection: TaskProjection
+) -> Task:
+    """Build the GraphQL type reading only attributes that were loaded"""
+    include = projection.includes
+    return Task(
+        id=task.id,
+        title=task.title if include("title") else None,
+        description=task.description if include("description") else None,
+        status=TaskStatus(task.status) if include("status") else None,
+        priority=TaskPriority(task.priority) if include("priority") else None,
+        task_list_id=task.task_list_id if include("task_list_id") else None,
+        assigned_to=task.assigned_to if include("assigned_to") else None,
+        assignee_name=assignee_name,
+        due_date=task.due_date if include("due_date") else None,
+        is_overdue=_is_task_overdue(task) if include("is_overdue") else False,
+        created_at=task.created_at if include("created_at") else None,
+        updated_at=task.updated_at if include("updated_at") else None,
+    )
+
+
+def get_completion_stats(
+    db, task_list_id: int, owner_id: int
+) -> Optional[CompletionStats]:
+    """Completion stats for a task list, None unless the owner matches"""
+    # Verify user owns the task list
+    task_list = (
+        db.query(TaskListModel)
+        .filter(TaskListModel.id == task_list_id, TaskListModel.owner_id == owner_id)
+        .first()
+    )
+
+    if not task_list:
+        return None
+
+    # Reuse REST stats logic
+    stats = (
+        db.query(
+            func.count(TaskModel.id).label("total"),
+            func.sum(
+                case((TaskModel.status == DomainTaskStatus.COMPLETED, 1), else_=0)
+            ).label("completed"),
+        )
+        .filter(TaskModel.task_list_id == task_list_id)
+        .first()
+    )
+
+    total_tasks = stats.total or 0
+    completed_tasks = stats.completed or 0
+    completion_percentage = (
+        (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+    )
+
+    return CompletionStats(
+        task_list_id=task_list_id,
+        completion_percentage=round(completion_percentage, 1),
+        total_tasks=total_tasks,
+        completed_tasks=completed_tasks,
+    )
+
+
+def _task_order(order_by: TaskConnectionOrder, direction: SortDirection):
+    return task_order(order_by.value, direction == SortDirection.DESC)
 
 
 @strawberry.type
 class TaskQuery:
     @strawberry.field
-    def tasks(self, info: Info, filter: Optional[TaskFilterInput] = None) -> List[Task]:
-        """Get tasks for authenticated user with full fields - reuses REST logic"""
+    def tasks(
+        self,
+        info: Info,
+        filter: Optional[TaskFilterInput] = None,
+        sort: Optional[TaskConnectionOrder] = None,
+        direction: SortDirection = SortDirection.ASC,
+    ) -> List[Task]:
+        """Get tasks for authenticated user - loads only the selected fields"""
         user = require_auth(info)
+        projection = TaskProjection(get_selected_fields(info))
         db = get_db()
         try:
-            # Reuse REST query logic with JOIN for assignee name
-            query = (
-                db.query(TaskModel, UserModel.full_name.label("assignee_name"))
-                .join(TaskListModel, TaskModel.task_list_id == TaskListModel.id)
-                .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
-                .filter(TaskListModel.owner_id == user.id)
-            )
+            query = _task_query(db, projection).filter(TaskModel.owner_id == user.id)
+            query = _apply_task_filter(query, filter)
+            if sort is not None:
+                query = query.order_by(*_task_order(sort, direction).order_by())
 
-            if filter:
-                if filter.task_list_id:
-                    query = query.filter(TaskModel.task_list_id == filter.task_list_id)
-                if filter.status:
-                    query = query.filter(TaskModel.status == filter.status.value)
-                if filter.priority:
-                    query = query.filter(TaskModel.priority == filter.priority.value)
-
-            results = query.all()
             return [
-                Task(
-                    id=task.id,
-                    title=task.title,
-                    description=task.description,
-                    status=TaskStatus(task.status),
-                    priority=TaskPriority(task.priority),
-                    task_list_id=task.task_list_id,
-                    assigned_to=task.assigned_to,
-                    assignee_name=assignee_name,
-                    due_date=task.due_date,
-                    is_overdue=_is_task_overdue(task),
-                    created_at=task.created_at,
-                    updated_at=task.updated_at,
+                _to_task_type(task, assignee_name, projection)
+                for task, assignee_name in _with_assignee_names(
+                    db, query.all(), projection
                 )
-                for task, assignee_name in results
             ]
         finally:
             db.close()
 
+    @strawberry.field
+    def tasks_connection(
+        self,
+        info: Info,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        filter: Optional[TaskFilterInput] = None,
+        order_by: TaskConnectionOrder = TaskConnectionOrder.CREATED_AT,
+        direction: SortDirection = SortDirection.ASC,
+    ) -> TaskConnection:
+        """Page through the user's tasks with opaque keyset cursors"""
+        user = require_auth(info)
+        order = _task_order(order_by, direction)
+        node_fields = get_selected_fields(info, "edges", "node")
+        if node_fields is not None:
+            # The cursor is built from the sort columns, so always load them
+            node_fields = node_fields | {column.key for column in order.columns}
+        projection = TaskProjection(node_fields, extra_columns=order.columns)
+        selected = get_selected_fields(info)
+        db = get_db()
+        try:
+            query = _task_query(db, projection).filter(TaskModel.owner_id == user.id)
+            rows, has_next_page = paginate(
+                _apply_task_filter(query, filter), order, first, after
+            )
+
+            edges = [
+                TaskEdge(
+                    cursor=order.encode_cursor(order.values(task)),
+                    node=_to_task_type(task, assignee_name, projection),
+                )
+                for task, assignee_name in _with_assignee_names(db, rows, projection)
+            ]
+
+            total_count = None
+            if selected is None or "total_count" in selected:
+                count_query = db.query(func.count(TaskModel.id)).filter(
+                    TaskModel.owner_id == user.id
+                )
+                total_count = _apply_task_filter(count_query, filter).scalar()
+
+            return TaskConnection(
+                edges=edges,
+                page_info=PageInfo(
+                    has_next_page=has_next_page,
+                    has_previous_page=after is not None,
+                    start_cursor=edges[0].cursor if edges else None,
+                    end_cursor=edges[-1].cursor if edges else None,
+                ),
+                total_count=total_count,
+            )
+        finally:
+            db.close()
+
     @strawberry.field
     def task(self, id: int, info: Info) -> Optional[Task]:
-        """Get specific task with full fields - user must own the task list"""
+        """Get specific task - user must own the task list"""
         user = require_auth(info)
+        projection = TaskProjection(get_selected_fields(info))
         db = get_db()
         try:
             result = (
-                db.query(TaskModel, UserModel.full_name.label("assignee_name"))
-                .join(TaskListModel, TaskModel.task_list_id == TaskListModel.id)
-                .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
-                .filter(TaskModel.id == id, TaskListModel.owner_id == user.id)
+                _task_query(db, projection)
+                .filter(TaskModel.id == id, TaskModel.owner_id == user.id)
                 .first()
             )
 
             if not result:
                 return None
 
-            task, assignee_name = result
-            return Task(
-                id=task.id,
-                title=task.title,
-                description=task.description,
-                status=TaskStatus(task.status),
-                priority=TaskPriority(task.priority),
-                task_list_id=task.task_list_id,
-                assigned_to=task.assigned_to,
-                assignee_name=assignee_name,
-                due_date=task.due_date,
-                is_overdue=_is_task_overdue(task),
-                created_at=task.created_at,
-                updated_at=task.updated_at,
+            [(task, assignee_name)] = _with_assignee_names(db, [result], projection)
+            return _to_task_type(task, assignee_name, projection)
+        finally:
+            db.close()
+
+    @strawberry.field
+    def tasks_by_ids(self, ids: List[int], info: Info) -> List[Optional[Task]]:
+        """The user's tasks for `ids` in that order, null where not found"""
+        user = require_auth(info)
+        lookup = unique_ids(ids)
+        projection = TaskProjection(get_selected_fields(info))
+        db = get_db()
+        try:
+            rows = (
+                _task_query(db, projection)
+                .filter(TaskModel.id.in_(lookup), TaskModel.owner_id == user.id)
+                .all()
             )
+            tasks = [
+                _to_task_type(task, assignee_name, projection)
+                for task, assignee_name in _with_assignee_names(db, rows, projection)
+            ]
+            return in_request_order(ids, tasks, lambda task: task.id)
         finally:
             db.close()
 
@@ -119,44 +303,7 @@ class TaskQuery:
         user = require_auth(info)
         db = get_db()
         try:
-            # Verify user owns the task list
-            task_list = (
-                db.query(TaskListModel)
-                .filter(
-                    TaskListModel.id == task_list_id, TaskListModel.owner_id == user.id
-                )
-                .first()
-            )
-
-            if not task_list:
-                return None
-
-            # Reuse REST stats logic
-            stats = (
-                db.query(
-                    func.count(TaskModel.id).label("total"),
-                    func.sum(
-                        case(
-                            (TaskModel.status == DomainTaskStatus.COMPLETED, 1), else_=0
-                        )
-                    ).label("completed"),
-                )
-                .filter(TaskModel.task_list_id == task_list_id)
-                .first()
-            )
-
-            total_tasks = stats.total or 0
-            completed_tasks = stats.completed or 0
-            completion_percentage = (
-                (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-            )
-
-            return CompletionStats(
-                task_list_id=task_list_id,
-                completion_percentage=round(completion_percentage, 1),
-                total_tasks=total_tasks,
-                completed_tasks=completed_tasks,
-            )
+            return get_completion_stats(db, task_list_id, user.id)
         finally:
             db.close()
 
@@ -170,15 +317,7 @@ class TaskMutation:
         db = get_db()
         try:
             # Verify user owns the task list (reuse REST logic)
-            task_list = (
-                db.query(TaskListModel)
-                .filter(
-                    TaskListModel.id == input.task_list_id,
-                    TaskListModel.owner_id == user.id,
-                )
-                .first()
-            )
-            if not task_list:
+            if not owns_task_list(db, user.id, input.task_list_id):
                 raise Exception("Task list not found")
 
             status = input.status.value if input.status else DomainTaskStatus.PENDING
@@ -192,6 +331,7 @@ class TaskMutation:
                 status=status,
                 priority=priority,
                 task_list_id=input.task_list_id,
+                owner_id=user.id,
                 assigned_to=input.assigned_to,
                 due_date=input.due_date,
             )
@@ -200,15 +340,13 @@ class TaskMutation:
             db.refresh(task)
 
             # Get assignee name (reuse REST logic)
-            result = (
-                db.query(TaskModel, UserModel.full_name.label("assignee_name"))
-                .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
-                .filter(TaskModel.id == task.id)
-                .first()
+            created_task, assignee_name = _task_with_assignee_name(db, task.id)
+            if not created_task:
+                created_task = task
+            publish_task_change(
+                ChangeAction.CREATED, created_task, user.id, assignee_name
             )
 
-            created_task, assignee_name = result if result else (task, None)
-
             # 📧 FICTITIOUS EMAIL: Send assignment notification if task is assigned
             if created_task.assigned_to:
                 assignee = (
@@ -281,13 +419,7 @@ class TaskMutation:
 
     def _get_task_with_assignee_name(self, db, task_id: int):
         """Get task with assignee name"""
-        result = (
-            db.query(TaskModel, UserModel.full_name.label("assignee_name"))
-            .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
-            .filter(TaskModel.id == task_id)
-            .first()
-        )
-        return result if result else (None, None)
+        return _task_with_assignee_name(db, task_id)
 
     @strawberry.mutation
     async def update_task(
@@ -297,12 +429,7 @@ class TaskMutation:
         user = require_auth(info)
         db = get_db()
         try:
-            task = (
-                db.query(TaskModel)
-                .join(TaskListModel, TaskModel.task_list_id == TaskListModel.id)
-                .filter(TaskModel.id == id, TaskListModel.owner_id == user.id)
-                .first()
-            )
+            task = find_owned_task(db, id, user.id)
             if not task:
                 return None
 
@@ -322,6 +449,9 @@ class TaskMutation:
             updated_task, assignee_name = self._get_task_with_assignee_name(db, task.id)
             if not updated_task:
                 updated_task = task
+            publish_task_change(
+                ChangeAction.UPDATED, updated_task, user.id, assignee_name
+            )
 
             return Task(
                 id=updated_task.id,
@@ -346,17 +476,14 @@ class TaskMutation:
         user = require_auth(info)
         db = get_db()
         try:
-            task = (
-                db.query(TaskModel)
-                .join(TaskListModel)
-                .filter(TaskModel.id == id, TaskListModel.owner_id == user.id)
-                .first()
-            )
+            task = find_owned_task(db, id, user.id)
             if not task:
                 return False
 
+            task_list_id = task.task_list_id
             db.delete(task)
             db.commit()
+            publish_task_deleted(id, task_list_id, user.id)
             return True
         finally:
             db.close()
@@ -0,0 +1,133 @@
+"""Response cache for GraphQL query operations."""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from graphql import ExecutionResult as GraphQLExecutionResult
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from src.application.events import (
+    ChangeEvent,
+    add_change_listener,
+    owner_channel,
+    task_list_channel,
+)
+from src.infrastructure.cache import TaggedCache, response_cache
+from src.infrastructure.metrics import metrics
+
+from .context import get_context_user
+
+
+def response_cache_enabled(cache: TaggedCache) -> bool:
+    """GRAPHQL_RESPONSE_CACHE_ENABLED; on by default only with shared versions
+
+    Process-local tag versions miss writes made by other workers, which
+    would keep serving stale responses until the TTL.
+    """
+    default = "true" if cache.shares_versions else "false"
+    return os.getenv("GRAPHQL_RESPONSE_CACHE_ENABLED", default).lower() == "true"
+
+
+RESPONSE_CACHE_ENABLED = response_cache_enabled(response_cache)
+
+cache_lookups = metrics.counter(
+    "graphql_response_cache_lookups_total", "GraphQL response cache lookups"
+)
+
+
+# Root fields whose result also depends on the clock (the change feed's
+# settle window), so a stored entry could hide changes without a write
+UNCACHED_ROOT_FIELDS = {"changes"}
+
+
+def _selects_uncached_field(document: Any) -> bool:
+    for definition in getattr(document, "definitions", ()):
+        selection_set = getattr(definition, "selection_set", None)
+        for selection in getattr(selection_set, "selections", ()):
+            name = getattr(selection, "name", None)
+            if name is not None and name.value in UNCACHED_ROOT_FIELDS:
+                return True
+    return False
+
+
+def response_tags(user_id: int) -> List[str]:
+    # Every query only reads task lists owned by the caller
+    return [owner_channel(user_id)]
+
+
+def invalidate_change(event: ChangeEvent) -> None:
+    """Bump the tags of the list and owner touched by a change"""
+    response_cache.invalidate(
+        task_list_channel(event.task_list_id), owner_channel(event.owner_id)
+    )
+
+
+def cache_key(
+    query: str,
+    variables: Optional[Dict[str, Any]],
+    operation_name: Optional[str],
+    user_id: int,
+) -> str:
+    # Same sha256 clients send as the automatic persisted query hash
+    query_hash = hashlib.sha256(query.encode()).hexdigest()
+    variables_hash = hashlib.sha256(
+        json.dumps(variables or {}, sort_keys=True, default=str).encode()
+    ).hexdigest()[:32]
+    return f"gql:{user_id}:{query_hash}:{operation_name or ''}:{variables_hash}"
+
+
+def _authenticated_user(context: Any):
+    try:
+        return get_context_user(context)
+    except Exception:
+        # Resolvers report the authentication error themselves
+        return None
+
+
+class ResponseCacheExtension(SchemaExtension):
+    """
+    Serve repeated query operations of a user from the response cache.
+
+    Mutations and anonymous or failed operations are never cached.
+    """
+
+    def on_execute(self):
+        execution_context = self.execution_context
+        key = None
+        versions = None
+        if (
+            RESPONSE_CACHE_ENABLED
+            and execution_context.query
+            and execution_context.operation_type == OperationType.QUERY
+            and not _selects_uncached_field(execution_context.graphql_document)
+        ):
+            user = _authenticated_user(execution_context.context)
+            if user is not None:
+                key = cache_key(
+                    execution_context.query,
+                    execution_context.variables,
+                    execution_context.operation_name,
+                    user.id,
+                )
+                cached = response_cache.get(key)
+                if cached is not None:
+                    cache_lookups.inc(labels={"result": "hit"})
+                    execution_context.result = GraphQLExecutionResult(data=cached)
+                    key = None
+                else:
+                    cache_lookups.inc(labels={"result": "miss"})
+                    # Read before executing so a concurrent write makes the
+                    # stored entry stale instead of being lost
+                    versions = response_cache.tag_versions(response_tags(user.id))
+
+        yield
+
+        result = execution_context.result
+        if key and versions is not None and result and not result.errors:
+            response_cache.set(key, result.data, versions)
+
+
+add_change_listener(invalidate_change)
@@ -1,12 +1,16 @@
 import strawberry
 
 from .resolvers.auth_resolvers import AuthMutation, AuthQuery
+from .resolvers.change_resolvers import ChangeQuery
+from .resolvers.subscription_resolvers import TaskSubscription
 from .resolvers.task_list_resolvers import TaskListMutation, TaskListQuery
 from .resolvers.task_resolvers import TaskMutation, TaskQuery
+from .response_cache import ResponseCacheExtension
+from .tracing import QueryTracingExtension
 
 
 @strawberry.type
-class Query(AuthQuery, TaskQuery, TaskListQuery):
+class Query(AuthQuery, TaskQuery, TaskListQuery, ChangeQuery):
     """
     GraphQL Query root.
     Follows best practices by combining multiple query classes.
@@ -21,10 +25,19 @@ class Mutation(AuthMutation, TaskMutation, TaskListMutation):
     """
 
 
+@strawberry.type
+class Subscription(TaskSubscription):
+    """
+    GraphQL Subscription root.
+    Served over WebSocket (graphql-transport-ws and graphql-ws).
+    """
+
+
 # Main GraphQL schema
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
+    subscription=Subscription,
     # Enable GraphQL introspection for development
-    extensions=[],
+    extensions=[QueryTracingExtension, ResponseCacheExtension],
 )
@@ -0,0 +1,55 @@
+import re
+from typing import Iterable, Optional, Set
+
+from strawberry.types import Info
+from strawberry.types.nodes import FragmentSpread, InlineFragment, SelectedField
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _to_snake_case(name: str) -> str:
+    return _CAMEL_BOUNDARY.sub("_", name).lower()
+
+
+def _flatten(selections: Iterable) -> list:
+    """Expand fragments so only plain fields remain"""
+    fields = []
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            fields.append(selection)
+        elif isinstance(selection, (FragmentSpread, InlineFragment)):
+            fields.extend(_flatten(selection.selections))
+    return fields
+
+
+def get_selected_fields(info: Info, *path: str) -> Optional[Set[str]]:
+    """
+    Return the snake_case names of the fields requested under the current field.
+
+    `path` walks into nested selections, e.g. ("edges", "node"). Returns None when
+    the selection cannot be determined so callers can fall back to loading
+    everything.
+    """
+    try:
+        fields = _flatten(info.selected_fields)
+    except Exception:
+        return None
+
+    for name in path:
+        fields = [
+            child
+            for field in fields
+            for child in _flatten(field.selections)
+            if _to_snake_case(child.name) == name
+        ]
+
+    if not fields:
+        return None
+
+    # Introspection fields like __typename are not backed by any column
+    return {
+        _to_snake_case(selection.name)
+        for field in fields
+        for selection in _flatten(field.selections)
+        if not selection.name.startswith("__")
+    } or None
@@ -0,0 +1,128 @@
+"""Strawberry extension timing resolvers and counting SQL per operation."""
+
+import os
+from inspect import isawaitable
+from time import perf_counter
+from typing import Any, Dict, Optional
+
+from strawberry.extensions import SchemaExtension
+
+from src.infrastructure.metrics import DEFAULT_COUNT_BUCKETS, metrics
+from src.infrastructure.query_stats import track_queries
+
+TRACE_HEADER = "x-graphql-trace"
+ALLOW_TRACE_HEADER = os.getenv("GRAPHQL_ALLOW_TRACE_HEADER", "true").lower() == "true"
+
+operation_duration = metrics.histogram(
+    "graphql_operation_duration_seconds", "GraphQL operation wall time"
+)
+resolver_duration = metrics.histogram(
+    "graphql_resolver_duration_seconds",
+    "Time spent in one field's resolvers during an operation",
+)
+sql_statements = metrics.histogram(
+    "graphql_sql_statements",
+    "SQL statements executed per GraphQL operation",
+    DEFAULT_COUNT_BUCKETS,
+)
+sql_rows = metrics.histogram(
+    "graphql_sql_rows",
+    "Rows fetched per GraphQL operation",
+    DEFAULT_COUNT_BUCKETS,
+)
+
+
+def _trace_requested(context: Any) -> bool:
+    if not ALLOW_TRACE_HEADER or not isinstance(context, dict):
+        return False
+    request = context.get("request")
+    if request is None:
+        return False
+    return request.headers.get(TRACE_HEADER, "").lower() in ("1", "true")
+
+
+class QueryTracingExtension(SchemaExtension):
+    """
+    Feeds the operation, resolver and SQL histograms on every operation.
+
+    Clients sending `X-GraphQL-Trace: 1` also get the numbers under
+    `extensions.tracing` in the response.
+    """
+
+    def __init__(self, *, execution_context):
+        super().__init__(execution_context=execution_context)
+        # "Type.field" -> [calls, seconds]
+        self._fields: Dict[str, list] = {}
+        self._summary: Optional[Dict[str, Any]] = None
+
+    def on_operation(self):
+        start = perf_counter()
+        with track_queries() as stats:
+            yield
+        duration = perf_counter() - start
+
+        operation_type = self._operation_type()
+        labels = {"operation": operation_type}
+        operation_duration.observe(duration, labels)
+        sql_statements.observe(stats.statements, labels)
+        sql_rows.observe(stats.rows, labels)
+        for field, (_, seconds) in self._fields.items():
+            resolver_duration.observe(seconds, {"field": field})
+
+        self._summary = {
+            "operation": operation_type,
+            "duration_ms": round(duration * 1000, 3),
+            "sql": {"statements": stats.statements, "rows": stats.rows},
+            "resolvers": [
+                {
+                    "field": field,
+                    "calls": calls,
+                    "duration_ms": round(seconds * 1000, 3),
+                }
+                for field, (calls, seconds) in sorted(
+                    self._fields.items(), key=lambda item: -item[1][1]
+                )
+            ],
+        }
+
+    def _operation_type(self) -> str:
+        try:
+            return self.execution_context.operation_type.value
+        except Exception:
+            # Unparseable documents have no operation
+            return "unknown"
+
+    def _record(self, field: str, start: float) -> None:
+        elapsed = perf_counter() - start
+        totals = self._fields.get(field)
+        if totals is None:
+            self._fields[field] = [1, elapsed]
+        else:
+            totals[0] += 1
+            totals[1] += elapsed
+
+    async def _record_async(self, result, field: str, start: float):
+        try:
+            return await result
+        finally:
+            self._record(field, start)
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        field = f"{info.parent_type.name}.{info.field_name}"
+        start = perf_counter()
+        try:
+            result = _next(root, info, *args, **kwargs)
+        except Exception:
+            self._record(field, start)
+            raise
+        if isawaitable(result):
+            return self._record_async(result, field, start)
+        self._record(field, start)
+        return result
+
+    def get_results(self) -> Dict[str, Any]:
+        if self._summary is None or not _trace_requested(
+            self.execution_context.context
+        ):
+            return {}
+        return {"tracing": self._summary}
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 import strawberry
 
@@ -54,6 +54,92 @@ class Task:
     updated_at: Optional[datetime] = None
 
 
+@strawberry.type
+class PageInfo:
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: Optional[str] = None
+    end_cursor: Optional[str] = None
+
+
+@strawberry.type
+class TaskEdge:
+    cursor: str
+    node: Task
+
+
+@strawberry.type
+class TaskConnection:
+    edges: List[TaskEdge]
+    page_info: PageInfo
+    # Only computed when selected
+    total_count: Optional[int] = None
+
+
+@strawberry.type
+class TaskListEdge:
+    cursor: str
+    node: TaskList
+
+
+@strawberry.type
+class TaskListConnection:
+    edges: List[TaskListEdge]
+    page_info: PageInfo
+    # Only computed when selected
+    total_count: Optional[int] = None
+
+
+@strawberry.enum
+class TaskConnectionOrder(Enum):
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    DUE_DATE = "due_date"
+    PRIORITY = "priority"
+
+
+@strawberry.enum
+class SortDirection(Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+@strawberry.enum
+class ChangeAction(Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+@strawberry.type
+class TaskChange:
+    action: ChangeAction
+    task_id: int
+    task_list_id: int
+    task: Optional[Task] = None
+
+
+@strawberry.type
+class DeletedRecord:
+    entity: str
+    id: int
+    task_list_id: Optional[int]
+    deleted_at: datetime
+
+
+@strawberry.type
+class ChangeFeed:
+    task_lists: List[TaskList]
+    tasks: List[Task]
+    deleted: List[DeletedRecord]
+    # Pass back as `since`; null until there is a change
+    cursor: Optional[str]
+    has_more: bool
+    # Full sync after a cursor older than the tombstone retention: replace
+    # local data with what follows
+    resync: bool
+
+
 @strawberry.type
 class AuthPayload:
     access_token: str
@@ -126,6 +212,7 @@ class TaskFilterInput:
     task_list_id: Optional[int] = None
     status: Optional[TaskStatus] = None
     priority: Optional[TaskPriority] = None
+    overdue: Optional[bool] = None
 
 
 @strawberry.input
@@ -0,0 +1,192 @@
+"""MessagePack content negotiation for the REST routers."""
+
+import asyncio
+import copy
+import functools
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Any, Callable
+
+from fastapi.routing import APIRoute, get_request_handler
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+
+from src.presentation.compression import parse_accept_encoding
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is optional
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+
+def _default(value: Any) -> Any:
+    """Types msgpack has no native encoding for"""
+    if isinstance(value, datetime):
+        # Naive datetimes are stored as UTC throughout the app
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return msgpack.Timestamp.from_datetime(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Cannot encode {type(value).__name__} as msgpack")
+
+
+def _naive_utc(obj: dict) -> dict:
+    """Decoded timestamps come back as aware UTC; the models expect naive UTC"""
+    for key, value in obj.items():
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            obj[key] = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return obj
+
+
+def packb(content: Any) -> bytes:
+    return msgpack.packb(content, default=_default)
+
+
+def unpackb(data: bytes) -> Any:
+    """Timestamps decode to aware UTC datetimes"""
+    return msgpack.unpackb(data, timestamp=3)
+
+
+def _plain(content: Any) -> Any:
+    """DTOs become dicts; datetimes and enums are left for `_default`"""
+    if isinstance(content, BaseModel):
+        return content.model_dump()
+    if isinstance(content, (list, tuple)):
+        return [_plain(item) for item in content]
+    if isinstance(content, dict):
+        return {key: _plain(value) for key, value in content.items()}
+    return content
+
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return packb(_plain(content))
+
+
+def accepts_msgpack(accept: str) -> bool:
+    """True when msgpack is accepted at least as strongly as JSON"""
+    accepted = parse_accept_encoding(accept)
+    msgpack_quality = max(accepted.get(media, 0.0) for media in MSGPACK_MEDIA_TYPES)
+    json_quality = accepted.get("application/json", 0.0)
+    return msgpack_quality > 0 and msgpack_quality >= json_quality
+
+
+def wants_msgpack(request: Request) -> bool:
+    return msgpack is not None and accepts_msgpack(request.headers.get("accept", ""))
+
+
+def is_msgpack_body(content_type: str) -> bool:
+    return content_type.split(";")[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+class MsgPackRequest(Request):
+    """
+    Request whose body is MessagePack but is parsed through the JSON path.
+
+    The content-type is rewritten to application/json so FastAPI hands the
+    decoded body to the usual pydantic validation.
+    """
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = msgpack.unpackb(
+                await self.body(), timestamp=3, object_hook=_naive_utc
+            )
+        return self._json
+
+
+def _json_view(request: Request) -> MsgPackRequest:
+    scope = dict(request.scope)
+    scope["headers"] = [
+        (name, b"application/json" if name == b"content-type" else value)
+        for name, value in request.scope["headers"]
+    ]
+    return MsgPackRequest(scope, request.receive)
+
+
+def _to_msgpack(content: Any, status_code: int) -> Response:
+    if isinstance(content, StreamingResponse):
+        return content
+    if isinstance(content, Response):
+        # fast_json_response keeps the dicts it was built from
+        payload = getattr(content, "payload", None)
+        if payload is None:
+            return content
+        return MsgPackResponse(
+            payload, status_code=content.status_code, background=content.background
+        )
+    return MsgPackResponse(content, status_code=status_code)
+
+
+def _msgpack_endpoint(call: Callable, status_code: int) -> Callable:
+    """Wrap an endpoint so its return value is encoded as msgpack"""
+    if asyncio.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def endpoint(*args, **kwargs):
+            return _to_msgpack(await call(*args, **kwargs), status_code)
+
+    else:
+
+        @functools.wraps(call)
+        def endpoint(*args, **kwargs):
+            return _to_msgpack(call(*args, **kwargs), status_code)
+
+    return endpoint
+
+
+class NegotiatedRoute(APIRoute):
+    """APIRoute that also speaks MessagePack in both directions"""
+
+    def _request_handler(self, dependant) -> Callable:
+        return get_request_handler(
+            dependant=dependant,
+            body_field=self.body_field,
+            status_code=self.status_code,
+            response_class=self.response_class,
+            response_field=self.secure_cloned_response_field,
+            response_model_include=self.response_model_include,
+            response_model_exclude=self.response_model_exclude,
+            response_model_by_alias=self.response_model_by_alias,
+            response_model_exclude_unset=self.response_model_exclude_unset,
+            response_model_exclude_defaults=self.response_model_exclude_defaults,
+            response_model_exclude_none=self.response_model_exclude_none,
+            dependency_overrides_provider=self.dependency_overrides_provider,
+        )
+
+    def get_route_handler(self) -> Callable:
+        json_handler = super().get_route_handler()
+        msgpack_handler = None
+        if msgpack is not None:
+            # Same dependencies and body parsing; only the return value differs
+            dependant = copy.copy(self.dependant)
+            dependant.call = _msgpack_endpoint(
+                self.dependant.call, self.status_code or 200
+            )
+            msgpack_handler = self._request_handler(dependant)
+
+        async def handler(request: Request) -> Response:
+            if msgpack is not None and is_msgpack_body(
+                request.headers.get("content-type", "")
+            ):
+                request = _json_view(request)
+            if wants_msgpack(request):
+                response = await msgpack_handler(request)
+            else:
+                response = await json_handler(request)
+            response.headers.add_vary_header("Accept")
+            # Headers set by dependencies (e.g. ETag), whatever the response class
+            for name, value in getattr(request.state, "response_headers", {}).items():
+                response.headers[name] = value
+            return response
+
+        return handler
@@ -0,0 +1,68 @@
+"""Response helpers shared by the REST routers."""
+
+import os
+from typing import Any, Iterable, Iterator, List
+
+import orjson
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+# Opt-in: list endpoints return plain dicts serialized by orjson instead of
+# DTOs re-validated against response_model and encoded by the stdlib
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
+
+# Rows fetched per server-side cursor batch and written per response chunk
+STREAM_CHUNK_ROWS = int(os.getenv("STREAM_CHUNK_ROWS", "500"))
+
+STREAM_MEDIA_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def fast_json_response(content: Any) -> ORJSONResponse:
+    """Returning a Response makes FastAPI skip response_model validation"""
+    response = ORJSONResponse(content)
+    # Kept for content negotiation, which re-encodes the same dicts
+    response.payload = content
+    return response
+
+
+def _encode_chunks(
+    items: Iterable[Any], stream_format: str, chunk_rows: int
+) -> Iterator[bytes]:
+    ndjson = stream_format == "ndjson"
+    if not ndjson:
+        yield b"["
+    chunk: List[bytes] = []
+    first = True
+    for item in items:
+        encoded = orjson.dumps(item)
+        if ndjson:
+            chunk.append(encoded + b"\n")
+        else:
+            chunk.append(encoded if first else b"," + encoded)
+        first = False
+        if len(chunk) >= chunk_rows:
+            yield b"".join(chunk)
+            chunk = []
+    if chunk:
+        yield b"".join(chunk)
+    if not ndjson:
+        yield b"]"
+
+
+def stream_json_response(
+    items: Iterable[Any],
+    stream_format: str,
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+) -> StreamingResponse:
+    """
+    Write `items` as a JSON array or NDJSON while they are produced.
+
+    Chunks of `chunk_rows` items are flushed as they fill, so memory stays
+    bounded by the chunk size instead of the result size.
+    """
+    return StreamingResponse(
+        _encode_chunks(items, stream_format, chunk_rows),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+    )
@@ -0,0 +1,135 @@
+"""POST /api/batch: several REST calls in one HTTP request."""
+
+import asyncio
+import os
+from typing import Any, Dict, Iterator, List
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from src.application.auth_service import batch_user, get_current_user
+from src.application.dto import BatchRequestDTO, BatchResponseDTO, BatchSubRequestDTO
+
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+
+router = APIRouter(prefix="/api/batch", tags=["batch"])
+
+# Batches can't nest, and streams never finish
+EXCLUDED_PREFIXES = ("/api/batch", "/api/stream")
+
+
+def _groups(
+    requests: List[BatchSubRequestDTO],
+) -> Iterator[List[BatchSubRequestDTO]]:
+    """Runs of consecutive GETs; every other sub-request is a group of its own"""
+    reads: List[BatchSubRequestDTO] = []
+    for sub_request in requests:
+        if sub_request.method == "GET":
+            reads.append(sub_request)
+            continue
+        if reads:
+            yield reads
+            reads = []
+        yield [sub_request]
+    if reads:
+        yield reads
+
+
+def _scope(request: Request, sub_request: BatchSubRequestDTO, body: bytes) -> Dict:
+    path, _, query = sub_request.path.partition("?")
+    headers = [
+        (b"accept", b"application/json"),
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    authorization = request.headers.get("authorization")
+    if authorization:
+        headers.append((b"authorization", authorization.encode("latin-1")))
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": sub_request.method,
+        "scheme": request.url.scheme,
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": headers,
+        "client": request.scope.get("client"),
+        "server": request.scope.get("server"),
+    }
+
+
+def _decode(content: bytes) -> Any:
+    if not content:
+        return None
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return content.decode("utf-8", "replace")
+
+
+async def _dispatch(request: Request, sub_request: BatchSubRequestDTO) -> Dict:
+    if sub_request.path.startswith(EXCLUDED_PREFIXES):
+        return {
+            "id": sub_request.id,
+            "status": 400,
+            "body": {"detail": f"{sub_request.path} can't be batched"},
+        }
+
+    body = b"" if sub_request.body is None else orjson.dumps(sub_request.body)
+    request_sent = False
+    status = 500
+    chunks: List[bytes] = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # The sub-request never disconnects
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(_scope(request, sub_request, body), receive, send)
+    except Exception as e:
+        print(
+            f"⚠️ Batch sub-request {sub_request.method} {sub_request.path} failed: {e}"
+        )
+        return {"id": sub_request.id, "status": 500, "body": None}
+    return {"id": sub_request.id, "status": status, "body": _decode(b"".join(chunks))}
+
+
+@router.post("", response_model=BatchResponseDTO)
+async def run_batch(
+    batch: BatchRequestDTO,
+    request: Request,
+    current_user=Depends(get_current_user),
+):
+    """Run REST sub-requests in-process and return their responses in order"""
+    if len(batch.requests) > BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A batch holds at most {BATCH_MAX_REQUESTS} requests",
+        )
+
+    responses: List[Dict] = []
+    token = batch_user.set(current_user)
+    try:
+        for group in _groups(batch.requests):
+            responses.extend(
+                await asyncio.gather(
+                    *(_dispatch(request, sub_request) for sub_request in group)
+                )
+            )
+    finally:
+        batch_user.reset(token)
+    return {"responses": responses}
@@ -0,0 +1,67 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from src.application.auth_service import get_current_user
+from src.application.change_feed import read_changes
+from src.application.dto import ChangeFeedDTO
+from src.application.serializers import (
+    deleted_record_to_dict,
+    task_list_to_dict,
+    task_to_dict,
+)
+from src.domain.exceptions import ValidationError
+from src.infrastructure.database import SessionLocal
+from src.presentation.negotiation import NegotiatedRoute
+from src.presentation.responses import FAST_JSON_RESPONSES, fast_json_response
+
+router = APIRouter(prefix="/api/changes", tags=["changes"], route_class=NegotiatedRoute)
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _completion_percentage(total_tasks: int, completed_tasks: int) -> float:
+    if not total_tasks:
+        return 0.0
+    return round(completed_tasks / total_tasks * 100, 1)
+
+
+@router.get("", response_model=ChangeFeedDTO)
+def get_changes(
+    since: Optional[str] = Query(None, description="Cursor of the previous sync"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum changes"),
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Task lists, tasks and deletions since the cursor, oldest first"""
+    try:
+        page = read_changes(db, current_user.id, since, limit)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+    feed = {
+        "task_lists": [
+            task_list_to_dict(
+                task_list, _completion_percentage(total, completed), total
+            )
+            for task_list, total, completed in page.task_lists
+        ],
+        "tasks": [
+            task_to_dict(task, assignee_name, task.is_overdue)
+            for task, assignee_name in page.tasks
+        ],
+        "deleted": [deleted_record_to_dict(record) for record in page.deleted],
+        "cursor": page.cursor,
+        "has_more": page.has_more,
+        "resync": page.resync,
+    }
+    if FAST_JSON_RESPONSES:
+        return fast_json_response(feed)
+    return feed
@@ -0,0 +1,83 @@
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from src.application.auth_service import get_current_user
+from src.application.change_stream import (
+    HEARTBEAT_FRAME,
+    RESET_FRAME,
+    SSE_HEARTBEAT_SECONDS,
+    StreamEvent,
+    change_stream,
+    format_event,
+)
+from src.infrastructure.pubsub import SubscriberLimitError, Subscription
+
+router = APIRouter(prefix="/api/stream", tags=["stream"])
+
+# Reconnection delay suggested to EventSource clients, in milliseconds
+RETRY_FRAME = b"retry: 3000\n\n"
+
+
+async def event_stream(
+    subscription: Subscription,
+    replay: Optional[List[StreamEvent]],
+    heartbeat: float = SSE_HEARTBEAT_SECONDS,
+) -> AsyncIterator[bytes]:
+    """SSE frames for one connection; closes the subscription when it ends"""
+    try:
+        yield RETRY_FRAME
+        last_seq = 0
+        if replay is None:
+            yield RESET_FRAME
+        for event in replay or ():
+            last_seq = event.seq
+            yield format_event(event)
+        dropped = 0
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT_FRAME
+                continue
+            if subscription.dropped > dropped:
+                # The client fell behind and lost events from its queue
+                dropped = subscription.dropped
+                yield RESET_FRAME
+            # Events published while the replay was read arrive twice
+            if event.seq <= last_seq:
+                continue
+            last_seq = event.seq
+            yield format_event(event)
+    finally:
+        subscription.close()
+
+
+@router.get("")
+async def stream_changes(
+    last_event_id: Optional[str] = Header(None),
+    current_user=Depends(get_current_user),
+):
+    """Server-Sent Events stream of the user's task and task list changes"""
+    try:
+        subscription = change_stream.subscribe(current_user.id)
+    except SubscriberLimitError:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many open streams",
+            headers={"Retry-After": "5"},
+        )
+
+    replay = []
+    if last_event_id:
+        replay = change_stream.replay(current_user.id, last_event_id)
+    return StreamingResponse(
+        event_stream(subscription, replay),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Also runs when the client leaves before the first frame
+        background=BackgroundTask(subscription.close),
+    )
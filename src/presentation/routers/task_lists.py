@@ -1,19 +1,34 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
 from src.application.auth_service import get_current_user
+from src.application.change_versions import owner_change_version
 from src.application.dto import (
     TaskListCreateDTO,
     TaskListResponseDTO,
     TaskListUpdateDTO,
 )
+from src.application.events import (
+    ChangeAction,
+    publish_task_list_change,
+    publish_task_list_deleted,
+)
+from src.application.multi_get import in_request_order, parse_ids, unique_ids
+from src.application.serializers import task_list_to_dict
 from src.domain.entities import TaskStatus
+from src.domain.exceptions import ValidationError
 from src.infrastructure.database import SessionLocal, TaskListModel, TaskModel
+from src.infrastructure.singleflight import read_coalescer
+from src.presentation.conditional import ConditionalGet
+from src.presentation.negotiation import NegotiatedRoute
+from src.presentation.responses import FAST_JSON_RESPONSES, fast_json_response
 
-router = APIRouter(prefix="/api/task-lists", tags=["task-lists"])
+router = APIRouter(
+    prefix="/api/task-lists", tags=["task-lists"], route_class=NegotiatedRoute
+)
 
 
 def get_db():
@@ -36,6 +51,7 @@ def create_task_list(
     db.add(task_list)
     db.commit()
     db.refresh(task_list)
+    publish_task_list_change(ChangeAction.CREATED, task_list)
 
     return TaskListResponseDTO(
         id=task_list.id,
@@ -50,9 +66,37 @@ def create_task_list(
 
 
 @router.get("/", response_model=List[TaskListResponseDTO])
-def get_task_lists(db: Session = Depends(get_db), user=Depends(get_current_user)):
-    # Get task lists with task counts and completion stats
-    query = (
+def get_task_lists(
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+    conditional: ConditionalGet = Depends(),
+    ids: Optional[str] = Query(
+        None,
+        description="Comma separated task list ids; returns them in this order, "
+        "null where not found",
+    ),
+):
+    # Answers 304 before the aggregate query runs
+    version = owner_change_version(db, user.id)
+    conditional.check(version)
+    if ids is not None:
+        return _task_lists_by_ids(db, user.id, ids)
+
+    # Concurrent listings for the same owner run the query once
+    task_lists_response = read_coalescer.do(
+        # Only requests that saw the same version join, so nobody is handed a
+        # query that started before their own write committed
+        "task_lists",
+        (user.id, version),
+        lambda: _load_task_lists(db, user.id),
+    )
+    if FAST_JSON_RESPONSES:
+        return fast_json_response(task_lists_response)
+    return task_lists_response
+
+
+def _task_lists_with_stats(db: Session, owner_id: int):
+    return (
         db.query(
             TaskListModel,
             func.count(TaskModel.id).label("total_tasks"),
@@ -61,11 +105,41 @@ def get_task_lists(db: Session = Depends(get_db), user=Depends(get_current_user)
             ).label("completed_tasks"),
         )
         .outerjoin(TaskModel, TaskListModel.id == TaskModel.task_list_id)
-        .filter(TaskListModel.owner_id == user.id)
+        .filter(TaskListModel.owner_id == owner_id)
         .group_by(TaskListModel.id)
     )
 
-    results = query.all()
+
+def _task_lists_by_ids(db: Session, owner_id: int, ids: str):
+    """The owner's task lists for `ids=` with their stats, in one IN query"""
+    try:
+        requested = parse_ids(ids)
+        lookup = unique_ids(requested)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+    rows = (
+        _task_lists_with_stats(db, owner_id).filter(TaskListModel.id.in_(lookup)).all()
+    )
+    payloads = []
+    for task_list, total_tasks, completed_tasks in rows:
+        completion_percentage = 0.0
+        if total_tasks:
+            completion_percentage = (completed_tasks or 0) / total_tasks * 100
+        payloads.append(
+            task_list_to_dict(
+                task_list, round(completion_percentage, 1), total_tasks or 0
+            )
+        )
+    # Missing ids are returned as null, which TaskListResponseDTO can't hold
+    return fast_json_response(
+        in_request_order(requested, payloads, lambda payload: payload["id"])
+    )
+
+
+def _load_task_lists(db: Session, owner_id: int) -> list:
+    # Get task lists with task counts and completion stats
+    results = _task_lists_with_stats(db, owner_id).all()
 
     task_lists_response = []
     for task_list, total_tasks, completed_tasks in results:
@@ -75,6 +149,14 @@ def get_task_lists(db: Session = Depends(get_db), user=Depends(get_current_user)
             completed_tasks = completed_tasks or 0
             completion_percentage = (completed_tasks / total_tasks) * 100
 
+        if FAST_JSON_RESPONSES:
+            task_lists_response.append(
+                task_list_to_dict(
+                    task_list, round(completion_percentage, 1), total_tasks or 0
+                )
+            )
+            continue
+
         task_lists_response.append(
             TaskListResponseDTO(
                 id=task_list.id,
@@ -93,7 +175,10 @@ def get_task_lists(db: Session = Depends(get_db), user=Depends(get_current_user)
 
 @router.get("/{task_list_id}", response_model=TaskListResponseDTO)
 def get_task_list(
-    task_list_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)
+    task_list_id: int,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+    conditional: ConditionalGet = Depends(),
 ):
     # Get task list with completion stats
     result = (
@@ -114,6 +199,8 @@ def get_task_list(
         raise HTTPException(status_code=404, detail="Task list not found")
 
     task_list, total_tasks, completed_tasks = result
+    # Every field of the response derives from these values
+    conditional.check(task_list.id, task_list.updated_at, total_tasks, completed_tasks)
 
     # Calculate completion percentage
     completion_percentage = 0.0
@@ -150,6 +237,7 @@ def delete_task_list(
     # Delete the task list (tasks will be deleted by cascade)
     db.delete(task_list)
     db.commit()
+    publish_task_list_deleted(task_list_id, user.id)
 
     return {"message": f"Task list '{task_list.name}' deleted successfully"}
 
@@ -198,6 +286,7 @@ def update_task_list(
     updated_task_list, total_tasks, completed_tasks = (
         result if result else (task_list, 0, 0)
     )
+    publish_task_list_change(ChangeAction.UPDATED, updated_task_list)
 
     # Calculate completion percentage
     completion_percentage = 0.0
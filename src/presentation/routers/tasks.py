@@ -1,28 +1,61 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
 from src.application.auth_service import get_current_user
+from src.application.change_versions import owner_change_version
 from src.application.dto import (
     CompletionStatsDTO,
     TaskCreateDTO,
+    TaskEventDTO,
+    TaskEventPageDTO,
     TaskResponseDTO,
     TaskStatusUpdateDTO,
     TaskUpdateDTO,
 )
+from src.application.events import (
+    ChangeAction,
+    publish_task_change,
+    publish_task_deleted,
+)
+from src.application.multi_get import in_request_order, parse_ids, unique_ids
+from src.application.ownership import find_owned_task, owns_task_list
+from src.application.pagination import KeysetOrder
+from src.application.projections import TASK_FIELD_COLUMNS, TaskProjection
+from src.application.serializers import task_projection_to_dict, task_to_dict
 from src.application.services import NotificationService
-from src.domain.entities import TaskPriority, TaskStatus
+from src.application.task_ordering import task_order
+from src.domain.entities import TaskPriority, TaskStatus, task_is_overdue
+from src.domain.exceptions import ValidationError
+from src.infrastructure.cache import response_cache
 from src.infrastructure.database import (
     SessionLocal,
+    TaskEventModel,
     TaskListModel,
     TaskModel,
     UserModel,
 )
+from src.infrastructure.singleflight import read_coalescer
+from src.infrastructure.task_events import events_for_owner, events_for_task
+from src.infrastructure.user_directory import (
+    USER_DIRECTORY_ENABLED,
+    user_directory,
+    with_assignee_names,
+)
+from src.infrastructure.versioning import owner_scope
+from src.presentation.conditional import ConditionalGet
+from src.presentation.negotiation import NegotiatedRoute
+from src.presentation.responses import (
+    FAST_JSON_RESPONSES,
+    STREAM_CHUNK_ROWS,
+    fast_json_response,
+    stream_json_response,
+)
 
-router = APIRouter(prefix="/api/tasks", tags=["tasks"])
+router = APIRouter(prefix="/api/tasks", tags=["tasks"], route_class=NegotiatedRoute)
 
 
 def get_db():
@@ -35,13 +68,25 @@ def get_db():
 
 def _is_task_overdue(task: TaskModel) -> bool:
     """Check if a task is overdue based on due_date and current time"""
-    if not task.due_date:
-        return False  # No due date = not overdue
+    return task_is_overdue(task.due_date, task.status)
 
-    if task.status == TaskStatus.COMPLETED:
-        return False  # Completed tasks are never overdue
 
-    return datetime.utcnow() > task.due_date
+def _reload_with_assignee_name(db: Session, task: TaskModel):
+    """The task after a write together with its assignee's name"""
+    if USER_DIRECTORY_ENABLED:
+        return task, _assignee_name(db, task.assigned_to)
+    result = (
+        db.query(TaskModel, UserModel.full_name.label("assignee_name"))
+        .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
+        .filter(TaskModel.id == task.id)
+        .first()
+    )
+    return result if result else (task, None)
+
+
+def _assignee_name(db: Session, user_id: Optional[int]) -> Optional[str]:
+    entry = user_directory.get(db, user_id)
+    return entry.full_name if entry else None
 
 
 @router.post("/", response_model=TaskResponseDTO)
@@ -51,14 +96,7 @@ async def create_task(
     user=Depends(get_current_user),
 ):
     # Verify task list exists and user owns it
-    task_list = (
-        db.query(TaskListModel)
-        .filter(
-            TaskListModel.id == task_in.task_list_id, TaskListModel.owner_id == user.id
-        )
-        .first()
-    )
-    if not task_list:
+    if not owns_task_list(db, user.id, task_in.task_list_id):
         raise HTTPException(status_code=404, detail="Task list not found")
 
     task = TaskModel(
@@ -66,6 +104,7 @@ async def create_task(
         description=task_in.description,
         priority=task_in.priority,
         task_list_id=task_in.task_list_id,
+        owner_id=user.id,
         assigned_to=task_in.assigned_to,
         due_date=task_in.due_date,
     )
@@ -74,14 +113,8 @@ async def create_task(
     db.refresh(task)
 
     # Query the task again with assignee name to ensure all fields are properly loaded
-    result = (
-        db.query(TaskModel, UserModel.full_name.label("assignee_name"))
-        .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
-        .filter(TaskModel.id == task.id)
-        .first()
-    )
-
-    created_task, assignee_name = result if result else (task, None)
+    created_task, assignee_name = _reload_with_assignee_name(db, task)
+    publish_task_change(ChangeAction.CREATED, created_task, user.id, assignee_name)
 
     # 📧 FICTITIOUS EMAIL: Send assignment notification if task is assigned
     if created_task.assigned_to:
@@ -119,14 +152,96 @@ def get_task_completion_stats(
     user=Depends(get_current_user),
 ):
     """Get completion statistics for tasks with optional filters"""
+    # Identical concurrent requests (e.g. a shared dashboard) share one query
+    return read_coalescer.do(
+        "task_stats",
+        (user.id, task_list_id, status, priority),
+        lambda: _cached_completion_stats(db, user.id, task_list_id, status, priority),
+    )
 
-    # Base query - only tasks from user's task lists
-    base_query = (
-        db.query(TaskModel)
-        .join(TaskListModel)
-        .filter(TaskListModel.owner_id == user.id)
+
+def _task_event_dto(task_event) -> TaskEventDTO:
+    return TaskEventDTO(
+        id=task_event.id,
+        task_id=task_event.task_id,
+        task_list_id=task_event.task_list_id,
+        event_type=task_event.event_type,
+        from_value=task_event.from_value,
+        to_value=task_event.to_value,
+        occurred_at=task_event.occurred_at,
+    )
+
+
+# Opaque cursors over (occurred_at, id) for paging through the event log
+TASK_EVENT_ORDER = KeysetOrder(
+    "task_events", (TaskEventModel.occurred_at, TaskEventModel.id)
+)
+
+
+@router.get("/events", response_model=TaskEventPageDTO)
+def get_task_events(
+    since: Optional[datetime] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+    after: Optional[str] = Query(None, description="Cursor of the previous page"),
+):
+    """Status, assignment and lifecycle events of the user's tasks after `since`"""
+    position = None
+    if after is not None:
+        try:
+            position = TASK_EVENT_ORDER.decode_cursor(after)
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=e.message)
+
+    # One extra row tells whether another page follows
+    rows = events_for_owner(db, user.id, since, limit + 1, after=position)
+    task_events = rows[:limit]
+    cursor = after
+    if task_events:
+        cursor = TASK_EVENT_ORDER.encode_cursor(
+            TASK_EVENT_ORDER.values(task_events[-1])
+        )
+    return TaskEventPageDTO(
+        events=[_task_event_dto(task_event) for task_event in task_events],
+        cursor=cursor,
+        has_more=len(rows) > limit,
     )
 
+
+def _cached_completion_stats(
+    db: Session,
+    owner_id: int,
+    task_list_id: Optional[int],
+    status: Optional[TaskStatus],
+    priority: Optional[TaskPriority],
+) -> CompletionStatsDTO:
+    """Only cached when versions are shared by every worker (the database)"""
+    if response_cache.versions is None:
+        return _completion_stats(db, owner_id, task_list_id, status, priority)
+
+    key = f"rest:stats:{owner_id}:{task_list_id}:{status}:{priority}"
+    cached = response_cache.get(key)
+    if cached is not None:
+        return CompletionStatsDTO(**cached)
+    # Read before computing, so a concurrent write leaves the entry stale
+    versions = response_cache.tag_versions([owner_scope(owner_id)])
+    stats = _completion_stats(db, owner_id, task_list_id, status, priority)
+    if versions is not None:
+        response_cache.set(key, stats.model_dump(), versions)
+    return stats
+
+
+def _completion_stats(
+    db: Session,
+    owner_id: int,
+    task_list_id: Optional[int],
+    status: Optional[TaskStatus],
+    priority: Optional[TaskPriority],
+) -> CompletionStatsDTO:
+    # Base query - only tasks from user's task lists
+    base_query = db.query(TaskModel).filter(TaskModel.owner_id == owner_id)
+
     # Apply filters
     if task_list_id:
         base_query = base_query.filter(TaskModel.task_list_id == task_list_id)
@@ -173,30 +288,166 @@ def get_task_completion_stats(
     )
 
 
-@router.get("/", response_model=List[TaskResponseDTO])
-def get_tasks(
-    task_list_id: Optional[int] = Query(None),
-    status: Optional[TaskStatus] = Query(None),
-    priority: Optional[TaskPriority] = Query(None),
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
-):
-    # Join with UserModel to get assignee name
-    query = (
-        db.query(TaskModel, UserModel.full_name.label("assignee_name"))
-        .join(TaskListModel, TaskModel.task_list_id == TaskListModel.id)
-        .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
-        .filter(TaskListModel.owner_id == user.id)
+def _parse_fields(fields: Optional[str]) -> Optional[TaskProjection]:
+    """Projection for a `fields=` value; None when every field is wanted"""
+    if fields is None or not fields.strip():
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(requested) - TASK_FIELD_COLUMNS.keys())
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return TaskProjection(requested)
+
+
+def _task_payload(
+    task: TaskModel, assignee_name: Optional[str], projection: Optional[TaskProjection]
+) -> dict:
+    if projection is None:
+        return task_to_dict(task, assignee_name, _is_task_overdue(task))
+    return task_projection_to_dict(
+        task,
+        projection,
+        assignee_name,
+        projection.includes("is_overdue") and _is_task_overdue(task),
     )
 
+
+def _joins_assignee(
+    projection: Optional[TaskProjection], streaming: bool = False
+) -> bool:
+    """Whether the listing query joins users; the directory makes it unnecessary
+
+    Streamed listings always join: directory lookups on the session would
+    discard the rest of the open server-side cursor.
+    """
+    needs_name = projection is None or projection.needs_assignee_join
+    return needs_name and (streaming or not USER_DIRECTORY_ENABLED)
+
+
+def _with_assignee_names(
+    db: Session,
+    results,
+    projection: Optional[TaskProjection],
+    streaming: bool = False,
+):
+    if _joins_assignee(projection, streaming):
+        return results
+    if projection is None or projection.needs_assignee_join:
+        return with_assignee_names(db, results, STREAM_CHUNK_ROWS)
+    return ((task, None) for task in results)
+
+
+def _filter_tasks(query, task_list_id, status, priority, overdue):
     if task_list_id:
         query = query.filter(TaskModel.task_list_id == task_list_id)
     if status:
         query = query.filter(TaskModel.status == status)
     if priority:
         query = query.filter(TaskModel.priority == priority)
+    if overdue is not None:
+        # Evaluated by the database against the (owner_id, status, due_date) index
+        query = query.filter(TaskModel.is_overdue if overdue else ~TaskModel.is_overdue)
+    return query
+
+
+def _owned_tasks_query(db: Session, owner_id: int, projection, streaming: bool = False):
+    if _joins_assignee(projection, streaming):
+        # Join with UserModel to get assignee name
+        query = (
+            db.query(TaskModel, UserModel.full_name.label("assignee_name"))
+            .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
+            .filter(TaskModel.owner_id == owner_id)
+        )
+    else:
+        query = db.query(TaskModel).filter(TaskModel.owner_id == owner_id)
+    if projection is not None:
+        query = query.options(*projection.load_options())
+    return query
+
+
+def _tasks_by_ids(db: Session, query, ids: str, projection):
+    """The owner's tasks for `ids=` in one IN query; listing filters don't apply"""
+    try:
+        requested = parse_ids(ids)
+        lookup = unique_ids(requested)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+    rows = query.filter(TaskModel.id.in_(lookup)).all()
+    payloads = [
+        _task_payload(task, assignee_name, projection)
+        for task, assignee_name in _with_assignee_names(db, rows, projection)
+    ]
+    # Nulls don't fit the DTO, so this bypasses response_model
+    return fast_json_response(
+        in_request_order(requested, payloads, lambda payload: payload["id"])
+    )
+
+
+@router.get("/", response_model=List[TaskResponseDTO])
+def get_tasks(
+    task_list_id: Optional[int] = Query(None),
+    status: Optional[TaskStatus] = Query(None),
+    priority: Optional[TaskPriority] = Query(None),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+    fields: Optional[str] = Query(
+        None, description="Comma separated task fields to return, e.g. id,title"
+    ),
+    stream: Optional[Literal["json", "ndjson"]] = Query(
+        None, description="Stream the listing as a JSON array or NDJSON"
+    ),
+    conditional: ConditionalGet = Depends(),
+    overdue: Optional[bool] = Query(
+        None, description="Only overdue tasks (true) or only the rest (false)"
+    ),
+    sort: Optional[Literal["due_date", "priority", "created_at", "updated_at"]] = Query(
+        None, description="Sort server-side; priority sorts by severity"
+    ),
+    direction: Literal["asc", "desc"] = Query("asc"),
+    ids: Optional[str] = Query(
+        None,
+        description="Comma separated task ids; returns them in this order, "
+        "null where not found",
+    ),
+):
+    projection = _parse_fields(fields)
+    # Answers 304 before the listing query runs; a single-row read, never
+    # shared, so it always sees the caller's own committed writes
+    conditional.check(owner_change_version(db, user.id))
+
+    streaming = stream is not None
+    query = _owned_tasks_query(db, user.id, projection, streaming)
+    if ids is not None:
+        return _tasks_by_ids(db, query, ids, projection)
+
+    query = _filter_tasks(query, task_list_id, status, priority, overdue)
+    if sort is not None:
+        order = task_order(sort, descending=direction == "desc")
+        query = query.order_by(*order.order_by())
+
+    if streaming:
+        # Server-side cursor: rows are fetched in batches while the body is sent
+        rows = query.yield_per(STREAM_CHUNK_ROWS)
+        payloads = (
+            _task_payload(task, assignee_name, projection)
+            for task, assignee_name in _with_assignee_names(
+                db, rows, projection, streaming
+            )
+        )
+        return stream_json_response(payloads, stream)
 
     results = query.all()
+    if projection is not None or FAST_JSON_RESPONSES:
+        # Sparse objects don't fit the DTO, so they bypass response_model
+        return fast_json_response(
+            [
+                _task_payload(task, assignee_name, projection)
+                for task, assignee_name in _with_assignee_names(db, results, projection)
+            ]
+        )
     return [
         TaskResponseDTO(
             id=task.id,
@@ -212,7 +463,64 @@ def get_tasks(
             is_overdue=_is_task_overdue(task),
             assignee_name=assignee_name,
         )
-        for task, assignee_name in results
+        for task, assignee_name in _with_assignee_names(db, results, projection)
+    ]
+
+
+@router.get("/{task_id}", response_model=TaskResponseDTO)
+def get_task(
+    task_id: int,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+    conditional: ConditionalGet = Depends(),
+):
+    # Only the columns the ETag depends on, so a 304 skips the full load
+    version = (
+        db.query(TaskModel.updated_at, TaskModel.status, TaskModel.due_date)
+        .filter(TaskModel.id == task_id, TaskModel.owner_id == user.id)
+        .first()
+    )
+    if not version:
+        raise HTTPException(status_code=404, detail="Task not found")
+    conditional.check(task_id, version.updated_at, _is_task_overdue(version))
+
+    if USER_DIRECTORY_ENABLED:
+        task = db.query(TaskModel).filter(TaskModel.id == task_id).one()
+        assignee_name = _assignee_name(db, task.assigned_to)
+    else:
+        task, assignee_name = (
+            db.query(TaskModel, UserModel.full_name.label("assignee_name"))
+            .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
+            .filter(TaskModel.id == task_id)
+            .one()
+        )
+    return TaskResponseDTO(
+        id=task.id,
+        title=task.title,
+        description=task.description,
+        status=task.status,
+        priority=task.priority,
+        task_list_id=task.task_list_id,
+        assigned_to=task.assigned_to,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+        due_date=task.due_date,
+        is_overdue=_is_task_overdue(task),
+        assignee_name=assignee_name,
+    )
+
+
+@router.get("/{task_id}/events", response_model=List[TaskEventDTO])
+def get_task_history(
+    task_id: int,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """History of one task (also after it was deleted), oldest first"""
+    return [
+        _task_event_dto(task_event)
+        for task_event in events_for_task(db, task_id, user.id, limit)
     ]
 
 
@@ -223,12 +531,7 @@ async def update_task_status(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    task = (
-        db.query(TaskModel)
-        .join(TaskListModel)
-        .filter(TaskModel.id == task_id, TaskListModel.owner_id == user.id)
-        .first()
-    )
+    task = find_owned_task(db, task_id, user.id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
@@ -259,14 +562,8 @@ async def update_task_status(
                 )
 
     # Query with assignee name
-    result = (
-        db.query(TaskModel, UserModel.full_name.label("assignee_name"))
-        .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
-        .filter(TaskModel.id == task.id)
-        .first()
-    )
-
-    updated_task, assignee_name = result if result else (task, None)
+    updated_task, assignee_name = _reload_with_assignee_name(db, task)
+    publish_task_change(ChangeAction.UPDATED, updated_task, user.id, assignee_name)
 
     return TaskResponseDTO(
         id=updated_task.id,
@@ -289,19 +586,16 @@ def delete_task(
     task_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)
 ):
     """Delete a specific task"""
-    task = (
-        db.query(TaskModel)
-        .join(TaskListModel)
-        .filter(TaskModel.id == task_id, TaskListModel.owner_id == user.id)
-        .first()
-    )
+    task = find_owned_task(db, task_id, user.id)
 
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
     task_title = task.title
+    task_list_id = task.task_list_id
     db.delete(task)
     db.commit()
+    publish_task_deleted(task_id, task_list_id, user.id)
 
     return {"message": f"Task '{task_title}' deleted successfully"}
 
@@ -314,12 +608,7 @@ def update_task(
     user=Depends(get_current_user),
 ):
     """Update a task completely"""
-    task = (
-        db.query(TaskModel)
-        .join(TaskListModel)
-        .filter(TaskModel.id == task_id, TaskListModel.owner_id == user.id)
-        .first()
-    )
+    task = find_owned_task(db, task_id, user.id)
 
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -340,14 +629,8 @@ def update_task(
     db.refresh(task)
 
     # Query with assignee name
-    result = (
-        db.query(TaskModel, UserModel.full_name.label("assignee_name"))
-        .outerjoin(UserModel, TaskModel.assigned_to == UserModel.id)
-        .filter(TaskModel.id == task.id)
-        .first()
-    )
-
-    updated_task, assignee_name = result if result else (task, None)
+    updated_task, assignee_name = _reload_with_assignee_name(db, task)
+    publish_task_change(ChangeAction.UPDATED, updated_task, user.id, assignee_name)
 
     return TaskResponseDTO(
         id=updated_task.id,
@@ -1,9 +1,14 @@
 import os
+from types import SimpleNamespace
 
 import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from src.application.auth_service import get_current_user
 from src.infrastructure.database import Base
 from src.presentation.dependencies import get_db
 from src.presentation.main import app
@@ -72,3 +77,47 @@ def clean_database(setup_test_database):
             db.commit()
     except Exception:
         pass  # Si falla, continuar
+
+
+@pytest.fixture
+def sqlite_engine():
+    """SQLite en memoria con todas las tablas, una por test"""
+    # StaticPool: todas las sesiones (y el TestClient) comparten la conexión
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sqlite_sessionmaker(sqlite_engine):
+    """Sessionmaker sobre `sqlite_engine`; cada módulo añade sus datos"""
+    return sessionmaker(bind=sqlite_engine)
+
+
+@pytest.fixture
+def make_client(sqlite_sessionmaker):
+    """Fábrica de TestClient: app con los routers dados sobre `sqlite_engine`
+
+    Por defecto autentica como el usuario 1; con `user_id=None` deja la
+    autenticación real.
+    """
+
+    def get_db():
+        with sqlite_sessionmaker() as session:
+            yield session
+
+    def make(*routers, user_id=1):
+        app = FastAPI()
+        for module in routers:
+            app.include_router(module.router)
+            if hasattr(module, "get_db"):
+                app.dependency_overrides[module.get_db] = get_db
+        if user_id is not None:
+            user = SimpleNamespace(id=user_id)
+            app.dependency_overrides[get_current_user] = lambda: user
+        return TestClient(app)
+
+    return make
@@ -0,0 +1,112 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.application import auth_service
+from src.application.dto import BatchSubRequestDTO
+from src.infrastructure import auth
+from src.infrastructure.auth import create_access_token
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.presentation.routers import auth as auth_router
+from src.presentation.routers import batch, task_lists, tasks
+
+
+@pytest.fixture
+def Session(sqlite_sessionmaker):
+    with sqlite_sessionmaker() as db:
+        db.add(UserModel(id=1, email="one@example.com", hashed_password="x"))
+        db.flush()
+        db.add(TaskListModel(id=1, name="List", owner_id=1))
+        db.flush()
+        db.add(TaskModel(id=1, title="Task", task_list_id=1))
+        db.commit()
+    return sqlite_sessionmaker
+
+
+@pytest.fixture
+def client(Session, monkeypatch, make_client):
+    monkeypatch.setattr(auth_service, "SessionLocal", Session)
+    client = make_client(auth_router, task_lists, tasks, batch, user_id=None)
+    client.headers["Authorization"] = "Bearer " + create_access_token({"sub": "1"})
+    return client
+
+
+def test_startup_calls_in_one_request(client):
+    with patch.object(
+        auth, "decode_access_token", wraps=auth.decode_access_token
+    ) as decode:
+        response = client.post(
+            "/api/batch",
+            json={
+                "requests": [
+                    {"id": "me", "path": "/api/auth/me"},
+                    {"id": "lists", "path": "/api/task-lists/"},
+                    {"id": "tasks", "path": "/api/tasks/?fields=id,title"},
+                    {"id": "stats", "path": "/api/tasks/stats"},
+                ]
+            },
+        )
+
+    assert response.status_code == 200
+    responses = {item["id"]: item for item in response.json()["responses"]}
+    assert list(responses) == ["me", "lists", "tasks", "stats"]
+    assert responses["me"]["body"]["email"] == "one@example.com"
+    assert [task_list["id"] for task_list in responses["lists"]["body"]] == [1]
+    assert responses["tasks"]["body"] == [{"id": 1, "title": "Task"}]
+    assert responses["stats"]["body"]["total_tasks"] == 1
+    # Sub-requests reuse the batch's authentication
+    assert decode.call_count == 1
+
+
+def test_writes_keep_their_order_and_errors_stay_per_request(client):
+    response = client.post(
+        "/api/batch",
+        json={
+            "requests": [
+                {
+                    "method": "POST",
+                    "path": "/api/tasks/",
+                    "body": {"title": "New", "task_list_id": 1},
+                },
+                {"path": "/api/tasks/?fields=id"},
+                {"path": "/api/tasks/999"},
+                {"method": "POST", "path": "/api/tasks/", "body": {"title": ""}},
+                {"path": "/api/batch"},
+            ]
+        },
+    )
+
+    statuses = [item["status"] for item in response.json()["responses"]]
+    assert statuses == [200, 200, 404, 422, 400]
+    assert response.json()["responses"][1]["body"] == [{"id": 1}, {"id": 2}]
+
+
+def test_batches_are_authenticated_and_bounded(client, monkeypatch):
+    monkeypatch.setattr(batch, "BATCH_MAX_REQUESTS", 2)
+    too_many = {"requests": [{"path": "/api/tasks/"}] * 3}
+    assert client.post("/api/batch", json=too_many).status_code == 400
+    assert (
+        client.post("/api/batch", json={"requests": [{"path": "/metrics"}]}).status_code
+        == 422
+    )
+
+    del client.headers["Authorization"]
+    assert (
+        client.post(
+            "/api/batch", json={"requests": [{"path": "/api/tasks/"}]}
+        ).status_code
+        == 403
+    )
+
+
+def test_consecutive_reads_are_grouped():
+    requests = [
+        BatchSubRequestDTO(method=method, path="/api/tasks/")
+        for method in ("GET", "GET", "DELETE", "GET", "PUT", "PUT")
+    ]
+
+    groups = [
+        [sub_request.method for sub_request in group]
+        for group in batch._groups(requests)
+    ]
+    assert groups == [["GET", "GET"], ["DELETE"], ["GET"], ["PUT"], ["PUT"]]
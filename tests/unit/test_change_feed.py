@@ -0,0 +1,253 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.application import change_feed
+from src.application.change_feed import decode_cursor, read_changes
+from src.domain.exceptions import ValidationError
+from src.infrastructure.cache import LRUCache, TaggedCache
+from src.infrastructure.database import (
+    DeletedRecordModel,
+    TaskListModel,
+    TaskModel,
+    UserModel,
+)
+from src.infrastructure.tombstones import prune_tombstones
+from src.presentation.graphql.schema import schema
+from src.presentation.routers import changes
+
+T0 = datetime(2026, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def no_settle_window(monkeypatch):
+    monkeypatch.setattr(change_feed, "CHANGE_FEED_SETTLE_SECONDS", 0)
+
+
+@pytest.fixture
+def Session(sqlite_sessionmaker):
+    with sqlite_sessionmaker() as db:
+        db.add_all(
+            [
+                UserModel(id=1, email="one@example.com", hashed_password="x"),
+                UserModel(
+                    id=2, email="two@example.com", full_name="Two", hashed_password="x"
+                ),
+            ]
+        )
+        db.flush()
+        db.add_all(
+            [
+                TaskListModel(id=1, name="One's", owner_id=1, updated_at=T0),
+                TaskListModel(id=2, name="Two's", owner_id=2, updated_at=T0),
+            ]
+        )
+        db.flush()
+        db.add_all(
+            [
+                TaskModel(id=1, title="A", task_list_id=1, updated_at=T0),
+                TaskModel(
+                    id=2, title="B", task_list_id=1, updated_at=T0, assigned_to=2
+                ),
+                TaskModel(id=3, title="C", task_list_id=2, updated_at=T0),
+            ]
+        )
+        db.commit()
+    return sqlite_sessionmaker
+
+
+def _sync(db, owner_id, since=None, limit=None):
+    page = read_changes(db, owner_id, since, limit)
+    return (
+        {
+            "task_lists": [task_list.id for task_list, _, _ in page.task_lists],
+            "tasks": [task.id for task, _ in page.tasks],
+            "deleted": [(record.entity, record.entity_id) for record in page.deleted],
+        },
+        page,
+    )
+
+
+def test_first_sync_returns_everything_then_only_changes(Session):
+    with Session() as db:
+        changed, page = _sync(db, 1)
+        assert changed == {"task_lists": [1], "tasks": [1, 2], "deleted": []}
+        assert page.task_lists[0][1:] == (2, 0)
+        assert page.tasks[1][1] == "Two"
+        assert not page.has_more
+
+        assert _sync(db, 1, page.cursor)[0] == {
+            "task_lists": [],
+            "tasks": [],
+            "deleted": [],
+        }
+        idle = _sync(db, 1, page.cursor)[1].cursor
+        assert decode_cursor(idle).position == decode_cursor(page.cursor).position
+
+        db.get(TaskModel, 2).title = "B2"
+        db.commit()
+        assert _sync(db, 1, page.cursor)[0]["tasks"] == [2]
+
+
+def test_deletions_leave_tombstones(Session):
+    with Session() as db:
+        cursor = _sync(db, 1)[1].cursor
+        db.delete(db.get(TaskModel, 1))
+        db.commit()
+        changed, page = _sync(db, 1, cursor)
+        assert changed["deleted"] == [("task", 1)]
+
+        # Deleting a list cascades to its tasks, each with a tombstone
+        db.delete(db.get(TaskListModel, 1))
+        db.commit()
+        assert sorted(_sync(db, 1, page.cursor)[0]["deleted"]) == [
+            ("task", 2),
+            ("task_list", 1),
+        ]
+        assert _sync(db, 2, None)[0]["deleted"] == []
+
+
+def test_expired_tombstones_are_pruned_and_older_cursors_resync(Session):
+    with Session() as db:
+        db.delete(db.get(TaskModel, 1))
+        db.commit()
+        cursor = _sync(db, 1)[1].cursor
+    assert prune_tombstones(Session) == 0
+
+    later = datetime.utcnow() + timedelta(days=31)
+    assert prune_tombstones(Session, now=later) == 1
+    with Session() as db:
+        assert db.query(DeletedRecordModel).count() == 0
+        page = read_changes(db, 1, cursor, now=later)
+        # The deletion can't be replayed any more: start over from scratch
+        assert page.resync
+        assert [task.id for task, _ in page.tasks] == [2]
+        assert not read_changes(db, 1, page.cursor, now=later).resync
+
+
+def test_clients_that_keep_syncing_never_resync(Session):
+    # The owner's data last changed long ago, but the client kept reading
+    with Session() as db:
+        cursor = _sync(db, 1)[1].cursor
+        for days in (20, 40, 60):
+            page = read_changes(
+                db, 1, cursor, now=datetime.utcnow() + timedelta(days=days)
+            )
+            assert not page.resync
+            assert page.tasks == []
+            cursor = page.cursor
+        assert read_changes(
+            db, 1, cursor, now=datetime.utcnow() + timedelta(days=100)
+        ).resync
+
+
+def test_transfers_move_the_data_between_feeds(Session):
+    with Session() as db:
+        one, two = _sync(db, 1)[1].cursor, _sync(db, 2)[1].cursor
+        db.get(TaskListModel, 1).owner_id = 2
+        db.commit()
+
+        assert _sync(db, 1, one)[0]["deleted"] == [("task_list", 1)]
+        changed = _sync(db, 2, two)[0]
+        assert changed["task_lists"] == [1]
+        assert changed["tasks"] == [1, 2]
+
+        # Moved back: the tombstone is superseded by the list itself
+        db.get(TaskListModel, 1).owner_id = 1
+        db.commit()
+        assert _sync(db, 1, one)[0] == {
+            "task_lists": [1],
+            "tasks": [1, 2],
+            "deleted": [],
+        }
+
+
+def test_pages_through_ties_without_gaps_or_repeats(Session):
+    with Session() as db:
+        db.add_all(
+            [
+                TaskModel(id=id, title=str(id), task_list_id=1, updated_at=T0)
+                for id in range(4, 9)
+            ]
+        )
+        db.add(
+            DeletedRecordModel(entity="task", entity_id=99, owner_id=1, deleted_at=T0)
+        )
+        db.commit()
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            changed, page = _sync(db, 1, cursor, limit=2)
+            seen += [("list", id) for id in changed["task_lists"]]
+            seen += [("task", id) for id in changed["tasks"]]
+            seen += [("deleted", id) for _, id in changed["deleted"]]
+            cursor, pages = page.cursor, pages + 1
+            if not page.has_more:
+                break
+
+    assert seen == [("list", 1)] + [("task", id) for id in (1, 2, 4, 5, 6, 7, 8)] + [
+        ("deleted", 99)
+    ]
+    assert pages == 5
+
+
+def test_recent_changes_wait_for_the_settle_window(Session, monkeypatch):
+    monkeypatch.setattr(change_feed, "CHANGE_FEED_SETTLE_SECONDS", 60)
+    with Session() as db:
+        db.get(TaskModel, 1).title = "Now"
+        db.commit()
+
+        assert _sync(db, 1)[0]["tasks"] == [2]
+        later = read_changes(db, 1, now=datetime.utcnow() + timedelta(minutes=2))
+        assert [task.id for task, _ in later.tasks] == [2, 1]
+
+
+def test_invalid_cursors_are_rejected(Session):
+    with Session() as db:
+        with pytest.raises(ValidationError):
+            read_changes(db, 1, "not-a-cursor")
+        with pytest.raises(ValidationError):
+            read_changes(db, 1, None, limit=0)
+
+
+def test_rest_endpoint(Session, make_client):
+    client = make_client(changes)
+
+    feed = client.get("/api/changes").json()
+    assert [task_list["id"] for task_list in feed["task_lists"]] == [1]
+    assert feed["task_lists"][0]["task_count"] == 2
+    assert [task["assignee_name"] for task in feed["tasks"]] == [None, "Two"]
+
+    with Session() as db:
+        db.delete(db.get(TaskModel, 1))
+        db.commit()
+    delta = client.get("/api/changes", params={"since": feed["cursor"]}).json()
+    assert delta["tasks"] == []
+    assert delta["deleted"][0]["entity"] == "task"
+    assert delta["deleted"][0]["id"] == 1
+    assert delta["deleted"][0]["task_list_id"] == 1
+    assert client.get("/api/changes?since=bogus").status_code == 400
+
+
+def test_graphql_changes_bypass_the_response_cache(Session):
+    db = Session()
+    db.close = lambda: None
+    query = "{ changes { cursor hasMore tasks { id } deleted { entity id } } }"
+    context = {"user": MagicMock(id=1)}
+    tagged = TaggedCache(LRUCache(max_entries=10, ttl=60))
+    resolvers = "src.presentation.graphql.resolvers.change_resolvers"
+    with patch(f"{resolvers}.get_db", return_value=db), patch(
+        f"{resolvers}.require_auth", return_value=MagicMock(id=1)
+    ), patch("src.presentation.graphql.response_cache.response_cache", tagged), patch(
+        "src.presentation.graphql.response_cache.RESPONSE_CACHE_ENABLED", True
+    ):
+        first = schema.execute_sync(query, context_value=context)
+        db.delete(db.get(TaskModel, 2))
+        db.commit()
+        second = schema.execute_sync(query, context_value=context)
+
+    assert first.errors is None
+    assert [task["id"] for task in first.data["changes"]["tasks"]] == [1, 2]
+    assert [task["id"] for task in second.data["changes"]["tasks"]] == [1]
+    assert second.data["changes"]["deleted"] == [{"entity": "task", "id": 2}]
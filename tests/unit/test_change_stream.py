@@ -0,0 +1,114 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from src.application.change_stream import (
+    HEARTBEAT_FRAME,
+    RESET_FRAME,
+    ChangeStream,
+    format_event,
+)
+from src.application.events import ChangeAction, ChangeEntity, ChangeEvent
+from src.presentation.compression import _is_compressible
+from src.presentation.routers import stream
+
+
+def _change(owner_id, task_id=1, action=ChangeAction.UPDATED):
+    return ChangeEvent(
+        ChangeEntity.TASK, action, task_id, 1, owner_id, data={"id": task_id}
+    )
+
+
+@pytest.mark.asyncio
+async def test_events_reach_only_the_owner():
+    change_stream = ChangeStream(max_connections=10, queue_size=10, buffer_size=10)
+    mine = change_stream.subscribe(1)
+    other = change_stream.subscribe(2)
+
+    event = change_stream.publish(_change(1))
+    await asyncio.sleep(0)
+
+    assert mine.drain() == [event]
+    assert other.drain() == []
+    assert format_event(event) == (
+        f"id: {event.id}\nevent: task.updated\n".encode()
+        + b'data: {"entity":"task","action":"updated","id":1,"task_list_id":1,'
+        + b'"data":{"id":1}}\n\n'
+    )
+
+
+def test_replay_from_the_recent_buffer():
+    change_stream = ChangeStream(max_connections=10, queue_size=10, buffer_size=3)
+    first = change_stream.publish(_change(1, 1))
+    second = change_stream.publish(_change(2, 2))
+    third = change_stream.publish(_change(1, 3))
+
+    assert change_stream.replay(1, first.id) == [third]
+    assert change_stream.replay(1, third.id) == []
+    # Issued by another worker or before a restart
+    assert change_stream.replay(1, "elsewhere-1") is None
+    assert change_stream.replay(1, "garbage") is None
+
+    change_stream.publish(_change(1, 4))
+    change_stream.publish(_change(1, 5))
+    # The event right after `first` fell out of the buffer
+    assert change_stream.replay(1, first.id) is None
+    assert [event.seq for event in change_stream.replay(1, second.id)] == [3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_then_follows_live_events():
+    change_stream = ChangeStream(max_connections=10, queue_size=10, buffer_size=10)
+    subscription = change_stream.subscribe(1)
+    missed = change_stream.publish(_change(1, 1))
+    frames = stream.event_stream(subscription, [missed], heartbeat=0.01)
+
+    assert await frames.__anext__() == stream.RETRY_FRAME
+    assert await frames.__anext__() == format_event(missed)
+    # Already replayed, so the queued copy is skipped
+    assert await frames.__anext__() == HEARTBEAT_FRAME
+    live = change_stream.publish(_change(1, 2))
+    assert await frames.__anext__() == format_event(live)
+
+    await frames.aclose()
+    assert change_stream.connection_count == 0
+
+
+@pytest.mark.asyncio
+async def test_unreplayable_and_lagging_clients_are_told_to_resync():
+    change_stream = ChangeStream(max_connections=10, queue_size=1, buffer_size=10)
+    subscription = change_stream.subscribe(1)
+    frames = stream.event_stream(subscription, None, heartbeat=1)
+
+    assert await frames.__anext__() == stream.RETRY_FRAME
+    assert await frames.__anext__() == RESET_FRAME
+
+    change_stream.publish(_change(1, 1))
+    latest = change_stream.publish(_change(1, 2))
+    await asyncio.sleep(0)
+    assert await frames.__anext__() == RESET_FRAME
+    assert await frames.__anext__() == format_event(latest)
+    await frames.aclose()
+
+
+@pytest.mark.asyncio
+async def test_endpoint_caps_connections(monkeypatch):
+    change_stream = ChangeStream(max_connections=1, queue_size=10, buffer_size=10)
+    monkeypatch.setattr(stream, "change_stream", change_stream)
+    user = SimpleNamespace(id=1)
+
+    response = await stream.stream_changes(last_event_id=None, current_user=user)
+    assert response.media_type == "text/event-stream"
+    with pytest.raises(HTTPException) as error:
+        await stream.stream_changes(last_event_id=None, current_user=user)
+    assert error.value.status_code == 503
+
+    await response.background()
+    assert change_stream.connection_count == 0
+
+
+def test_event_streams_are_not_compressed():
+    assert not _is_compressible("text/event-stream; charset=utf-8")
+    assert _is_compressible("text/plain")
@@ -0,0 +1,134 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.dialects import mysql
+
+from src.domain.entities import TaskStatus
+from src.infrastructure.cache import LRUCache, TaggedCache
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.infrastructure.versioning import (
+    DatabaseVersionStore,
+    _increment_statement,
+    read_versions,
+)
+from src.presentation.routers import tasks
+
+
+@pytest.fixture
+def Session(sqlite_sessionmaker):
+    with sqlite_sessionmaker() as db:
+        owner = UserModel(email="owner@example.com", hashed_password="x")
+        db.add(owner)
+        db.flush()
+        db.add_all(
+            [
+                TaskListModel(id=1, name="First", owner_id=owner.id),
+                TaskListModel(id=2, name="Second", owner_id=owner.id),
+            ]
+        )
+        db.flush()
+        db.add(TaskModel(id=1, title="Task", task_list_id=1))
+        db.commit()
+    return sqlite_sessionmaker
+
+
+def _versions(Session, *scopes):
+    with Session() as db:
+        return read_versions(db, scopes)
+
+
+def test_writes_bump_owner_and_list_in_the_same_transaction(Session):
+    before = _versions(Session, "owner:1", "task_list:1", "task_list:2")
+
+    with Session() as db:
+        db.get(TaskModel, 1).status = TaskStatus.COMPLETED
+        db.commit()
+
+    after = _versions(Session, "owner:1", "task_list:1", "task_list:2")
+    assert after["owner:1"] == before["owner:1"] + 1
+    assert after["task_list:1"] == before["task_list:1"] + 1
+    assert after["task_list:2"] == before["task_list:2"]
+
+
+def test_rollback_discards_the_bump(Session):
+    before = _versions(Session, "owner:1")
+
+    with Session() as db:
+        db.get(TaskModel, 1).title = "Not saved"
+        db.flush()
+        db.rollback()
+
+    assert _versions(Session, "owner:1") == before
+
+
+def test_moving_a_task_bumps_both_lists(Session):
+    before = _versions(Session, "task_list:1", "task_list:2")
+
+    with Session() as db:
+        db.get(TaskModel, 1).task_list_id = 2
+        db.commit()
+
+    after = _versions(Session, "task_list:1", "task_list:2")
+    assert after == {key: value + 1 for key, value in before.items()}
+
+
+def test_deleting_a_list_bumps_its_owner(Session):
+    before = _versions(Session, "owner:1")
+
+    with Session() as db:
+        db.delete(db.get(TaskListModel, 1))
+        db.commit()
+
+    assert _versions(Session, "owner:1")["owner:1"] == before["owner:1"] + 1
+
+
+def test_user_changes_bump_the_user_scope(Session):
+    with Session() as db:
+        db.get(UserModel, 1).full_name = "Renamed"
+        db.commit()
+
+    assert _versions(Session, "user:1")["user:1"] >= 1
+
+
+def test_caches_in_other_workers_see_the_write(Session):
+    # Two workers: separate LRUs, same database
+    worker_a = TaggedCache(LRUCache(), versions=DatabaseVersionStore(Session))
+    worker_b = TaggedCache(LRUCache(), versions=DatabaseVersionStore(Session))
+    worker_a.set("stats", {"total": 1}, worker_a.tag_versions(["owner:1"]))
+    assert worker_a.get("stats") == {"total": 1}
+
+    with Session() as db:
+        db.add(TaskModel(title="Written by worker B", task_list_id=1))
+        db.commit()
+    worker_b.invalidate("owner:1")
+
+    assert worker_a.get("stats") is None
+
+
+def test_stats_are_cached_and_invalidated(Session, monkeypatch, make_client):
+    monkeypatch.setattr(
+        tasks,
+        "response_cache",
+        TaggedCache(LRUCache(), versions=DatabaseVersionStore(Session)),
+    )
+
+    client = make_client(tasks)
+
+    assert client.get("/api/tasks/stats").json()["total_tasks"] == 1
+    with Session() as db:
+        # Core insert: no ORM flush, so no version bump and a cache hit
+        db.execute(insert(TaskModel).values(title="Raw", task_list_id=1))
+        db.commit()
+    assert client.get("/api/tasks/stats").json()["total_tasks"] == 1
+
+    with Session() as db:
+        db.add(TaskModel(title="Another", task_list_id=2))
+        db.commit()
+
+    assert client.get("/api/tasks/stats").json()["total_tasks"] == 3
+
+
+def test_mysql_upsert_increments():
+    statement = _increment_statement("mysql", ["owner:1"])
+    sql = str(statement.compile(dialect=mysql.dialect()))
+
+    assert "ON DUPLICATE KEY UPDATE version = (change_versions.version + %s)" in sql
@@ -0,0 +1,121 @@
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.presentation.compression import (
+    CompressionMiddleware,
+    compressed_bytes,
+    parse_accept_encoding,
+)
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=100, encodings=["gzip"])
+
+
+@app.get("/large")
+def large():
+    return {"items": ["task description " * 4] * 50}
+
+
+@app.get("/tagged")
+def tagged():
+    return JSONResponse(
+        {"items": ["task description " * 4] * 50}, headers={"ETag": '"abc"'}
+    )
+
+
+@app.get("/small")
+def small():
+    return {"ok": True}
+
+
+@app.get("/stream")
+def stream():
+    def rows():
+        yield b"["
+        for index in range(100):
+            yield (b"," if index else b"") + b'{"title": "streamed task"}'
+        yield b"]"
+
+    return StreamingResponse(rows(), media_type="application/json")
+
+
+@app.get("/binary")
+def binary():
+    return StreamingResponse(iter([b"\x00" * 500]), media_type="image/png")
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_large_json_is_gzipped(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < 500
+    assert len(response.json()["items"]) == 50
+
+
+def test_compressed_responses_weaken_strong_etags(client):
+    compressed = client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/tagged", headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["etag"] == 'W/"abc"'
+    assert identity.headers["etag"] == '"abc"'
+
+
+def test_small_responses_are_left_alone(client):
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"ok": True}
+
+
+def test_identity_when_client_does_not_accept(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip;q=0"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_non_compressible_types_are_skipped(client):
+    response = client.get("/binary", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_streaming_response_is_compressed_incrementally(client):
+    with client.stream(
+        "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    body = zlib.decompress(raw, 31)
+    assert body.startswith(b'[{"title"') and body.endswith(b"}]")
+
+
+def test_compression_metrics_are_recorded_per_route(client):
+    labels = {"route": "/large", "encoding": "gzip"}
+    before = compressed_bytes.value({**labels, "stage": "original"})
+
+    client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    original = compressed_bytes.value({**labels, "stage": "original"})
+    compressed = compressed_bytes.value({**labels, "stage": "compressed"})
+    assert original > before
+    assert 0 < compressed < original
+
+
+def test_parse_accept_encoding_qualities():
+    assert parse_accept_encoding("gzip;q=0.5, br, *;q=0") == {
+        "gzip": 0.5,
+        "br": 1.0,
+        "*": 0.0,
+    }
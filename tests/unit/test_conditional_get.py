@@ -0,0 +1,107 @@
+import pytest
+from sqlalchemy import event
+
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.presentation.conditional import etag_matches
+from src.presentation.routers import task_lists, tasks
+
+
+@pytest.fixture
+def client(sqlite_engine, sqlite_sessionmaker, make_client):
+    db = sqlite_sessionmaker()
+    user = UserModel(email="owner@example.com", full_name="Owner", hashed_password="x")
+    db.add(user)
+    db.flush()
+    task_list = TaskListModel(name="List", owner_id=user.id)
+    db.add(task_list)
+    db.flush()
+    db.add_all(
+        TaskModel(title=f"Task {index}", task_list_id=task_list.id)
+        for index in range(3)
+    )
+    db.commit()
+    db.close()
+
+    test_client = make_client(tasks, task_lists)
+    test_client.statements = []
+    event.listen(
+        sqlite_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: test_client.statements.append(statement),
+    )
+    return test_client
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/tasks/", "/api/tasks/1", "/api/task-lists/", "/api/task-lists/1"]
+)
+def test_matching_etag_returns_304(client, path):
+    first = client.get(path)
+    etag = first.headers["etag"]
+
+    second = client.get(path, headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert first.headers["vary"] == second.headers["vary"] == "Accept"
+
+
+def test_collection_304_skips_the_listing_query(client):
+    etag = client.get("/api/tasks/").headers["etag"]
+    client.statements.clear()
+
+    client.get("/api/tasks/", headers={"If-None-Match": etag})
+
+    assert not any("tasks.title" in statement for statement in client.statements)
+
+
+def test_changes_invalidate_the_etag(client):
+    etag = client.get("/api/task-lists/").headers["etag"]
+
+    client.delete("/api/tasks/3")
+
+    response = client.get("/api/task-lists/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_only_reads_at_the_same_version_are_shared(client, monkeypatch):
+    keys = []
+    original = task_lists.read_coalescer.do
+
+    def do(group, key, load):
+        keys.append((group, key))
+        return original(group, key, load)
+
+    monkeypatch.setattr(task_lists.read_coalescer, "do", do)
+    client.get("/api/task-lists/")
+    client.delete("/api/tasks/3")
+    client.get("/api/task-lists/")
+
+    # The version read itself is never shared; the list query is per version
+    assert [group for group, _ in keys] == ["task_lists", "task_lists"]
+    assert keys[0][1] != keys[1][1]
+
+
+def test_etag_depends_on_the_representation(client):
+    json_etag = client.get("/api/tasks/1").headers["etag"]
+    msgpack_etag = client.get(
+        "/api/tasks/1", headers={"Accept": "application/msgpack"}
+    ).headers["etag"]
+
+    assert json_etag != msgpack_etag
+
+
+def test_missing_task_is_404(client):
+    assert client.get("/api/tasks/99").status_code == 404
+
+
+def test_etag_matches():
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
@@ -0,0 +1,197 @@
+import pytest
+from sqlalchemy import event
+
+from src.domain.entities import Task, TaskList, User
+from src.infrastructure import entity_cache as entity_cache_module
+from src.infrastructure.database import UserModel
+from src.infrastructure.entity_cache import (
+    CachedTaskListRepository,
+    CachedTaskRepository,
+    CachedUserRepository,
+    EntityCache,
+    load_user,
+)
+
+
+class FakeRepository:
+    """In-memory stand-in that counts reads"""
+
+    def __init__(self, entities=()):
+        self.entities = {entity.id: entity for entity in entities}
+        self.reads = 0
+
+    async def get_by_id(self, entity_id):
+        self.reads += 1
+        entity = self.entities.get(entity_id)
+        return entity.model_copy(deep=True) if entity else None
+
+    async def get_by_email(self, email):
+        self.reads += 1
+        return next(
+            (user for user in self.entities.values() if user.email == email), None
+        )
+
+    async def create(self, entity):
+        entity = entity.model_copy(update={"id": len(self.entities) + 1})
+        self.entities[entity.id] = entity
+        return entity
+
+    async def update(self, entity):
+        self.entities[entity.id] = entity
+        return entity
+
+    async def delete(self, entity_id):
+        return self.entities.pop(entity_id, None) is not None
+
+    async def get_by_owner(self, owner_id):
+        return [entity for entity in self.entities.values()]
+
+
+@pytest.fixture
+def cache():
+    return EntityCache(max_entries=2, ttls={"task": 30}, negative_ttl=30)
+
+
+def _task(task_id=1, title="Task"):
+    return Task(id=task_id, title=title, task_list_id=1)
+
+
+@pytest.mark.asyncio
+async def test_read_through_hits_and_copies(cache):
+    backend = FakeRepository([_task()])
+    repository = CachedTaskRepository(backend, cache)
+
+    first = await repository.get_by_id(1)
+    first.title = "mutated by caller"
+    second = await repository.get_by_id(1)
+
+    assert backend.reads == 1
+    assert second.title == "Task"
+    assert cache.stats()["hit"] == 1
+
+
+@pytest.mark.asyncio
+async def test_misses_are_cached(cache):
+    backend = FakeRepository()
+    repository = CachedTaskRepository(backend, cache)
+
+    assert await repository.get_by_id(99) is None
+    assert await repository.get_by_id(99) is None
+
+    assert backend.reads == 1
+    assert cache.stats()["negative_hit"] == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_task_and_list(cache):
+    backend = FakeRepository([_task()])
+    repository = CachedTaskRepository(backend, cache)
+    list_backend = FakeRepository([TaskList(id=1, name="List", owner_id=1)])
+    task_lists = CachedTaskListRepository(list_backend, cache)
+    await repository.get_by_id(1)
+    await task_lists.get_by_id(1)
+
+    await repository.update(_task(title="Renamed"))
+
+    assert (await repository.get_by_id(1)).title == "Renamed"
+    await task_lists.get_by_id(1)
+    assert list_backend.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_create_replaces_a_negative_entry(cache):
+    backend = FakeRepository()
+    repository = CachedUserRepository(backend, cache)
+    assert await repository.get_by_email("new@example.com") is None
+
+    await repository.create(User(email="new@example.com", hashed_password="x"))
+
+    assert (await repository.get_by_email("new@example.com")).id == 1
+
+
+@pytest.mark.asyncio
+async def test_email_change_drops_the_old_email(cache):
+    backend = FakeRepository([User(id=1, email="old@example.com", hashed_password="x")])
+    repository = CachedUserRepository(backend, cache)
+    await repository.get_by_email("old@example.com")
+
+    await repository.update(User(id=1, email="new@example.com", hashed_password="x"))
+
+    assert await repository.get_by_email("old@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates(cache):
+    repository = CachedTaskRepository(FakeRepository([_task()]), cache)
+    await repository.get_by_id(1)
+
+    assert await repository.delete(1) is True
+    assert await repository.get_by_id(1) is None
+
+
+@pytest.mark.asyncio
+async def test_bounded_size_counts_evictions(cache):
+    repository = CachedTaskRepository(
+        FakeRepository([_task(1), _task(2), _task(3)]), cache
+    )
+
+    for task_id in (1, 2, 3):
+        await repository.get_by_id(task_id)
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hit_ratio"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_uncached_methods_are_delegated(cache):
+    repository = CachedTaskRepository(FakeRepository([_task()]), cache)
+
+    assert len(await repository.get_by_owner(1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_delete_evicts_tasks_added_after_caching(cache):
+    list_backend = FakeRepository([TaskList(id=1, name="List", owner_id=1)])
+    task_lists = CachedTaskListRepository(list_backend, cache)
+    await task_lists.get_by_id(1)
+    list_backend.entities[1].tasks.append(_task(7))
+    cache.store("task", 7, _task(7))
+
+    await task_lists.delete(1)
+
+    assert cache.lookup("task", 7) is entity_cache_module._MISSING
+
+
+def test_authentication_reads_users_through_the_cache(
+    monkeypatch, sqlite_engine, sqlite_sessionmaker
+):
+    cache = EntityCache(max_entries=10, ttls={"user": 300})
+    monkeypatch.setattr(entity_cache_module, "entity_cache", cache)
+    monkeypatch.setattr(entity_cache_module, "ENTITY_CACHE_ENABLED", True)
+    with sqlite_sessionmaker() as db:
+        db.add(UserModel(id=1, email="ann@example.com", hashed_password="x"))
+        db.commit()
+    statements = []
+    event.listen(
+        sqlite_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    with sqlite_sessionmaker() as db:
+        assert load_user(db, 1).email == "ann@example.com"
+        assert load_user(db, 1).email == "ann@example.com"
+        assert load_user(db, 2) is None
+        assert load_user(db, 2) is None
+    assert len([sql for sql in statements if "FROM users" in sql]) == 2
+    assert cache.stats()["hit_ratio"] == 0.5
+
+    # The entry cached at the old version stays, as it would in another worker,
+    # but the user's change version moved so it is no longer used
+    with sqlite_sessionmaker() as db:
+        db.get(UserModel, 1).is_active = False
+        db.commit()
+        assert len(cache.entries) == 2
+        assert load_user(db, 1).is_active is False
@@ -0,0 +1,122 @@
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from fastapi.responses import ORJSONResponse
+
+from src.application.dto import TaskListResponseDTO, TaskResponseDTO
+from src.application.serializers import task_list_to_dict, task_to_dict
+from src.domain.entities import TaskPriority, TaskStatus
+from src.presentation.conditional import ConditionalGet
+from src.presentation.routers import task_lists, tasks
+
+
+def _task():
+    return MagicMock(
+        id=1,
+        title="Write report",
+        description=None,
+        status=TaskStatus.IN_PROGRESS,
+        priority=TaskPriority.HIGH,
+        task_list_id=3,
+        assigned_to=2,
+        created_at=datetime(2024, 1, 1, 9, 30, 0, 123456),
+        updated_at=None,
+        due_date=datetime(2024, 2, 1),
+    )
+
+
+def test_task_dict_matches_dto_json():
+    task = _task()
+    dto = TaskResponseDTO(
+        id=task.id,
+        title=task.title,
+        description=task.description,
+        status=task.status,
+        priority=task.priority,
+        task_list_id=task.task_list_id,
+        assigned_to=task.assigned_to,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+        due_date=task.due_date,
+        is_overdue=True,
+        assignee_name="Ann",
+    )
+
+    response = ORJSONResponse(task_to_dict(task, "Ann", True))
+
+    assert json.loads(response.body) == json.loads(dto.model_dump_json())
+
+
+def test_task_list_dict_matches_dto_json():
+    task_list = MagicMock(
+        id=3,
+        description="Desc",
+        owner_id=7,
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 2),
+    )
+    task_list.name = "Work"
+    dto = TaskListResponseDTO(
+        id=3,
+        name="Work",
+        description="Desc",
+        owner_id=7,
+        created_at=task_list.created_at,
+        updated_at=task_list.updated_at,
+        completion_percentage=33.3,
+        task_count=3,
+    )
+
+    response = ORJSONResponse(task_list_to_dict(task_list, 33.3, 3))
+
+    assert json.loads(response.body) == json.loads(dto.model_dump_json())
+
+
+@patch("src.presentation.routers.tasks.FAST_JSON_RESPONSES", True)
+def test_get_tasks_fast_path_returns_orjson_response():
+    mock_db = MagicMock()
+    mock_query = MagicMock()
+    mock_db.query.return_value = mock_query
+    mock_query.join.return_value = mock_query
+    mock_query.outerjoin.return_value = mock_query
+    mock_query.filter.return_value = mock_query
+    mock_query.all.return_value = [(_task(), "Ann")]
+
+    response = tasks.get_tasks(
+        db=mock_db,
+        user=MagicMock(id=7),
+        fields=None,
+        stream=None,
+        conditional=MagicMock(spec=ConditionalGet),
+        overdue=None,
+        sort=None,
+        ids=None,
+    )
+
+    assert isinstance(response, ORJSONResponse)
+    body = json.loads(response.body)
+    assert body[0]["status"] == "in_progress"
+    assert body[0]["assignee_name"] == "Ann"
+
+
+@patch("src.presentation.routers.task_lists.FAST_JSON_RESPONSES", True)
+def test_get_task_lists_fast_path_returns_orjson_response():
+    task_list = MagicMock(id=3, description=None, owner_id=7)
+    task_list.name = "Work"
+    task_list.created_at = None
+    task_list.updated_at = None
+    mock_db = MagicMock()
+    mock_query = MagicMock()
+    mock_db.query.return_value = mock_query
+    mock_query.outerjoin.return_value = mock_query
+    mock_query.filter.return_value = mock_query
+    mock_query.group_by.return_value = mock_query
+    mock_query.all.return_value = [(task_list, 4, 1)]
+
+    response = task_lists.get_task_lists(
+        mock_db, MagicMock(id=7), conditional=MagicMock(spec=ConditionalGet), ids=None
+    )
+
+    assert isinstance(response, ORJSONResponse)
+    assert json.loads(response.body)[0]["completion_percentage"] == 25.0
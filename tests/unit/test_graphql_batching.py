@@ -0,0 +1,142 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import strawberry
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from graphql import parse
+
+from src.presentation.graphql.batching import BatchGraphQLRouter, operation_cost
+from src.presentation.graphql.context import require_auth
+
+calls = []
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self, name: str = "world") -> str:
+        return f"hello {name}"
+
+    @strawberry.field
+    def thread(self) -> str:
+        return threading.current_thread().name
+
+    @strawberry.field
+    def context_id(self, info: strawberry.types.Info) -> str:
+        return str(id(info.context))
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    def record(self, value: int) -> int:
+        calls.append(value)
+        return len(calls)
+
+
+def _client(**limits):
+    app = FastAPI()
+    app.include_router(
+        BatchGraphQLRouter(strawberry.Schema(query=Query, mutation=Mutation), **limits),
+        prefix="/graphql",
+    )
+    return TestClient(app)
+
+
+def test_single_operation_still_works():
+    response = _client().post("/graphql", json={"query": "{ hello }"})
+
+    assert response.status_code == 200
+    assert response.json() == {"data": {"hello": "hello world"}}
+
+
+def test_batch_returns_results_in_order():
+    response = _client().post(
+        "/graphql",
+        json=[
+            {"query": "{ hello }"},
+            {
+                "query": "query Named($name: String!) { hello(name: $name) }",
+                "variables": {"name": "batch"},
+                "operationName": "Named",
+            },
+            {"query": "{ missing }"},
+        ],
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body[0] == {"data": {"hello": "hello world"}}
+    assert body[1] == {"data": {"hello": "hello batch"}}
+    assert "errors" in body[2]
+
+
+def test_batch_operations_share_the_context():
+    response = _client().post(
+        "/graphql", json=[{"query": "{ contextId }"}, {"query": "{ contextId }"}]
+    )
+
+    first, second = response.json()
+    assert first["data"]["contextId"] == second["data"]["contextId"]
+
+
+def test_mutations_in_a_batch_run_in_order():
+    calls.clear()
+    response = _client().post(
+        "/graphql",
+        json=[
+            {"query": "mutation { record(value: 1) }"},
+            {"query": "mutation { record(value: 2) }"},
+        ],
+    )
+
+    assert [item["data"]["record"] for item in response.json()] == [1, 2]
+    assert calls == [1, 2]
+
+
+def test_batch_size_is_capped():
+    response = _client(max_batch_size=2).post(
+        "/graphql", json=[{"query": "{ hello }"}] * 3
+    )
+
+    assert response.status_code == 400
+    assert "limit of 2 operations" in response.text
+
+
+def test_batch_cost_is_capped():
+    response = _client(max_batch_cost=3).post(
+        "/graphql",
+        json=[{"query": "{ hello thread }"}, {"query": "{ hello thread }"}],
+    )
+
+    assert response.status_code == 400
+    assert "exceeds the limit of 3" in response.text
+
+
+def test_invalid_batch_items_are_rejected():
+    client = _client()
+
+    assert client.post("/graphql", json=[]).status_code == 400
+    assert client.post("/graphql", json=["{ hello }"]).status_code == 400
+
+
+def test_operation_cost_counts_fragment_fields():
+    document = parse("{ tasks { ...Fields } } fragment Fields on Task { id title }")
+
+    assert operation_cost(document) == 3
+
+
+@patch("src.presentation.graphql.context.SessionLocal")
+@patch("src.presentation.graphql.context.decode_access_token")
+def test_require_auth_caches_user_in_context(mock_decode, mock_session_local):
+    mock_decode.return_value = {"sub": "1"}
+    user = MagicMock(id=1)
+    db = mock_session_local.return_value
+    db.query.return_value.filter.return_value.first.return_value = user
+    info = MagicMock()
+    info.context = {"request": MagicMock()}
+
+    assert require_auth(info) is user
+    assert require_auth(info) is user
+    assert mock_session_local.call_count == 1
@@ -0,0 +1,139 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from strawberry.types.nodes import FragmentSpread, InlineFragment, SelectedField
+
+from src.application.projections import TaskProjection
+from src.domain.entities import TaskPriority, TaskStatus
+from src.infrastructure.database import TaskModel
+from src.presentation.graphql.resolvers.task_resolvers import TaskQuery
+from src.presentation.graphql.selection import get_selected_fields
+
+
+def _field(name, selections=None):
+    return SelectedField(
+        name=name, directives={}, arguments={}, selections=selections or []
+    )
+
+
+def _info(*selections):
+    info = MagicMock()
+    info.selected_fields = [_field("tasks", list(selections))]
+    return info
+
+
+def test_get_selected_fields_converts_to_snake_case():
+    info = _info(_field("id"), _field("assigneeName"), _field("__typename"))
+
+    assert get_selected_fields(info) == {"id", "assignee_name"}
+
+
+def test_get_selected_fields_expands_fragments():
+    info = _info(
+        _field("id"),
+        FragmentSpread(
+            name="F",
+            type_condition="Task",
+            directives={},
+            selections=[_field("dueDate")],
+        ),
+        InlineFragment(
+            type_condition="Task", selections=[_field("title")], directives={}
+        ),
+    )
+
+    assert get_selected_fields(info) == {"id", "due_date", "title"}
+
+
+def test_get_selected_fields_nested_path():
+    info = MagicMock()
+    info.selected_fields = [
+        _field("tasks", [_field("edges", [_field("node", [_field("title")])])])
+    ]
+
+    assert get_selected_fields(info, "edges", "node") == {"title"}
+    assert get_selected_fields(info, "pageInfo") is None
+
+
+def test_get_selected_fields_unknown_info_returns_none():
+    assert get_selected_fields(MagicMock()) is None
+
+
+def test_task_projection_full():
+    projection = TaskProjection()
+
+    assert projection.is_full
+    assert projection.needs_assignee_join
+    assert projection.load_options() == []
+
+
+def test_task_projection_columns_include_derived_inputs():
+    projection = TaskProjection({"title", "is_overdue", "unknown"})
+
+    assert not projection.needs_assignee_join
+    assert projection.includes("title")
+    assert not projection.includes("description")
+    assert [column.key for column in projection.columns()] == [
+        "due_date",
+        "id",
+        "status",
+        "title",
+    ]
+
+
+@patch("src.presentation.graphql.resolvers.task_resolvers.get_selected_fields")
+@patch("src.presentation.graphql.resolvers.task_resolvers.require_auth")
+@patch("src.presentation.graphql.resolvers.task_resolvers.get_db")
+def test_tasks_projects_selected_columns(mock_get_db, mock_require_auth, mock_selected):
+    mock_require_auth.return_value = MagicMock(id=1)
+    mock_selected.return_value = {"id", "title"}
+    mock_db = MagicMock()
+    mock_get_db.return_value = mock_db
+
+    task = MagicMock(spec=TaskModel)
+    task.id = 1
+    task.title = "Only title"
+    mock_query = mock_db.query.return_value
+    mock_query.join.return_value = mock_query
+    mock_query.options.return_value = mock_query
+    mock_query.filter.return_value = mock_query
+    mock_query.all.return_value = [task]
+
+    result = TaskQuery().tasks(info=MagicMock())
+
+    mock_db.query.assert_called_once_with(TaskModel)
+    mock_query.outerjoin.assert_not_called()
+    mock_query.options.assert_called_once()
+    assert result[0].title == "Only title"
+    assert result[0].description is None
+    assert result[0].assignee_name is None
+
+
+@patch("src.presentation.graphql.resolvers.task_resolvers.get_selected_fields")
+@patch("src.presentation.graphql.resolvers.task_resolvers.require_auth")
+@patch("src.presentation.graphql.resolvers.task_resolvers.get_db")
+def test_tasks_joins_users_for_assignee_name(
+    mock_get_db, mock_require_auth, mock_selected
+):
+    mock_require_auth.return_value = MagicMock(id=1)
+    mock_selected.return_value = {"id", "assignee_name", "is_overdue"}
+    mock_db = MagicMock()
+    mock_get_db.return_value = mock_db
+
+    task = MagicMock(spec=TaskModel)
+    task.id = 1
+    task.status = TaskStatus.PENDING
+    task.priority = TaskPriority.HIGH
+    task.due_date = datetime(2000, 1, 1)
+    mock_query = mock_db.query.return_value
+    mock_query.join.return_value = mock_query
+    mock_query.outerjoin.return_value = mock_query
+    mock_query.options.return_value = mock_query
+    mock_query.filter.return_value = mock_query
+    mock_query.all.return_value = [(task, "Jane")]
+
+    result = TaskQuery().tasks(info=MagicMock())
+
+    mock_query.outerjoin.assert_called_once()
+    assert result[0].assignee_name == "Jane"
+    assert result[0].is_overdue is True
@@ -0,0 +1,107 @@
+from datetime import datetime, timezone
+
+import msgpack
+import pytest
+
+from src.domain.entities import TaskPriority
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.presentation import negotiation
+from src.presentation.routers import tasks
+
+MSGPACK = {"Accept": "application/msgpack"}
+
+
+@pytest.fixture
+def client(sqlite_sessionmaker, make_client):
+    db = sqlite_sessionmaker()
+    user = UserModel(email="owner@example.com", full_name="Owner", hashed_password="x")
+    db.add(user)
+    db.flush()
+    task_list = TaskListModel(name="List", owner_id=user.id)
+    db.add(task_list)
+    db.flush()
+    db.add_all(
+        TaskModel(
+            title=f"Task {index}",
+            task_list_id=task_list.id,
+            due_date=datetime(2030, 1, 1, 12, 30),
+        )
+        for index in range(3)
+    )
+    db.commit()
+    db.close()
+
+    return make_client(tasks)
+
+
+def test_listing_is_encoded_as_msgpack(client):
+    response = client.get("/api/tasks/", headers=MSGPACK)
+
+    assert response.headers["content-type"] == "application/msgpack"
+    assert "Accept" in response.headers["vary"]
+    items = negotiation.unpackb(response.content)
+    assert len(items) == 3
+    assert items[0]["due_date"] == datetime(2030, 1, 1, 12, 30, tzinfo=timezone.utc)
+    assert items[0]["status"] == "pending"
+    assert items[0].keys() == client.get("/api/tasks/").json()[0].keys()
+
+
+def test_datetimes_use_the_timestamp_extension(client):
+    response = client.get("/api/tasks/", headers=MSGPACK)
+
+    raw = msgpack.unpackb(response.content)
+    assert isinstance(raw[0]["due_date"], msgpack.Timestamp)
+
+
+def test_sparse_fields_use_the_fast_path_payload(client):
+    response = client.get("/api/tasks/", params={"fields": "title"}, headers=MSGPACK)
+
+    assert negotiation.unpackb(response.content)[0] == {"id": 1, "title": "Task 0"}
+
+
+def test_json_stays_the_default(client):
+    response = client.get("/api/tasks/", headers={"Accept": "*/*"})
+
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_msgpack_request_body(client):
+    body = negotiation.packb(
+        {
+            "title": "Packed",
+            "priority": TaskPriority.HIGH,
+            "task_list_id": 1,
+            "due_date": datetime(2031, 5, 6, 7, 8, 9),
+        }
+    )
+
+    response = client.post(
+        "/api/tasks/",
+        content=body,
+        headers={"Content-Type": "application/msgpack", **MSGPACK},
+    )
+
+    assert response.status_code == 200
+    created = negotiation.unpackb(response.content)
+    assert created["title"] == "Packed"
+    assert created["priority"] == "high"
+    assert created["due_date"] == datetime(2031, 5, 6, 7, 8, 9, tzinfo=timezone.utc)
+
+
+def test_invalid_msgpack_body_is_rejected(client):
+    response = client.post(
+        "/api/tasks/",
+        content=b"\xc1",
+        headers={"Content-Type": "application/msgpack"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_accept_qualities():
+    assert negotiation.accepts_msgpack("application/x-msgpack")
+    assert negotiation.accepts_msgpack("application/json;q=0.5, application/msgpack")
+    assert not negotiation.accepts_msgpack(
+        "application/json, application/msgpack;q=0.5"
+    )
+    assert not negotiation.accepts_msgpack("*/*")
@@ -0,0 +1,137 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from src.application import multi_get
+from src.application.multi_get import in_request_order, parse_ids, unique_ids
+from src.domain.exceptions import ValidationError
+from src.infrastructure.cache import LRUCache, TaggedCache
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.presentation.graphql.schema import schema
+from src.presentation.routers import task_lists, tasks
+
+
+@pytest.fixture
+def engine(sqlite_engine, sqlite_sessionmaker):
+    with sqlite_sessionmaker() as db:
+        db.add_all(
+            [
+                UserModel(id=1, email="one@example.com", hashed_password="x"),
+                UserModel(id=2, email="two@example.com", hashed_password="x"),
+            ]
+        )
+        db.flush()
+        db.add_all(
+            [
+                TaskListModel(id=1, name="One's", owner_id=1),
+                TaskListModel(id=2, name="Two's", owner_id=2),
+                TaskListModel(id=3, name="Empty", owner_id=1),
+            ]
+        )
+        db.flush()
+        db.add_all(
+            [
+                TaskModel(id=1, title="A", task_list_id=1),
+                TaskModel(id=2, title="B", task_list_id=1, status="completed"),
+                TaskModel(id=3, title="C", task_list_id=2),
+            ]
+        )
+        db.commit()
+    return sqlite_engine
+
+
+@pytest.fixture
+def client(engine, make_client):
+    return make_client(tasks, task_lists)
+
+
+def _task_reads(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM tasks" in statement:
+            statements.append(statement)
+
+    return statements
+
+
+def test_ids_are_parsed_bounded_and_realigned(monkeypatch):
+    assert parse_ids("3, 1,,3") == [3, 1, 3]
+    with pytest.raises(ValidationError):
+        parse_ids("1,two")
+
+    monkeypatch.setattr(multi_get, "MULTI_GET_MAX_IDS", 3)
+    assert unique_ids([3, 1, 3]) == [3, 1]
+    with pytest.raises(ValidationError):
+        unique_ids([])
+    with pytest.raises(ValidationError):
+        unique_ids([1, 2, 3, 4])
+
+    items = [{"id": 1}, {"id": 3}]
+    assert in_request_order([3, 2, 1, 3], items, lambda item: item["id"]) == [
+        {"id": 3},
+        None,
+        {"id": 1},
+        {"id": 3},
+    ]
+
+
+def test_rest_tasks_by_ids(client, engine):
+    reads = _task_reads(engine)
+    response = client.get("/api/tasks/", params={"ids": "2,3,99,1"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [task and task["id"] for task in body] == [2, None, None, 1]
+    assert body[0]["status"] == "completed"
+    # Another owner's task (3) is indistinguishable from a missing one
+    assert len(reads) == 1
+    assert "tasks.id IN" in reads[0]
+
+    sparse = client.get("/api/tasks/", params={"ids": "1", "fields": "title"})
+    assert sparse.json() == [{"id": 1, "title": "A"}]
+    assert client.get("/api/tasks/", params={"ids": "x"}).status_code == 400
+
+
+def test_rest_task_lists_by_ids(client, monkeypatch):
+    body = client.get("/api/task-lists/", params={"ids": "3,2,1"}).json()
+
+    assert [task_list and task_list["id"] for task_list in body] == [3, None, 1]
+    assert body[0]["task_count"] == 0
+    assert body[2]["task_count"] == 2
+    assert body[2]["completion_percentage"] == 50.0
+
+    monkeypatch.setattr(multi_get, "MULTI_GET_MAX_IDS", 2)
+    assert client.get("/api/task-lists/", params={"ids": "1,2,3"}).status_code == 400
+
+
+def test_graphql_by_ids(engine):
+    db = sessionmaker(bind=engine)()
+    db.close = lambda: None
+    query = """{
+        tasksByIds(ids: [3, 1]) { id title }
+        taskListsByIds(ids: [1, 3, 2]) { id taskCount }
+    }"""
+    resolvers = "src.presentation.graphql.resolvers"
+    tagged = TaggedCache(LRUCache(max_entries=10, ttl=60))
+    with patch(f"{resolvers}.task_resolvers.get_db", return_value=db), patch(
+        f"{resolvers}.task_list_resolvers.get_db", return_value=db
+    ), patch(
+        f"{resolvers}.task_resolvers.require_auth", return_value=MagicMock(id=1)
+    ), patch(
+        f"{resolvers}.task_list_resolvers.require_auth", return_value=MagicMock(id=1)
+    ), patch(
+        "src.presentation.graphql.response_cache.response_cache", tagged
+    ):
+        result = schema.execute_sync(query, context_value={"user": MagicMock(id=1)})
+
+    assert result.errors is None
+    assert result.data["tasksByIds"] == [None, {"id": 1, "title": "A"}]
+    assert result.data["taskListsByIds"] == [
+        {"id": 1, "taskCount": 2},
+        {"id": 3, "taskCount": 0},
+        None,
+    ]
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from src.application.services import TaskService
+from src.domain.entities import TaskStatus
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.presentation.graphql.resolvers.task_resolvers import _apply_task_filter
+from src.presentation.graphql.types import TaskFilterInput
+from src.presentation.routers import tasks
+
+PAST = datetime.utcnow() - timedelta(days=1)
+FUTURE = datetime.utcnow() + timedelta(days=1)
+
+
+@pytest.fixture
+def Session(sqlite_sessionmaker):
+    with sqlite_sessionmaker() as db:
+        db.add(UserModel(id=1, email="owner@example.com", hashed_password="x"))
+        db.flush()
+        db.add(TaskListModel(id=1, name="List", owner_id=1))
+        db.flush()
+        db.add_all(
+            [
+                TaskModel(id=1, title="Late", task_list_id=1, due_date=PAST),
+                TaskModel(id=2, title="Upcoming", task_list_id=1, due_date=FUTURE),
+                TaskModel(
+                    id=3,
+                    title="Done late",
+                    task_list_id=1,
+                    due_date=PAST,
+                    status=TaskStatus.COMPLETED,
+                ),
+                TaskModel(id=4, title="Someday", task_list_id=1),
+            ]
+        )
+        db.commit()
+    return sqlite_sessionmaker
+
+
+@pytest.fixture
+def client(Session, make_client):
+    return make_client(tasks)
+
+
+def _ids(response):
+    return sorted(task["id"] for task in response.json())
+
+
+def test_rest_overdue_filter(client):
+    assert _ids(client.get("/api/tasks/?overdue=true")) == [1]
+    assert _ids(client.get("/api/tasks/?overdue=false")) == [2, 3, 4]
+    assert client.get("/api/tasks/?overdue=true").json()[0]["is_overdue"] is True
+
+
+def test_graphql_overdue_filter(Session):
+    with Session() as db:
+        late = _apply_task_filter(db.query(TaskModel), TaskFilterInput(overdue=True))
+        rest = _apply_task_filter(db.query(TaskModel), TaskFilterInput(overdue=False))
+
+        assert [task.id for task in late] == [1]
+        assert sorted(task.id for task in rest) == [2, 3, 4]
+
+
+def test_service_uses_the_same_definition(Session):
+    with Session() as db:
+        assert [task.id for task in TaskService(db).get_overdue_tasks(1)] == [1]
+
+
+def test_expression_matches_the_python_side(Session):
+    with Session() as db:
+        flagged = {task.id for task in db.query(TaskModel).filter(TaskModel.is_overdue)}
+        assert flagged == {task.id for task in db.query(TaskModel) if task.is_overdue}
+
+
+def test_expression_is_index_friendly():
+    sql = str(TaskModel.is_overdue.compile(dialect=mysql.dialect()))
+
+    assert "tasks.status IN" in sql
+    assert "tasks.due_date <" in sql
@@ -0,0 +1,127 @@
+import pytest
+from sqlalchemy import event
+
+from src.application import ownership
+from src.application.events import (
+    ChangeAction,
+    publish_task_list_change,
+    publish_task_list_deleted,
+)
+from src.application.ownership import OwnershipCache, find_owned_task
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+
+
+@pytest.fixture
+def db(sqlite_sessionmaker):
+    with sqlite_sessionmaker() as session:
+        session.add_all(
+            [
+                UserModel(id=1, email="one@example.com", hashed_password="x"),
+                UserModel(id=2, email="two@example.com", hashed_password="x"),
+            ]
+        )
+        session.flush()
+        session.add_all(
+            [
+                TaskListModel(id=1, name="Mine", owner_id=1),
+                TaskListModel(id=2, name="Theirs", owner_id=2),
+            ]
+        )
+        session.flush()
+        session.add(TaskModel(id=1, title="Task", task_list_id=1))
+        session.commit()
+        yield session
+
+
+def _record_statements(session):
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    return statements
+
+
+def test_owner_lists_are_loaded_once(db):
+    cache = OwnershipCache()
+    statements = _record_statements(db)
+
+    assert cache.owns(db, 1, 1)
+    assert cache.owns(db, 1, 1)
+    assert not cache.owns(db, 2, 1)
+    assert cache.list_ids(db, 1) == {1}
+    assert cache.list_ids(db, 1) == {1}
+    assert cache.owner_of(1) == 1
+    # One ownership check per (owner, list) and one load of the owner's lists;
+    # confirmed hits only read the list's change version
+    assert len([sql for sql in statements if "FROM task_lists" in sql]) == 3
+
+
+def test_changes_from_other_workers_fail_the_check(db):
+    cache = OwnershipCache()
+    assert cache.owns(db, 1, 1)
+
+    # Transferred by another worker: no event reached this process
+    db.get(TaskListModel, 1).owner_id = 2
+    db.commit()
+    assert not cache.owns(db, 1, 1)
+    assert cache.owns(db, 2, 1)
+
+    db.delete(db.get(TaskListModel, 1))
+    db.commit()
+    assert not cache.owns(db, 2, 1)
+
+
+def test_a_miss_reloads_so_new_lists_are_seen(db):
+    cache = OwnershipCache()
+    assert not cache.owns(db, 1, 3)
+
+    # Created by another worker: no event reached this process
+    db.add(TaskListModel(id=3, name="New", owner_id=1))
+    db.commit()
+
+    assert cache.owns(db, 1, 3)
+    assert not cache.owns(db, 1, 2)
+
+
+def test_events_record_transfers_and_deletions(db, monkeypatch):
+    cache = OwnershipCache()
+    monkeypatch.setattr(ownership, "ownership_cache", cache)
+    cache.list_ids(db, 1)
+    cache.list_ids(db, 2)
+
+    task_list = db.get(TaskListModel, 1)
+    task_list.owner_id = 2
+    db.commit()
+    publish_task_list_change(ChangeAction.UPDATED, task_list)
+
+    assert cache.owner_of(1) == 2
+    assert cache.list_ids(db, 1) == set()
+    assert cache.list_ids(db, 2) == {1, 2}
+
+    publish_task_list_deleted(2, 2)
+    assert cache.owner_of(2) is None
+    assert cache.list_ids(db, 2) == {1}
+
+
+def test_expired_entries_are_reloaded(db):
+    cache = OwnershipCache(ttl=0)
+    cache.list_ids(db, 1)
+    db.delete(db.get(TaskListModel, 1))
+    db.commit()
+
+    assert cache.list_ids(db, 1) == set()
+    assert cache.owner_of(1) is None
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_find_owned_task(db, monkeypatch, enabled):
+    monkeypatch.setattr(ownership, "OWNERSHIP_CACHE_ENABLED", enabled)
+    monkeypatch.setattr(ownership, "ownership_cache", OwnershipCache())
+
+    assert find_owned_task(db, 1, 1).title == "Task"
+    assert find_owned_task(db, 1, 2) is None
+    assert find_owned_task(db, 99, 1) is None
+    assert ownership.owns_task_list(db, 2, 2)
+    assert not ownership.owns_task_list(db, 1, 2)
@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from src.application.pagination import (
+    MAX_PAGE_SIZE,
+    KeysetOrder,
+    clamp_page_size,
+    paginate,
+)
+from src.domain.exceptions import ValidationError
+from src.infrastructure.database import Base, TaskListModel, TaskModel, UserModel
+from src.presentation.graphql.resolvers.task_resolvers import TaskQuery
+
+CREATED_ORDER = KeysetOrder("created_at", (TaskModel.created_at, TaskModel.id))
+DUE_ORDER = KeysetOrder("due_date", (TaskModel.due_date, TaskModel.id))
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    user = UserModel(email="owner@example.com", hashed_password="x")
+    session.add(user)
+    session.flush()
+    task_list = TaskListModel(name="List", owner_id=user.id)
+    session.add(task_list)
+    session.flush()
+    base = datetime(2024, 1, 1)
+    for index in range(7):
+        session.add(
+            TaskModel(
+                title=f"Task {index}",
+                task_list_id=task_list.id,
+                created_at=base,
+                due_date=None if index % 3 == 0 else base + timedelta(days=index % 2),
+            )
+        )
+    session.commit()
+    yield session
+    session.close()
+
+
+def _walk(db, order, page_size):
+    titles, after = [], None
+    while True:
+        rows, has_next_page = paginate(db.query(TaskModel), order, page_size, after)
+        titles.extend(row.title for row in rows)
+        if not has_next_page:
+            return titles
+        after = order.encode_cursor(order.values(rows[-1]))
+
+
+def test_cursor_round_trip():
+    values = (datetime(2024, 5, 1, 12, 30), 42)
+
+    cursor = CREATED_ORDER.encode_cursor(values)
+
+    assert CREATED_ORDER.decode_cursor(cursor) == values
+
+
+def test_cursor_from_other_ordering_is_rejected():
+    cursor = CREATED_ORDER.encode_cursor((datetime(2024, 5, 1), 1))
+
+    with pytest.raises(ValidationError):
+        DUE_ORDER.decode_cursor(cursor)
+    with pytest.raises(ValidationError):
+        DUE_ORDER.decode_cursor("not-a-cursor")
+
+
+def test_clamp_page_size():
+    assert clamp_page_size(None) == 50
+    assert clamp_page_size(10_000) == MAX_PAGE_SIZE
+    with pytest.raises(ValidationError):
+        clamp_page_size(0)
+
+
+def test_paginate_ties_on_created_at_use_id(db):
+    assert _walk(db, CREATED_ORDER, 3) == [f"Task {index}" for index in range(7)]
+
+
+def test_paginate_due_date_sorts_nulls_first(db):
+    assert _walk(db, DUE_ORDER, 2) == [
+        "Task 0",
+        "Task 3",
+        "Task 6",
+        "Task 2",
+        "Task 4",
+        "Task 1",
+        "Task 5",
+    ]
+
+
+def test_order_by_has_no_null_ordering_terms():
+    # A plain column list is what the (owner_id, due_date, id) index serves
+    order = KeysetOrder("due_date_desc", DUE_ORDER.columns, descending=True)
+    statement = select(TaskModel.id).order_by(*order.order_by())
+
+    assert str(statement).endswith("ORDER BY tasks.due_date DESC, tasks.id DESC")
+
+
+@patch("src.presentation.graphql.resolvers.task_resolvers.get_selected_fields")
+@patch("src.presentation.graphql.resolvers.task_resolvers.require_auth")
+@patch("src.presentation.graphql.resolvers.task_resolvers.get_db")
+def test_tasks_connection_skips_count_unless_selected(
+    mock_get_db, mock_require_auth, mock_selected, db
+):
+    mock_require_auth.return_value = MagicMock(id=1)
+    mock_selected.side_effect = lambda info, *path: (
+        {"id", "title"} if path else {"edges", "page_info"}
+    )
+    mock_get_db.return_value = db
+
+    connection = TaskQuery().tasks_connection(info=MagicMock(), first=5)
+
+    assert [edge.node.title for edge in connection.edges][:2] == ["Task 0", "Task 1"]
+    assert connection.page_info.has_next_page is True
+    assert connection.page_info.has_previous_page is False
+    assert connection.page_info.end_cursor == connection.edges[-1].cursor
+    assert connection.total_count is None
+
+
+def test_paginate_descending_keeps_nulls_last(db):
+    order = KeysetOrder("due_date_desc", DUE_ORDER.columns, descending=True)
+
+    assert _walk(db, order, 2) == [
+        "Task 5",
+        "Task 1",
+        "Task 4",
+        "Task 2",
+        "Task 6",
+        "Task 3",
+        "Task 0",
+    ]
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.application.events import (
+    ChangeAction,
+    ChangeEntity,
+    ChangeEvent,
+    publish_task_change,
+    publish_task_deleted,
+)
+from src.domain.entities import TaskPriority, TaskStatus
+from src.infrastructure.pubsub import PubSub, SubscriberLimitError
+from src.presentation.graphql.resolvers.subscription_resolvers import (
+    TaskSubscription,
+    _to_task_change,
+)
+
+
+@pytest.mark.asyncio
+async def test_publish_delivers_to_channel_subscribers():
+    broker = PubSub()
+    subscription = broker.subscribe("task_list:1")
+    other = broker.subscribe("task_list:2")
+
+    assert broker.publish("task_list:1", "hello") == 1
+    assert await asyncio.wait_for(subscription.get(), 1) == "hello"
+    assert other.drain() == []
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_messages():
+    broker = PubSub(max_queue_size=2)
+    subscription = broker.subscribe("owner:1")
+
+    for message in range(5):
+        broker.publish("owner:1", message)
+    await asyncio.sleep(0)
+
+    assert subscription.drain() == [3, 4]
+    assert subscription.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_subscriber_limit():
+    broker = PubSub(max_subscribers=1)
+    subscription = broker.subscribe("owner:1")
+
+    with pytest.raises(SubscriberLimitError):
+        broker.subscribe("owner:2")
+
+    subscription.close()
+    assert broker.subscriber_count == 0
+    broker.subscribe("owner:2")
+
+
+@pytest.mark.asyncio
+async def test_publish_from_worker_thread():
+    broker = PubSub()
+    subscription = broker.subscribe("owner:1")
+
+    thread = threading.Thread(target=broker.publish, args=("owner:1", "from-thread"))
+    thread.start()
+    thread.join()
+
+    assert await asyncio.wait_for(subscription.get(), 1) == "from-thread"
+
+
+@patch("src.application.events.pubsub")
+def test_publish_task_change_fans_out_to_list_and_owner(mock_pubsub):
+    task = MagicMock(id=5, task_list_id=2)
+
+    publish_task_change(ChangeAction.UPDATED, task, owner_id=7, assignee_name="Ann")
+
+    channels = [call.args[0] for call in mock_pubsub.publish.call_args_list]
+    assert channels == ["task_list:2", "owner:7"]
+    event = mock_pubsub.publish.call_args.args[1]
+    assert event.action == ChangeAction.UPDATED
+    assert event.data["assignee_name"] == "Ann"
+
+
+@patch("src.application.events.pubsub")
+def test_publish_task_deleted_has_no_snapshot(mock_pubsub):
+    publish_task_deleted(5, 2, 7)
+
+    event = mock_pubsub.publish.call_args.args[1]
+    assert event.action == ChangeAction.DELETED
+    assert event.data is None
+
+
+def test_to_task_change_builds_task_from_snapshot():
+    event = ChangeEvent(
+        entity=ChangeEntity.TASK,
+        action=ChangeAction.CREATED,
+        entity_id=5,
+        task_list_id=2,
+        owner_id=7,
+        data={
+            "id": 5,
+            "title": "New",
+            "description": None,
+            "status": TaskStatus.PENDING,
+            "priority": TaskPriority.LOW,
+            "task_list_id": 2,
+            "assigned_to": None,
+            "assignee_name": None,
+            "due_date": None,
+            "created_at": None,
+            "updated_at": None,
+        },
+    )
+
+    change = _to_task_change(event)
+
+    assert change.task_id == 5
+    assert change.task.title == "New"
+    assert change.task.is_overdue is False
+
+
+@pytest.mark.asyncio
+@patch("src.presentation.graphql.resolvers.subscription_resolvers._owns_task_list")
+@patch("src.presentation.graphql.resolvers.subscription_resolvers.require_auth")
+async def test_task_changed_ends_when_list_is_deleted(mock_require_auth, mock_owns):
+    mock_require_auth.return_value = MagicMock(id=7)
+    mock_owns.return_value = True
+    broker = PubSub()
+
+    with patch(
+        "src.presentation.graphql.resolvers.subscription_resolvers.pubsub", broker
+    ):
+        stream = TaskSubscription().task_changed(task_list_id=2, info=MagicMock())
+        pending = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.05)
+        broker.publish(
+            "task_list:2",
+            ChangeEvent(ChangeEntity.TASK_LIST, ChangeAction.DELETED, 2, 2, 7),
+        )
+
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(pending, 1)
+        assert broker.subscriber_count == 0
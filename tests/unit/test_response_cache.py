@@ -0,0 +1,165 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import strawberry
+
+from src.application.events import (
+    ChangeAction,
+    ChangeEntity,
+    ChangeEvent,
+    publish_change,
+)
+from src.infrastructure.cache import LRUCache, RedisCache, TaggedCache
+from src.presentation.graphql.response_cache import (
+    ResponseCacheExtension,
+    response_cache_enabled,
+)
+
+resolver_calls = []
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def counter(self) -> int:
+        resolver_calls.append(1)
+        return len(resolver_calls)
+
+    @strawberry.field
+    def broken(self) -> int:
+        resolver_calls.append(1)
+        raise Exception("boom")
+
+
+schema = strawberry.Schema(query=Query, extensions=[ResponseCacheExtension])
+
+
+class FakeRedis:
+    """Minimal in-memory client speaking the commands RedisCache uses"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self.data[key] = value
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self):
+        return self
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+
+    def execute(self):
+        return []
+
+
+@pytest.fixture
+def cache():
+    tagged = TaggedCache(LRUCache(max_entries=10, ttl=60))
+    module = "src.presentation.graphql.response_cache"
+    with patch(f"{module}.response_cache", tagged), patch(
+        f"{module}.RESPONSE_CACHE_ENABLED", True
+    ):
+        yield tagged
+
+
+def _execute(user_id, query="{ counter }"):
+    return schema.execute_sync(query, context_value={"user": MagicMock(id=user_id)})
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUCache(max_entries=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+
+    assert lru.get("a") == 1
+    assert lru.get("b") is None
+    assert lru.get("c") == 3
+
+
+def test_lru_expires_entries():
+    lru = LRUCache(ttl=60)
+    lru.set("a", 1, ttl=-1)
+
+    assert lru.get("a") is None
+    assert len(lru) == 0
+
+
+def test_bumping_a_tag_makes_entries_stale():
+    tagged = TaggedCache(LRUCache())
+    tagged.set("key", {"x": 1}, tagged.tag_versions(["owner:1"]))
+    assert tagged.get("key") == {"x": 1}
+
+    tagged.invalidate("owner:2")
+    assert tagged.get("key") == {"x": 1}
+
+    tagged.invalidate("owner:1")
+    assert tagged.get("key") is None
+
+
+def test_entry_computed_before_a_write_is_stale():
+    tagged = TaggedCache(LRUCache())
+    versions = tagged.tag_versions(["owner:1"])
+    tagged.invalidate("owner:1")
+    tagged.set("key", "old", versions)
+
+    assert tagged.get("key") is None
+
+
+def test_shared_tier_propagates_entries_and_invalidation():
+    client = FakeRedis()
+    worker_a = TaggedCache(LRUCache(), RedisCache(client))
+    worker_b = TaggedCache(LRUCache(), RedisCache(client))
+
+    worker_a.set("key", {"x": 1}, worker_a.tag_versions(["owner:1"]))
+    assert worker_b.get("key") == {"x": 1}
+
+    worker_a.invalidate("owner:1")
+    assert worker_b.get("key") is None
+
+
+def test_query_is_served_from_cache_per_user(cache):
+    resolver_calls.clear()
+
+    assert _execute(1).data == {"counter": 1}
+    assert _execute(1).data == {"counter": 1}
+    assert _execute(2).data == {"counter": 2}
+    assert len(resolver_calls) == 2
+
+
+@patch("src.application.events.pubsub")
+def test_change_event_invalidates_owner_responses(mock_pubsub, cache):
+    resolver_calls.clear()
+    _execute(1)
+
+    publish_change(ChangeEvent(ChangeEntity.TASK, ChangeAction.UPDATED, 5, 3, 1))
+
+    assert _execute(1).data == {"counter": 2}
+
+
+def test_errors_and_anonymous_queries_are_not_cached(cache):
+    resolver_calls.clear()
+    _execute(1, "{ broken }")
+    _execute(1, "{ broken }")
+    schema.execute_sync("{ counter }", context_value={})
+    schema.execute_sync("{ counter }", context_value={})
+
+    assert len(resolver_calls) == 4
+
+
+def test_cache_is_off_by_default_unless_versions_are_shared(monkeypatch):
+    monkeypatch.delenv("GRAPHQL_RESPONSE_CACHE_ENABLED", raising=False)
+    assert not response_cache_enabled(TaggedCache(LRUCache()))
+    assert response_cache_enabled(TaggedCache(LRUCache(), RedisCache(FakeRedis())))
+    assert response_cache_enabled(TaggedCache(LRUCache(), versions=MagicMock()))
+
+    monkeypatch.setenv("GRAPHQL_RESPONSE_CACHE_ENABLED", "true")
+    assert response_cache_enabled(TaggedCache(LRUCache()))
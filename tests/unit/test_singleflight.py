@@ -0,0 +1,90 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infrastructure.singleflight import SingleFlight, coalesced_requests
+
+
+def _slow(calls, release, value="result"):
+    def function():
+        calls.append(1)
+        release.wait(2)
+        return value
+
+    return function
+
+
+def test_concurrent_callers_share_one_computation():
+    flight = SingleFlight(timeout=2)
+    calls, release = [], threading.Event()
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [
+            pool.submit(flight.do, "stats", 1, _slow(calls, release)) for _ in range(5)
+        ]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert flight.in_flight() == 0
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight(timeout=2)
+    calls, release = [], threading.Event()
+    release.set()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(flight.do, "stats", 1, _slow(calls, release, "one"))
+        second = pool.submit(flight.do, "stats", 2, _slow(calls, release, "two"))
+
+    assert (first.result(), second.result()) == ("one", "two")
+    assert len(calls) == 2
+
+
+def test_followers_receive_the_leader_error():
+    flight = SingleFlight(timeout=2)
+    release = threading.Event()
+
+    def failing():
+        release.wait(2)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(flight.do, "lists", 1, failing) for _ in range(3)]
+        time.sleep(0.1)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_follower_runs_its_own_read_after_timeout():
+    flight = SingleFlight(timeout=0.05)
+    release = threading.Event()
+    labels = {"group": "timeout-test", "role": "timeout"}
+    before = coalesced_requests.value(labels)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "timeout-test", 1, _slow([], release, "slow"))
+        time.sleep(0.02)
+        follower = flight.do("timeout-test", 1, lambda: "own")
+        release.set()
+
+    assert follower == "own"
+    assert leader.result() == "slow"
+    assert coalesced_requests.value(labels) == before + 1
+
+
+def test_disabled_flight_always_calls_through():
+    flight = SingleFlight(enabled=False)
+    calls = []
+
+    flight.do("stats", 1, lambda: calls.append(1))
+    flight.do("stats", 1, lambda: calls.append(1))
+
+    assert len(calls) == 2
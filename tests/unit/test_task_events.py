@@ -0,0 +1,207 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from src.domain.entities import TaskStatus
+from src.infrastructure import task_events as task_events_module
+from src.infrastructure.database import (
+    TaskEventModel,
+    TaskEventRollupModel,
+    TaskListModel,
+    TaskModel,
+    UserModel,
+)
+from src.infrastructure.task_events import (
+    TaskEventWriter,
+    compact_task_events,
+    events_for_owner,
+    events_for_task,
+)
+from src.presentation.routers import tasks
+
+
+@pytest.fixture
+def Session(sqlite_sessionmaker):
+    with sqlite_sessionmaker() as db:
+        db.add_all(
+            [
+                UserModel(id=1, email="one@example.com", hashed_password="x"),
+                UserModel(id=2, email="two@example.com", hashed_password="x"),
+            ]
+        )
+        db.flush()
+        db.add_all(
+            [
+                TaskListModel(id=1, name="First", owner_id=1),
+                TaskListModel(id=2, name="Second", owner_id=1),
+            ]
+        )
+        db.commit()
+    return sqlite_sessionmaker
+
+
+def _history(db, task_id):
+    return [
+        (task_event.event_type, task_event.from_value, task_event.to_value)
+        for task_event in events_for_task(db, task_id, 1)
+    ]
+
+
+def test_every_change_is_appended(Session):
+    with Session() as db:
+        task = TaskModel(id=1, title="Task", task_list_id=1)
+        db.add(task)
+        db.commit()
+        task.status = TaskStatus.IN_PROGRESS
+        db.commit()
+        task.assigned_to = 2
+        task.title = "Not tracked"
+        db.commit()
+        task.task_list_id = 2
+        db.commit()
+        db.delete(task)
+        db.commit()
+
+        assert _history(db, 1) == [
+            ("created", None, "pending"),
+            ("status_changed", "pending", "in_progress"),
+            ("assigned", None, "2"),
+            ("moved", "1", "2"),
+            ("deleted", None, None),
+        ]
+        assert {task_event.owner_id for task_event in events_for_owner(db, 1)} == {1}
+
+
+def test_a_flush_writes_its_events_in_one_insert(Session):
+    with Session() as db:
+        db.add_all(
+            [TaskModel(id=id, title=str(id), task_list_id=1) for id in range(1, 4)]
+        )
+        db.commit()
+        statements = []
+        event.listen(
+            db.get_bind(),
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        for task in db.query(TaskModel):
+            task.status = TaskStatus.COMPLETED
+        db.commit()
+
+    inserts = [sql for sql in statements if sql.startswith("INSERT INTO task_events")]
+    assert len(inserts) == 1
+
+
+def test_rolled_back_changes_leave_no_events(Session):
+    with Session() as db:
+        db.add(TaskModel(id=1, title="Task", task_list_id=1))
+        db.flush()
+        db.rollback()
+
+        assert db.query(TaskEventModel).count() == 0
+
+
+def test_async_writes_after_commit(Session, monkeypatch):
+    writer = TaskEventWriter(Session, batch_size=10, flush_interval=0.01)
+    monkeypatch.setattr(task_events_module, "TASK_EVENTS_ASYNC", True)
+    monkeypatch.setattr(task_events_module, "task_event_writer", writer)
+    with Session() as db:
+        db.add(TaskModel(id=1, title="Kept", task_list_id=1))
+        db.commit()
+        db.add(TaskModel(id=2, title="Discarded", task_list_id=1))
+        db.flush()
+        db.rollback()
+        # Nothing is written inside the request's transaction
+        assert db.query(TaskEventModel).count() == 0
+
+    writer.close()
+    with Session() as db:
+        assert [task_event.task_id for task_event in events_for_owner(db, 1)] == [1]
+
+
+def test_compaction_rolls_up_old_events(Session):
+    now = datetime(2026, 6, 1)
+    old = now - timedelta(days=100)
+    with Session() as db:
+        db.add_all(
+            [
+                TaskEventModel(
+                    task_id=id,
+                    owner_id=1,
+                    event_type="status_changed",
+                    to_value="completed",
+                    occurred_at=old,
+                )
+                for id in range(5)
+            ]
+            + [
+                TaskEventModel(
+                    task_id=9, owner_id=1, event_type="deleted", occurred_at=old
+                ),
+                TaskEventModel(
+                    task_id=9, owner_id=1, event_type="created", occurred_at=now
+                ),
+            ]
+        )
+        db.commit()
+
+    assert compact_task_events(Session, retention_days=90, chunk_size=2, now=now) == 6
+
+    with Session() as db:
+        rollups = {
+            (rollup.day, rollup.event_type, rollup.to_value): rollup.count
+            for rollup in db.query(TaskEventRollupModel)
+        }
+        assert rollups == {
+            (date(2026, 2, 21), "status_changed", "completed"): 5,
+            (date(2026, 2, 21), "deleted", ""): 1,
+        }
+        assert [task_event.event_type for task_event in db.query(TaskEventModel)] == [
+            "created"
+        ]
+
+
+def test_rest_endpoints(Session, make_client):
+    client = make_client(tasks)
+
+    task_id = client.post("/api/tasks/", json={"title": "T", "task_list_id": 1}).json()[
+        "id"
+    ]
+    client.patch(f"/api/tasks/{task_id}/status", json={"status": "completed"})
+
+    history = client.get(f"/api/tasks/{task_id}/events").json()
+    assert [item["event_type"] for item in history] == ["created", "status_changed"]
+    assert history[1]["to_value"] == "completed"
+
+    since = history[0]["occurred_at"]
+    recent = client.get("/api/tasks/events", params={"since": since}).json()
+    assert [item["event_type"] for item in recent["events"]] == ["status_changed"]
+    assert client.get(f"/api/tasks/{task_id}/events").status_code == 200
+    assert client.get("/api/tasks/events", params={"after": "x"}).status_code == 400
+
+
+def test_event_pages_resume_within_one_timestamp(Session, make_client):
+    client = make_client(tasks)
+
+    # One flush: every event gets the same occurred_at
+    with Session() as db:
+        db.add_all(
+            [TaskModel(title=f"T{number}", task_list_id=1) for number in range(5)]
+        )
+        db.commit()
+
+    seen, params = [], {"limit": 2}
+    while True:
+        page = client.get("/api/tasks/events", params=params).json()
+        seen.extend(item["id"] for item in page["events"])
+        if not page["has_more"]:
+            break
+        params["after"] = page["cursor"]
+    assert len(seen) == 5
+    assert seen == sorted(set(seen))
+
+    # Caught up: the cursor stays put until new events arrive
+    params["after"] = page["cursor"]
+    tail = client.get("/api/tasks/events", params=params).json()
+    assert tail["events"] == [] and tail["cursor"] == page["cursor"]
@@ -0,0 +1,102 @@
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities import TaskStatus
+from src.infrastructure.database import Base, TaskListModel, TaskModel, UserModel
+from src.presentation.conditional import ConditionalGet
+from src.presentation.routers import tasks
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    user = UserModel(email="owner@example.com", full_name="Owner", hashed_password="x")
+    session.add(user)
+    session.flush()
+    task_list = TaskListModel(name="List", owner_id=user.id)
+    session.add(task_list)
+    session.flush()
+    session.add(
+        TaskModel(
+            title="Overdue",
+            description="Long text",
+            task_list_id=task_list.id,
+            assigned_to=user.id,
+            due_date=datetime(2000, 1, 1),
+        )
+    )
+    session.commit()
+    session.statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: session.statements.append(statement),
+    )
+    yield session
+    session.close()
+
+
+def _get(db, fields):
+    db.expunge_all()
+    return tasks.get_tasks(
+        task_list_id=None,
+        status=None,
+        priority=None,
+        db=db,
+        user=MagicMock(id=1),
+        fields=fields,
+        stream=None,
+        conditional=MagicMock(spec=ConditionalGet),
+        overdue=None,
+        sort=None,
+        ids=None,
+    )
+
+
+def test_fields_limit_columns_and_skip_join(db):
+    response = _get(db, "title,status,due_date")
+
+    assert json.loads(response.body) == [
+        {
+            "id": 1,
+            "title": "Overdue",
+            "status": TaskStatus.PENDING.value,
+            "due_date": "2000-01-01T00:00:00",
+        }
+    ]
+    statement = db.statements[-1]
+    assert "description" not in statement
+    assert "users" not in statement
+
+
+def test_assignee_name_keeps_the_join(db):
+    response = _get(db, "assignee_name,is_overdue")
+
+    assert json.loads(response.body) == [
+        {"id": 1, "is_overdue": True, "assignee_name": "Owner"}
+    ]
+    assert "users" in db.statements[-1]
+    assert "description" not in db.statements[-1]
+
+
+def test_without_fields_returns_full_dtos(db):
+    result = _get(db, None)
+
+    assert result[0].description == "Long text"
+    assert result[0].assignee_name == "Owner"
+
+
+def test_unknown_fields_are_rejected(db):
+    with pytest.raises(HTTPException) as exc:
+        _get(db, "title,secret")
+
+    assert exc.value.status_code == 400
+    assert "secret" in exc.value.detail
@@ -5,6 +5,7 @@ import pytest
 from fastapi import HTTPException
 
 from src.application.dto import TaskListCreateDTO, TaskListUpdateDTO
+from src.presentation.conditional import ConditionalGet
 from src.presentation.routers import task_lists
 
 
@@ -58,7 +59,9 @@ def test_get_task_lists(mock_db, mock_user):
     mock_db.query.return_value.outerjoin.return_value.filter.return_value.group_by.return_value.all.return_value = [
         (mock_task_list, 5, 3)
     ]
-    result = task_lists.get_task_lists(mock_db, mock_user)
+    result = task_lists.get_task_lists(
+        mock_db, mock_user, conditional=MagicMock(spec=ConditionalGet), ids=None
+    )
     assert result[0].task_count == 5
 
 
@@ -77,7 +80,9 @@ def test_get_task_list_success(mock_db, mock_user):
         5,
         2,
     )
-    result = task_lists.get_task_list(1, mock_db, mock_user)
+    result = task_lists.get_task_list(
+        1, mock_db, mock_user, conditional=MagicMock(spec=ConditionalGet)
+    )
     assert result.id == 1
 
 
@@ -86,7 +91,9 @@ def test_get_task_list_not_found(mock_db, mock_user):
         None
     )
     with pytest.raises(HTTPException):
-        task_lists.get_task_list(1, mock_db, mock_user)
+        task_lists.get_task_list(
+            1, mock_db, mock_user, conditional=MagicMock(spec=ConditionalGet)
+        )
 
 
 def test_delete_task_list_success(mock_db, mock_user):
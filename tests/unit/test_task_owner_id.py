@@ -0,0 +1,126 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, insert, text
+
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.presentation.routers import tasks
+
+MIGRATION = (
+    Path(__file__).parents[2] / "alembic" / "versions" / "20261019_003_task_owner_id.py"
+)
+
+
+@pytest.fixture
+def Session(sqlite_sessionmaker):
+    with sqlite_sessionmaker() as db:
+        db.add_all(
+            [
+                UserModel(id=1, email="one@example.com", hashed_password="x"),
+                UserModel(id=2, email="two@example.com", hashed_password="x"),
+            ]
+        )
+        db.flush()
+        db.add_all(
+            [
+                TaskListModel(id=1, name="One's", owner_id=1),
+                TaskListModel(id=2, name="Two's", owner_id=2),
+            ]
+        )
+        db.flush()
+        db.add(TaskModel(id=1, title="Task", task_list_id=1))
+        db.commit()
+    return sqlite_sessionmaker
+
+
+def test_inserts_take_the_list_owner(Session):
+    with Session() as db:
+        db.execute(insert(TaskModel).values(id=2, title="Core", task_list_id=2))
+        db.commit()
+
+        assert db.get(TaskModel, 1).owner_id == 1
+        assert db.get(TaskModel, 2).owner_id == 2
+
+
+def test_moves_and_transfers_update_the_owner(Session):
+    with Session() as db:
+        task = db.get(TaskModel, 1)
+        task.task_list_id = 2
+        db.commit()
+        assert task.owner_id == 2
+
+        db.get(TaskListModel, 2).owner_id = 1
+        db.commit()
+        assert task.owner_id == 1
+
+
+def test_listing_and_stats_do_not_join_task_lists(Session, make_client):
+    client = make_client(tasks)
+    statements = []
+    with Session() as db:
+        event.listen(
+            db.get_bind(),
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+
+    assert [task["id"] for task in client.get("/api/tasks/").json()] == [1]
+    assert client.get("/api/tasks/1").status_code == 200
+    assert client.delete("/api/tasks/1").status_code == 200
+
+    task_queries = [sql for sql in statements if "FROM tasks" in sql]
+    assert task_queries
+    assert not any("task_lists" in sql for sql in task_queries)
+
+
+def test_migration_backfills_in_chunks(monkeypatch):
+    spec = importlib.util.spec_from_file_location("migration_003", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    monkeypatch.setattr(migration, "BACKFILL_CHUNK", 2)
+    statements = []
+
+    with create_engine("sqlite://").connect() as connection:
+        # The schema as it is between add_column and the NOT NULL change
+        connection.execute(
+            text("CREATE TABLE task_lists (id INTEGER, owner_id INTEGER)")
+        )
+        connection.execute(
+            text(
+                "CREATE TABLE tasks (id INTEGER, task_list_id INTEGER, owner_id INTEGER)"
+            )
+        )
+        connection.execute(text("INSERT INTO task_lists VALUES (1, 10), (2, 20)"))
+        connection.execute(
+            text("INSERT INTO tasks VALUES (1, 1, NULL), (2, 2, NULL), (3, 2, NULL)")
+        )
+        event.listen(
+            connection,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        migration._backfill_owner_ids(connection)
+        owners = connection.execute(text("SELECT id, owner_id FROM tasks")).all()
+
+    assert sorted(owners) == [(1, 10), (2, 20), (3, 20)]
+    assert len([sql for sql in statements if sql.startswith("UPDATE")]) == 2
+
+
+def test_creates_set_the_owner_without_a_lookup(Session, make_client):
+    client = make_client(tasks)
+    statements = []
+    with Session() as db:
+        event.listen(
+            db.get_bind(),
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+
+    response = client.post("/api/tasks/", json={"title": "New", "task_list_id": 1})
+
+    assert response.status_code == 200
+    with Session() as db:
+        assert db.get(TaskModel, response.json()["id"]).owner_id == 1
+    # The column default's per-row lookup of the list owner never ran
+    assert not any(sql.startswith("SELECT task_lists.owner_id") for sql in statements)
@@ -8,6 +8,7 @@ from fastapi import HTTPException
 from src.application.dto import TaskCreateDTO, TaskStatusUpdateDTO, TaskUpdateDTO
 from src.domain.entities import TaskPriority, TaskStatus
 from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.presentation.conditional import ConditionalGet
 from src.presentation.routers import tasks
 
 
@@ -87,7 +88,16 @@ def test_get_tasks(mock_db, mock_user):
     mock_query.all.return_value = [(mock_task, "John")]
     mock_db.query.return_value = mock_query
 
-    result = tasks.get_tasks(db=mock_db, user=mock_user)
+    result = tasks.get_tasks(
+        db=mock_db,
+        user=mock_user,
+        fields=None,
+        stream=None,
+        conditional=MagicMock(spec=ConditionalGet),
+        overdue=None,
+        sort=None,
+        ids=None,
+    )
     assert len(result) == 1
     assert result[0].title == "Task X"
 
@@ -205,9 +215,7 @@ async def test_update_task_status_success(monkeypatch, mock_db, mock_user):
 
 
 def test_update_task_status_not_found(mock_db, mock_user):
-    mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
-        None
-    )
+    mock_db.query.return_value.filter.return_value.first.return_value = None
     status_update = TaskStatusUpdateDTO(status=TaskStatus.COMPLETED)
 
     with pytest.raises(HTTPException):
@@ -217,18 +225,14 @@ def test_update_task_status_not_found(mock_db, mock_user):
 def test_delete_task_success(mock_db, mock_user):
     mock_task = MagicMock(title="Task X")
     mock_task.title = "Task X"
-    mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
-        mock_task
-    )
+    mock_db.query.return_value.filter.return_value.first.return_value = mock_task
 
     result = tasks.delete_task(1, db=mock_db, user=mock_user)
     assert "deleted successfully" in result["message"]
 
 
 def test_delete_task_not_found(mock_db, mock_user):
-    mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
-        None
-    )
+    mock_db.query.return_value.filter.return_value.first.return_value = None
 
     with pytest.raises(HTTPException):
         tasks.delete_task(1, db=mock_db, user=mock_user)
@@ -247,9 +251,7 @@ def test_update_task_success(mock_db, mock_user):
     mock_task.updated_at = datetime.now()
     mock_task.task_list_id = 1
 
-    mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
-        mock_task
-    )
+    mock_db.query.return_value.filter.return_value.first.return_value = mock_task
     mock_db.query.return_value.outerjoin.return_value.filter.return_value.first.return_value = (
         mock_task,
         "John",
@@ -261,9 +263,7 @@ def test_update_task_success(mock_db, mock_user):
 
 
 def test_update_task_not_found(mock_db, mock_user):
-    mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
-        None
-    )
+    mock_db.query.return_value.filter.return_value.first.return_value = None
 
     with pytest.raises(HTTPException):
         tasks.update_task(1, TaskUpdateDTO(title="X"), db=mock_db, user=mock_user)
@@ -6,6 +6,7 @@ import pytest
 from src.application.dto import TaskCreateDTO, TaskStatusUpdateDTO
 from src.domain.entities import TaskPriority, TaskStatus
 from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.presentation.conditional import ConditionalGet
 from src.presentation.routers import tasks
 
 
@@ -94,7 +95,16 @@ def test_get_tasks_simple(mock_db, mock_user, mock_task_model):
         (mock_task_model, "John")
     ]
 
-    result = tasks.get_tasks(db=mock_db, user=mock_user)
+    result = tasks.get_tasks(
+        db=mock_db,
+        user=mock_user,
+        fields=None,
+        stream=None,
+        conditional=MagicMock(spec=ConditionalGet),
+        overdue=None,
+        sort=None,
+        ids=None,
+    )
     assert len(result) == 1
     assert result[0].title == "Test Task"
 
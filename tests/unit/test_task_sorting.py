@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import event
+
+from src.domain.entities import TaskPriority
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.presentation.graphql.resolvers.task_resolvers import TaskQuery
+from src.presentation.graphql.types import SortDirection, TaskConnectionOrder
+from src.presentation.routers import tasks
+
+BASE = datetime(2024, 1, 1)
+PRIORITIES = [
+    TaskPriority.MEDIUM,
+    TaskPriority.CRITICAL,
+    TaskPriority.LOW,
+    TaskPriority.HIGH,
+    TaskPriority.MEDIUM,
+]
+
+
+@pytest.fixture
+def Session(sqlite_sessionmaker):
+    with sqlite_sessionmaker() as db:
+        db.add(UserModel(id=1, email="owner@example.com", hashed_password="x"))
+        db.flush()
+        db.add(TaskListModel(id=1, name="List", owner_id=1))
+        db.flush()
+        for index, priority in enumerate(PRIORITIES, start=1):
+            db.add(
+                TaskModel(
+                    id=index,
+                    title=f"Task {index}",
+                    task_list_id=1,
+                    priority=priority,
+                    created_at=BASE + timedelta(days=index),
+                    due_date=None if index == 2 else BASE + timedelta(days=10 - index),
+                )
+            )
+        db.commit()
+    return sqlite_sessionmaker
+
+
+@pytest.fixture
+def client(Session, make_client):
+    return make_client(tasks)
+
+
+def _ids(response):
+    return [task["id"] for task in response.json()]
+
+
+def test_priority_sorts_by_severity(client):
+    assert _ids(client.get("/api/tasks/?sort=priority")) == [3, 1, 5, 4, 2]
+    assert _ids(client.get("/api/tasks/?sort=priority&direction=desc")) == [
+        2,
+        4,
+        5,
+        1,
+        3,
+    ]
+
+
+def test_due_date_sort_uses_native_null_placement(client):
+    # Undated tasks sort first ascending and last descending, as in MySQL
+    assert _ids(client.get("/api/tasks/?sort=due_date&fields=id")) == [2, 5, 4, 3, 1]
+    assert _ids(client.get("/api/tasks/?sort=due_date&direction=desc")) == [
+        1,
+        3,
+        4,
+        5,
+        2,
+    ]
+    assert client.get("/api/tasks/?sort=title").status_code == 422
+
+
+@patch("src.presentation.graphql.resolvers.task_resolvers.get_selected_fields")
+@patch("src.presentation.graphql.resolvers.task_resolvers.require_auth")
+@patch("src.presentation.graphql.resolvers.task_resolvers.get_db")
+def test_connection_pages_by_priority(
+    mock_get_db, mock_require_auth, mock_selected, Session
+):
+    mock_require_auth.return_value = MagicMock(id=1)
+    mock_selected.side_effect = lambda info, *path: {"id"} if path else {"edges"}
+    db = Session()
+    db.close = lambda: None
+    mock_get_db.return_value = db
+    statements = []
+    event.listen(
+        db.get_bind(), "before_cursor_execute", lambda *args: statements.append(1)
+    )
+
+    ids, after = [], None
+    while True:
+        connection = TaskQuery().tasks_connection(
+            info=MagicMock(),
+            first=2,
+            after=after,
+            order_by=TaskConnectionOrder.PRIORITY,
+            direction=SortDirection.DESC,
+        )
+        ids.extend(edge.node.id for edge in connection.edges)
+        if not connection.page_info.has_next_page:
+            break
+        after = connection.page_info.end_cursor
+
+    assert ids == [2, 4, 5, 1, 3]
+    # One query per page: the rank used by the cursor is loaded with the rows
+    assert len(statements) == 3
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.presentation.responses import _encode_chunks
+from src.presentation.routers import tasks
+
+
+@pytest.fixture
+def client(sqlite_sessionmaker, make_client):
+    db = sqlite_sessionmaker()
+    user = UserModel(email="owner@example.com", full_name="Owner", hashed_password="x")
+    db.add(user)
+    db.flush()
+    task_list = TaskListModel(name="List", owner_id=user.id)
+    db.add(task_list)
+    db.flush()
+    db.add_all(
+        TaskModel(title=f"Task {index}", task_list_id=task_list.id)
+        for index in range(5)
+    )
+    db.commit()
+    db.close()
+
+    return make_client(tasks)
+
+
+def test_encode_chunks_groups_rows():
+    chunks = list(_encode_chunks(({"n": n} for n in range(5)), "json", 2))
+
+    assert chunks[0] == b"["
+    assert chunks[-1] == b"]"
+    assert len(chunks) == 5
+    assert json.loads(b"".join(chunks)) == [{"n": n} for n in range(5)]
+
+
+def test_encode_chunks_empty_array():
+    assert b"".join(_encode_chunks(iter(()), "json", 2)) == b"[]"
+    assert b"".join(_encode_chunks(iter(()), "ndjson", 2)) == b""
+
+
+def test_stream_json_matches_regular_listing(client):
+    regular = client.get("/api/tasks/").json()
+    streamed = client.get("/api/tasks/", params={"stream": "json"})
+
+    assert streamed.headers["content-type"] == "application/json"
+    assert streamed.json() == regular
+
+
+def test_stream_ndjson_with_fields(client):
+    response = client.get("/api/tasks/", params={"stream": "ndjson", "fields": "title"})
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0] == {"id": 1, "title": "Task 0"}
+    assert len(lines) == 5
+
+
+def test_invalid_stream_format_is_rejected(client):
+    assert client.get("/api/tasks/", params={"stream": "xml"}).status_code == 422
@@ -0,0 +1,105 @@
+import strawberry
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.metrics import MetricsRegistry
+from src.infrastructure.query_stats import install_query_listeners, track_queries
+from src.presentation.graphql.batching import BatchGraphQLRouter
+from src.presentation.graphql.tracing import (
+    QueryTracingExtension,
+    resolver_duration,
+    sql_statements,
+)
+
+engine = create_engine("sqlite://")
+install_query_listeners(engine)
+
+
+@strawberry.type
+class Item:
+    name: str
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def items(self) -> list[Item]:
+        with engine.connect() as conn:
+            rows = conn.execute(text("SELECT 'a' UNION ALL SELECT 'b'")).all()
+        return [Item(name=row[0]) for row in rows]
+
+    @strawberry.field
+    async def later(self) -> str:
+        return "done"
+
+
+def _client():
+    app = FastAPI()
+    schema = strawberry.Schema(query=Query, extensions=[QueryTracingExtension])
+    app.include_router(BatchGraphQLRouter(schema), prefix="/graphql")
+    return TestClient(app)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1))
+    histogram.observe(0.05, {"route": "a"})
+    histogram.observe(0.5, {"route": "a"})
+    histogram.observe(5, {"route": "a"})
+
+    output = registry.render()
+
+    assert "# TYPE latency_seconds histogram" in output
+    assert 'latency_seconds_bucket{route="a",le="0.1"} 1' in output
+    assert 'latency_seconds_bucket{route="a",le="1"} 2' in output
+    assert 'latency_seconds_bucket{route="a",le="+Inf"} 3' in output
+    assert 'latency_seconds_count{route="a"} 3' in output
+
+
+def test_counter_accumulates_per_label_set():
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits")
+    counter.inc(labels={"tier": "local"})
+    counter.inc(2, labels={"tier": "local"})
+
+    assert registry.counter("hits_total", "Hits") is counter
+    assert counter.value({"tier": "local"}) == 3
+    assert 'hits_total{tier="local"} 3' in registry.render()
+
+
+def test_track_queries_counts_statements_only_inside_the_block():
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+    assert stats.statements == 2
+
+
+def test_trace_header_adds_tracing_extension():
+    response = _client().post(
+        "/graphql",
+        json={"query": "{ items { name } later }"},
+        headers={"X-GraphQL-Trace": "1"},
+    )
+
+    tracing = response.json()["extensions"]["tracing"]
+    assert tracing["operation"] == "query"
+    assert tracing["sql"]["statements"] == 1
+    fields = {entry["field"]: entry for entry in tracing["resolvers"]}
+    assert fields["Query.items"]["calls"] == 1
+    assert fields["Item.name"]["calls"] == 2
+    assert "Query.later" in fields
+
+
+def test_tracing_is_hidden_without_header_but_still_recorded():
+    before = resolver_duration.count({"field": "Query.items"})
+    statements_before = sql_statements.count({"operation": "query"})
+
+    response = _client().post("/graphql", json={"query": "{ items { name } }"})
+
+    assert "extensions" not in response.json()
+    assert resolver_duration.count({"field": "Query.items"}) == before + 1
+    assert sql_statements.count({"operation": "query"}) == statements_before + 1
@@ -0,0 +1,162 @@
+import json
+
+import pytest
+from sqlalchemy import event
+
+from src.application.services import TaskService
+from src.domain.exceptions import TaskAssignmentError
+from src.infrastructure import user_directory as directory_module
+from src.infrastructure.database import TaskListModel, TaskModel, UserModel
+from src.infrastructure.user_directory import UserDirectory, with_assignee_names
+from src.presentation.routers import tasks
+
+
+@pytest.fixture
+def Session(sqlite_sessionmaker):
+    with sqlite_sessionmaker() as db:
+        db.add_all(
+            [
+                UserModel(
+                    id=1, email="ann@example.com", full_name="Ann", hashed_password="x"
+                ),
+                UserModel(
+                    id=2, email="bob@example.com", full_name="Bob", hashed_password="x"
+                ),
+                UserModel(
+                    id=3,
+                    email="old@example.com",
+                    full_name="Old",
+                    hashed_password="x",
+                    is_active=False,
+                ),
+            ]
+        )
+        db.flush()
+        db.add(TaskListModel(id=1, name="List", owner_id=1))
+        db.flush()
+        db.add_all(
+            [
+                TaskModel(id=1, title="Mine", task_list_id=1, assigned_to=1),
+                TaskModel(id=2, title="Bob's", task_list_id=1, assigned_to=2),
+                TaskModel(id=3, title="Nobody's", task_list_id=1),
+            ]
+        )
+        db.commit()
+    return sqlite_sessionmaker
+
+
+@pytest.fixture
+def directory(monkeypatch):
+    directory = UserDirectory(max_entries=10, ttl=60)
+    monkeypatch.setattr(directory_module, "user_directory", directory)
+    monkeypatch.setattr(tasks, "user_directory", directory)
+    return directory
+
+
+def _statements(db):
+    statements = []
+    event.listen(
+        db.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    return statements
+
+
+def test_misses_are_loaded_in_one_query(Session, directory):
+    with Session() as db:
+        statements = _statements(db)
+        users = directory.get_many(db, [1, 2, 99, None])
+        directory.get_many(db, [1, 2])
+
+    assert {user_id: user.full_name for user_id, user in users.items()} == {
+        1: "Ann",
+        2: "Bob",
+    }
+    assert len(statements) == 1
+
+
+def test_names_are_attached_in_chunks(Session, directory):
+    with Session() as db:
+        rows = db.query(TaskModel).order_by(TaskModel.id).all()
+        statements = _statements(db)
+        names = [name for _, name in with_assignee_names(db, rows, chunk_size=1)]
+
+    assert names == ["Ann", "Bob", None]
+    # One query per chunk with an assignee; the unassigned task needs none
+    assert len(statements) == 2
+
+
+def test_committed_user_updates_evict(Session, directory):
+    with Session() as db:
+        directory.warm(db)
+        db.get(UserModel, 2).full_name = "Robert"
+        db.flush()
+        db.rollback()
+        assert directory.get(db, 2).full_name == "Bob"
+
+        db.get(UserModel, 2).full_name = "Robert"
+        db.commit()
+        assert directory.get(db, 2).full_name == "Robert"
+
+
+def test_assignment_checks_use_the_directory(Session, directory, monkeypatch):
+    monkeypatch.setattr(directory_module, "USER_DIRECTORY_ENABLED", True)
+    with Session() as db:
+        assert directory.get(db, 3, verify=True).is_active is False
+        statements = _statements(db)
+        with pytest.raises(TaskAssignmentError):
+            TaskService(db).assign_task(3, 3, 1)
+
+    assert not any("FROM users" in statement for statement in statements)
+
+
+def test_assignment_checks_see_changes_from_other_workers(
+    Session, directory, monkeypatch
+):
+    monkeypatch.setattr(directory_module, "USER_DIRECTORY_ENABLED", True)
+    with Session() as db:
+        assert directory.get(db, 2, verify=True).is_active
+        stale = directory.entries.get("2")
+        db.get(UserModel, 2).is_active = False
+        db.commit()
+        # Another worker still holds the entry; only the change version moved
+        directory.entries.set("2", stale)
+
+        assert directory.get(db, 2).is_active
+        with pytest.raises(TaskAssignmentError):
+            TaskService(db).assign_task(3, 2, 1)
+
+
+def test_listing_skips_the_users_join(Session, directory, monkeypatch, make_client):
+    monkeypatch.setattr(tasks, "USER_DIRECTORY_ENABLED", True)
+    monkeypatch.setattr(tasks, "FAST_JSON_RESPONSES", False)
+
+    client = make_client(tasks)
+
+    listing = client.get("/api/tasks/").json()
+    assert {task["title"]: task["assignee_name"] for task in listing} == {
+        "Mine": "Ann",
+        "Bob's": "Bob",
+        "Nobody's": None,
+    }
+    assert client.get("/api/tasks/2").json()["assignee_name"] == "Bob"
+    assert client.get("/api/tasks/?fields=id,assignee_name").json()[0] == {
+        "id": 1,
+        "assignee_name": "Ann",
+    }
+
+
+def test_streamed_listing_keeps_the_users_join(
+    Session, directory, monkeypatch, make_client
+):
+    monkeypatch.setattr(tasks, "USER_DIRECTORY_ENABLED", True)
+
+    client = make_client(tasks)
+
+    streamed = client.get("/api/tasks/?stream=ndjson").text.splitlines()
+    assert {
+        task["title"]: task["assignee_name"] for task in map(json.loads, streamed)
+    } == {"Mine": "Ann", "Bob's": "Bob", "Nobody's": None}
+    # Names come from the join, not directory queries on the cursor's session
+    assert directory.entries.get("2") is None